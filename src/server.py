@@ -346,10 +346,9 @@ async def main() -> None:
             # LAYER 1 SECURITY: Execution timeout (automatic, cannot be bypassed)
             tool_timeout = getattr(tool, 'execution_timeout', shared_security_config.default_timeout)
             
-            async with security.execution_timeout(tool_timeout, name):
-                execution_start = time.time()
-                result = await tool.invoke(params)
-                execution_time = time.time() - execution_start
+            execution_start = time.time()
+            result = await security.run_with_timeout(tool.invoke(params), tool_timeout, name)
+            execution_time = time.time() - execution_start
 
             # LAYER 1 SECURITY: Response validation (automatic, cannot be bypassed)
             safe_result = await security.validate_response(result, name)
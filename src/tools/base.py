@@ -84,7 +84,7 @@ from mcp_template.utils.security import validate_path, sanitize_input
 
 async def invoke(self, params: MyParams) -> str:
     # Validate file paths to prevent traversal attacks
-    safe_path = await validate_path(params.file_path)
+    safe_path = validate_path(params.file_path)
 
     # Sanitize user input
     clean_input = sanitize_input(params.user_text)
@@ -2,6 +2,7 @@
 
 import os
 from abc import ABC
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, TypeVar
 
@@ -12,6 +13,18 @@ from utils.data_path import get_solve_it_data_path, validate_solve_it_data_path
 P = TypeVar("P", bound=ToolParams)
 
 
+@lru_cache(maxsize=4)
+def _legacy_knowledge_base(kb_class: Any, base_path: str) -> Any:
+    """
+    Build (once per data path) the knowledge base used by legacy-mode tools.
+    
+    Keyed on the KnowledgeBase class as well as the path, so a reloaded or
+    patched solve_it_library never hands back an instance of the old class.
+    Call _legacy_knowledge_base.cache_clear() to force a fresh load.
+    """
+    return kb_class(base_path=base_path, mapping_file="solve-it.json")
+
+
 class SolveItBaseTool(BaseTool[P], ABC):
     """
     Base class for SOLVE-IT MCP tools.
@@ -46,25 +59,47 @@ class SolveItBaseTool(BaseTool[P], ABC):
         super().__init__()
         
         # Initialize knowledge base and data path attributes
-        self.knowledge_base = None
+        self._knowledge_base = None
+        self._kb_pending = False
         self.data_path = None
         
         # Resolve data path for backward compatibility and logging
         if custom_data_path or init_kb:
             self._resolve_data_path(custom_data_path)
         
-        # Legacy mode: Initialize individual knowledge base (deprecated)
+        # Legacy mode: Initialize individual knowledge base (deprecated),
+        # deferred until the knowledge base is first used
         if init_kb:
             self.logger.warning(
                 f"Tool {self.name} using legacy individual knowledge base initialization. "
                 "This is deprecated and causes performance issues. Use shared architecture instead."
             )
-            self._init_knowledge_base()
-            self.logger.info(f"SOLVE-IT tool {self.name} initialized with data path: {self.data_path}")
+            self._kb_pending = True
         else:
             # Modern mode: Wait for shared knowledge base to be set by server
             self.logger.debug(f"SOLVE-IT tool {self.name} created, awaiting shared knowledge base")
     
+    @property
+    def knowledge_base(self) -> Any:
+        """
+        The knowledge base used by this tool.
+        
+        In legacy mode the knowledge base is loaded on first access rather
+        than in __init__, so tools that are constructed but never used don't
+        pay for it. Assigning a knowledge base (as set_shared_knowledge_base()
+        and tests do) cancels the pending load.
+        """
+        if self._kb_pending:
+            self._kb_pending = False
+            self._init_knowledge_base()
+            self.logger.info(f"SOLVE-IT tool {self.name} initialized with data path: {self.data_path}")
+        return self._knowledge_base
+    
+    @knowledge_base.setter
+    def knowledge_base(self, value: Any) -> None:
+        self._kb_pending = False
+        self._knowledge_base = value
+    
     def _resolve_data_path(self, custom_path: Optional[str] = None) -> None:
         """
         Resolve the data path for this tool instance.
@@ -138,10 +173,10 @@ class SolveItBaseTool(BaseTool[P], ABC):
             
             from solve_it_library import KnowledgeBase
             
-            # Initialize knowledge base with solve-it.json as default mapping
-            self.knowledge_base = KnowledgeBase(
-                base_path=str(Path(self.data_path).parent),
-                mapping_file="solve-it.json"
+            # Initialize knowledge base with solve-it.json as default mapping;
+            # tools sharing a data path share one instance
+            self.knowledge_base = _legacy_knowledge_base(
+                KnowledgeBase, str(Path(self.data_path).parent)
             )
             
             self.logger.debug(f"Individual knowledge base initialized for {self.name} (DEPRECATED)")
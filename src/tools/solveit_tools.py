@@ -1,11 +1,18 @@
 """SOLVE-IT MCP Tools - Core tools for accessing the SOLVE-IT knowledge base."""
 
-import json
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from .solveit_base import SolveItBaseTool, ToolParams
+from utils import json_fast
+from utils.knowledge_base_manager import (
+    invalidate_shared_knowledge_base_stats,
+    knowledge_base_generation,
+)
+from utils.security_middleware import TrustedOutput
 
 
 class GetDatabaseDescriptionParams(ToolParams):
@@ -47,7 +54,7 @@ class GetDatabaseDescriptionTool(SolveItBaseTool[GetDatabaseDescriptionParams]):
                 ]
             }
             
-            return json.dumps(description, indent=2)
+            return json_fast.dumps(description, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "database description retrieval")
@@ -69,18 +76,49 @@ class SearchTool(SolveItBaseTool[SearchParams]):
     description = "Searches the knowledge base for techniques, weaknesses, or mitigations matching specified keywords."
     Params = SearchParams
     
+    # Repeated queries are served from a small LRU of serialized results
+    _RESULT_CACHE_TTL = 60.0
+    _RESULT_CACHE_SIZE = 128
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, str]]" = OrderedDict()
+    
     async def invoke(self, params: SearchParams) -> str:
         """Search the knowledge base."""
         try:
-            results = self.knowledge_base.search(
+            knowledge_base = self.knowledge_base
+            key = (
+                id(knowledge_base),
+                knowledge_base_generation(),
+                params.keywords,
+                tuple(sorted(params.item_types or ())),
+            )
+            now = time.monotonic()
+            cached = self._result_cache.get(key)
+            if cached is not None and now - cached[0] < self._RESULT_CACHE_TTL:
+                self._result_cache.move_to_end(key)
+                return cached[1]
+            
+            results = knowledge_base.search(
                 keywords=params.keywords,
                 item_types=params.item_types
             )
             
-            return json.dumps(results, indent=2)
+            result = json_fast.dumps(results, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "search operation")
+        
+        self._result_cache[key] = (now, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return result
+    
+    def clear_result_cache(self) -> None:
+        """Drop all cached search results."""
+        self._result_cache.clear()
 
 
 class GetTechniqueDetailsParams(ToolParams):
@@ -103,7 +141,7 @@ class GetTechniqueDetailsTool(SolveItBaseTool[GetTechniqueDetailsParams]):
             if technique is None:
                 return f"Technique {params.technique_id} not found."
             
-            return json.dumps(technique, indent=2)
+            return json_fast.dumps(technique, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"technique {params.technique_id} retrieval")
@@ -129,7 +167,7 @@ class GetWeaknessDetailsTool(SolveItBaseTool[GetWeaknessDetailsParams]):
             if weakness is None:
                 return f"Weakness {params.weakness_id} not found."
             
-            return json.dumps(weakness, indent=2)
+            return json_fast.dumps(weakness, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"weakness {params.weakness_id} retrieval")
@@ -155,7 +193,7 @@ class GetMitigationDetailsTool(SolveItBaseTool[GetMitigationDetailsParams]):
             if mitigation is None:
                 return f"Mitigation {params.mitigation_id} not found."
             
-            return json.dumps(mitigation, indent=2)
+            return json_fast.dumps(mitigation, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"mitigation {params.mitigation_id} retrieval")
@@ -178,7 +216,7 @@ class GetWeaknessesForTechniqueTool(SolveItBaseTool[GetWeaknessesForTechniquePar
         try:
             weaknesses = self.knowledge_base.get_weaknesses_for_technique(params.technique_id)
             
-            return json.dumps(weaknesses, indent=2)
+            return json_fast.dumps(weaknesses, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"weaknesses for technique {params.technique_id}")
@@ -201,7 +239,7 @@ class GetMitigationsForWeaknessTool(SolveItBaseTool[GetMitigationsForWeaknessPar
         try:
             mitigations = self.knowledge_base.get_mitigations_for_weakness(params.weakness_id)
             
-            return json.dumps(mitigations, indent=2)
+            return json_fast.dumps(mitigations, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"mitigations for weakness {params.weakness_id}")
@@ -228,7 +266,7 @@ class GetTechniquesForWeaknessTool(SolveItBaseTool[GetTechniquesForWeaknessParam
         try:
             techniques = self.knowledge_base.get_techniques_for_weakness(params.weakness_id)
             
-            return json.dumps(techniques, indent=2)
+            return json_fast.dumps(techniques, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"techniques for weakness {params.weakness_id}")
@@ -251,7 +289,7 @@ class GetWeaknessesForMitigationTool(SolveItBaseTool[GetWeaknessesForMitigationP
         try:
             weaknesses = self.knowledge_base.get_weaknesses_for_mitigation(params.mitigation_id)
             
-            return json.dumps(weaknesses, indent=2)
+            return json_fast.dumps(weaknesses, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"weaknesses for mitigation {params.mitigation_id}")
@@ -274,7 +312,7 @@ class GetTechniquesForMitigationTool(SolveItBaseTool[GetTechniquesForMitigationP
         try:
             techniques = self.knowledge_base.get_techniques_for_mitigation(params.mitigation_id)
             
-            return json.dumps(techniques, indent=2)
+            return json_fast.dumps(techniques, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"techniques for mitigation {params.mitigation_id}")
@@ -302,7 +340,7 @@ class ListObjectivesTool(SolveItBaseTool[ListObjectivesParams]):
         try:
             objectives = self.knowledge_base.list_objectives()
             
-            return json.dumps(objectives, indent=2)
+            return TrustedOutput(json_fast.dumps(objectives, indent=2))
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "objectives listing")
@@ -325,7 +363,7 @@ class GetTechniquesForObjectiveTool(SolveItBaseTool[GetTechniquesForObjectivePar
         try:
             techniques = self.knowledge_base.get_techniques_for_objective(params.objective_name)
             
-            return json.dumps(techniques, indent=2)
+            return json_fast.dumps(techniques, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"techniques for objective {params.objective_name}")
@@ -349,7 +387,7 @@ class ListAvailableMappingsTool(SolveItBaseTool[ListAvailableMappingsParams]):
         try:
             mappings = self.knowledge_base.list_available_mappings()
             
-            return json.dumps(mappings, indent=2)
+            return TrustedOutput(json_fast.dumps(mappings, indent=2))
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "available mappings listing")
@@ -372,6 +410,9 @@ class LoadObjectiveMappingTool(SolveItBaseTool[LoadObjectiveMappingParams]):
         try:
             success = self.knowledge_base.load_objective_mapping(params.filename)
             
+            # Objective counts and current mapping are part of the cached stats
+            invalidate_shared_knowledge_base_stats()
+            
             if success:
                 result = {
                     "success": True,
@@ -385,7 +426,7 @@ class LoadObjectiveMappingTool(SolveItBaseTool[LoadObjectiveMappingParams]):
                     "current_mapping": self.knowledge_base.current_mapping_name
                 }
             
-            return json.dumps(result, indent=2)
+            return json_fast.dumps(result, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, f"loading mapping {params.filename}")
@@ -413,7 +454,7 @@ class GetAllTechniquesWithNameAndIdTool(SolveItBaseTool[GetAllTechniquesWithName
         try:
             techniques = self.knowledge_base.get_all_techniques_with_name_and_id()
             
-            return json.dumps(techniques, indent=2)
+            return json_fast.dumps(techniques, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all techniques with name and ID")
@@ -437,7 +478,7 @@ class GetAllWeaknessesWithNameAndIdTool(SolveItBaseTool[GetAllWeaknessesWithName
         try:
             weaknesses = self.knowledge_base.get_all_weaknesses_with_name_and_id()
             
-            return json.dumps(weaknesses, indent=2)
+            return json_fast.dumps(weaknesses, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all weaknesses with name and ID")
@@ -461,7 +502,7 @@ class GetAllMitigationsWithNameAndIdTool(SolveItBaseTool[GetAllMitigationsWithNa
         try:
             mitigations = self.knowledge_base.get_all_mitigations_with_name_and_id()
             
-            return json.dumps(mitigations, indent=2)
+            return json_fast.dumps(mitigations, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all mitigations with name and ID")
@@ -489,7 +530,7 @@ class GetAllTechniquesWithFullDetailTool(SolveItBaseTool[GetAllTechniquesWithFul
         try:
             techniques = self.knowledge_base.get_all_techniques_with_full_detail()
             
-            return json.dumps(techniques, indent=2)
+            return json_fast.dumps(techniques, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all techniques with full detail")
@@ -513,7 +554,7 @@ class GetAllWeaknessesWithFullDetailTool(SolveItBaseTool[GetAllWeaknessesWithFul
         try:
             weaknesses = self.knowledge_base.get_all_weaknesses_with_full_detail()
             
-            return json.dumps(weaknesses, indent=2)
+            return json_fast.dumps(weaknesses, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all weaknesses with full detail")
@@ -537,7 +578,7 @@ class GetAllMitigationsWithFullDetailTool(SolveItBaseTool[GetAllMitigationsWithF
         try:
             mitigations = self.knowledge_base.get_all_mitigations_with_full_detail()
             
-            return json.dumps(mitigations, indent=2)
+            return json_fast.dumps(mitigations, indent=2)
             
         except Exception as e:
             return self.handle_knowledge_base_error(e, "all mitigations with full detail")
@@ -2,7 +2,14 @@
 
 from .errors import ToolError
 from .logging import get_logger
-from .security import RateLimiter, sanitize_error, sanitize_input, validate_path
+from .security import (
+    MultiKeyRateLimiter,
+    RateLimiter,
+    sanitize_error,
+    sanitize_input,
+    validate_path,
+    validate_path_async,
+)
 
 __all__ = [
     "ToolError",
@@ -10,5 +17,7 @@ __all__ = [
     "sanitize_error",
     "sanitize_input",
     "validate_path",
+    "validate_path_async",
     "RateLimiter",
+    "MultiKeyRateLimiter",
 ]
@@ -1,20 +1,137 @@
 """Data path configuration utilities for SOLVE-IT MCP Server."""
 
+import hashlib
+import json
 import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Resolved auto-detected data paths are persisted so that restarts of a
+# stable deployment can skip the discovery ladder entirely. The directory is
+# worked out on first use (see _path_cache_file()) unless set here.
+_PATH_CACHE_DIR: Optional[Path] = None
 
-def get_solve_it_data_path(custom_path: Optional[str] = None) -> str:
+# Recent validate_solve_it_data_path() results keyed by absolute path, as
+# (monotonic timestamp, result); entries expire after _VALIDATE_CACHE_TTL
+_VALIDATE_CACHE_TTL = 5.0
+_validate_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def _path_cache_file() -> Path:
+    """
+    Get the cache file for the current process location.
+    
+    The cache entry is keyed by the working directory and the location of this
+    module, so different checkouts or launch directories never share an entry.
+    
+    Returns:
+        Path: Location of the cache file for this configuration
+        
+    Raises:
+        RuntimeError: If XDG_CACHE_HOME is unset and the home directory
+            cannot be determined
+    """
+    cache_dir = _PATH_CACHE_DIR
+    if cache_dir is None:
+        cache_dir = Path(
+            os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        ) / "solve-it-mcp"
+    key = hashlib.sha256(f"{os.getcwd()}|{__file__}".encode()).hexdigest()[:16]
+    return cache_dir / key
+
+
+def _read_cached_data_path() -> Optional[str]:
+    """
+    Read a previously resolved data path from the on-disk cache.
+    
+    The entry is only trusted if the cached directory still has the same mtime
+    and still passes validation; otherwise it is treated as a miss.
+    
+    Returns:
+        Optional[str]: Cached data path, or None on a cache miss
+    """
+    if os.environ.get("SOLVE_IT_DISABLE_PATH_CACHE"):
+        return None
+    try:
+        entry = json.loads(_path_cache_file().read_text())
+        cached_path = entry["path"]
+        if os.stat(cached_path).st_mtime != entry["mtime"]:
+            return None
+    except (OSError, RuntimeError, ValueError, KeyError, TypeError):
+        return None
+    
+    if not validate_solve_it_data_path(cached_path):
+        return None
+    
+    logger.debug("Using cached SOLVE-IT data path: %s", cached_path)
+    return cached_path
+
+
+def _write_cached_data_path(data_path: str) -> None:
+    """
+    Persist a resolved data path to the on-disk cache.
+    
+    The entry is written to a temporary file and renamed into place so that
+    concurrent server processes never observe a partially written cache file.
+    Failures are logged and otherwise ignored since the cache is best-effort.
+    
+    Args:
+        data_path: Resolved SOLVE-IT data directory
+    """
+    if os.environ.get("SOLVE_IT_DISABLE_PATH_CACHE"):
+        return
+    try:
+        cache_file = _path_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps({
+            "path": data_path,
+            "mtime": os.stat(data_path).st_mtime,
+        }))
+        os.replace(tmp_file, cache_file)
+    except (OSError, RuntimeError) as e:
+        logger.debug("Could not write SOLVE-IT data path cache: %s", e)
+
+
+def _probe_solve_it_data(parent: str) -> Optional[str]:
+    """
+    Look for solve-it-main/data under parent using directory scans.
+    
+    os.scandir returns DirEntry objects whose is_dir() result comes from
+    the readdir call itself, so each level costs one enumeration instead
+    of separate exists/is_dir stat calls.
+    
+    Args:
+        parent: Directory expected to contain solve-it-main
+        
+    Returns:
+        Optional[str]: Path to the data directory, or None if absent
+    """
+    try:
+        with os.scandir(parent) as it:
+            solve_it_entry = next((e for e in it if e.name == "solve-it-main"), None)
+        if solve_it_entry is None or not solve_it_entry.is_dir():
+            return None
+        with os.scandir(solve_it_entry.path) as it:
+            data_entry = next((e for e in it if e.name == "data"), None)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return None
+    if data_entry is None or not data_entry.is_dir():
+        return None
+    return data_entry.path
+
+
+def get_solve_it_data_path(custom_path: Optional[Union[str, os.PathLike]] = None) -> str:
     """
     Get the path to the SOLVE-IT data directory.
     
     Args:
-        custom_path: Optional custom path to SOLVE-IT data directory
+        custom_path: Optional custom path to SOLVE-IT data directory (str or path-like)
         
     Returns:
         str: Path to SOLVE-IT data directory
@@ -27,6 +144,10 @@ def get_solve_it_data_path(custom_path: Optional[str] = None) -> str:
     2. SOLVE_IT_DATA_PATH environment variable
     3. Adjacent solve-it-main directory (../solve-it-main)
     4. Current directory solve-it-main subdirectory (./solve-it-main)
+    
+    Paths found by auto-detection (3 and 4) are cached on disk under
+    ~/.cache/solve-it-mcp so later restarts skip discovery. Set
+    SOLVE_IT_DISABLE_PATH_CACHE to bypass the cache.
     """
     
     # Try custom path first
@@ -58,24 +179,28 @@ def get_solve_it_data_path(custom_path: Optional[str] = None) -> str:
         else:
             raise FileNotFoundError(f"Environment path {env_path} does not exist")
     
+    # Try the path cached by a previous auto-detection
+    cached_path = _read_cached_data_path()
+    if cached_path:
+        return cached_path
+    
     # Try adjacent solve-it-main directory (default expected location)
     current_dir = Path(__file__).parent.parent.parent.parent  # Go up from utils to project root
     adjacent_path = current_dir / "../solve-it-main"
     
-    if adjacent_path.exists():
-        resolved_path = adjacent_path.resolve()
-        data_path = resolved_path / "data"
-        if data_path.exists() and data_path.is_dir():
-            logger.info(f"Found SOLVE-IT data at default location: {data_path}")
-            return str(data_path)
+    data_path = _probe_solve_it_data(str((current_dir / "..").resolve()))
+    if data_path:
+        logger.info("Found SOLVE-IT data at default location: %s", data_path)
+        _write_cached_data_path(data_path)
+        return data_path
     
     # Try current directory solve-it-main subdirectory
     current_solve_it = current_dir / "solve-it-main"
-    if current_solve_it.exists():
-        data_path = current_solve_it / "data"
-        if data_path.exists() and data_path.is_dir():
-            logger.info(f"Found SOLVE-IT data in current directory: {data_path}")
-            return str(data_path)
+    data_path = _probe_solve_it_data(str(current_dir))
+    if data_path:
+        logger.info("Found SOLVE-IT data in current directory: %s", data_path)
+        _write_cached_data_path(data_path)
+        return data_path
     
     # If nothing found, provide helpful error message
     raise FileNotFoundError(
@@ -91,33 +216,69 @@ def get_solve_it_data_path(custom_path: Optional[str] = None) -> str:
     )
 
 
-def validate_solve_it_data_path(data_path: str) -> bool:
+def validate_solve_it_data_path(data_path: Union[str, os.PathLike]) -> bool:
     """
     Validate that the provided path contains SOLVE-IT data.
     
+    Results are memoized per absolute path for _VALIDATE_CACHE_TTL seconds,
+    since every tool validates the same data path during startup.
+    
     Args:
-        data_path: Path to validate
+        data_path: Path to validate (str or path-like)
         
     Returns:
         bool: True if path contains valid SOLVE-IT data structure
     """
-    path = Path(data_path)
+    key = os.path.abspath(data_path)
+    now = time.monotonic()
+    cached = _validate_cache.get(key)
+    if cached is not None and now - cached[0] < _VALIDATE_CACHE_TTL:
+        return cached[1]
+    
+    result = _check_solve_it_data_path(Path(key))
+    _validate_cache[key] = (now, result)
+    return result
+
+
+def _check_solve_it_data_path(path: Path) -> bool:
+    """
+    Check the SOLVE-IT data layout under path on disk.
     
-    if not path.exists() or not path.is_dir():
+    The techniques, weaknesses and mitigations directories are required.
+    Objective mapping files (solve-it.json etc.) in the parent directory are
+    optional; a warning is logged when none are found.
+    
+    Args:
+        path: Absolute path to check
+        
+    Returns:
+        bool: True if path contains valid SOLVE-IT data structure
+    """
+    # One directory scan per level answers every existence check; DirEntry
+    # type information comes from readdir itself, without extra stat calls
+    try:
+        with os.scandir(path) as it:
+            entries = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
         return False
     
     # Check for required subdirectories
     required_dirs = ["techniques", "weaknesses", "mitigations"]
     for dir_name in required_dirs:
-        if not (path / dir_name).exists():
+        entry = entries.get(dir_name)
+        if entry is None or not entry.is_dir():
             return False
     
     # Check for objective mapping files
     mapping_files = ["solve-it.json", "carrier.json", "dfrws.json"]
     parent_dir = path.parent
-    has_mapping = any((parent_dir / mapping_file).exists() for mapping_file in mapping_files)
+    try:
+        with os.scandir(parent_dir) as it:
+            has_mapping = any(entry.name in mapping_files for entry in it)
+    except OSError:
+        has_mapping = False
     
     if not has_mapping:
-        logger.warning(f"No objective mapping files found in {parent_dir}")
+        logger.warning("No objective mapping files found in %s", parent_dir)
     
     return True
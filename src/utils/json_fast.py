@@ -0,0 +1,68 @@
+"""Fast JSON encoding and decoding for tool responses.
+
+Uses orjson when it is installed (`pip install solveit-mcp-server[speedups]`)
+and falls back to the standard library json module otherwise. Both paths
+produce valid JSON for the same inputs; with orjson, non-ASCII characters
+are written as UTF-8 rather than \\u escapes.
+
+Usage:
+    ```python
+    from utils.json_fast import dumps, loads
+
+    return dumps(techniques, indent=2)
+    ```
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _ORJSON_INDENT_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize obj to a JSON string.
+
+        Args:
+            obj: Object to serialize.
+            indent: Indentation level; orjson handles None and 2, other
+                values go through the standard library.
+
+        Returns:
+            JSON document as a str.
+        """
+        if indent is None:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        if indent == 2:
+            return orjson.dumps(obj, option=_ORJSON_INDENT_OPTIONS).decode()
+        return json.dumps(obj, indent=indent)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Deserialize a JSON document.
+
+        Raises:
+            json.JSONDecodeError: If data is not valid JSON.
+        """
+        if type(data) is not str and isinstance(data, str):
+            # orjson only accepts exact str, e.g. not TrustedOutput
+            data = str(data)
+        return orjson.loads(data)
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj, indent=indent)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Deserialize a JSON document."""
+        return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
@@ -15,6 +15,11 @@ from .logging import get_logger
 from .data_path import get_solve_it_data_path, validate_solve_it_data_path
 
 
+# Bumped whenever knowledge base contents change (e.g. a different objective
+# mapping is loaded), so caches keyed on it never serve stale results
+_kb_generation = 0
+
+
 class SharedKnowledgeBase:
     """
     Singleton manager for SOLVE-IT knowledge base.
@@ -29,6 +34,7 @@ class SharedKnowledgeBase:
     _instance: Optional['SharedKnowledgeBase'] = None
     _knowledge_base = None
     _data_path: Optional[str] = None
+    _stats: Optional[Dict[str, Any]] = None
     _logger = None
     
     def __new__(cls, data_path: Optional[str] = None):
@@ -161,9 +167,10 @@ class SharedKnowledgeBase:
             self._logger.debug("Knowledge base instance created successfully")
             
         except ImportError as e:
-            self._logger.error(f"Failed to import solve_it_library: {e}")
-            self._logger.error(f"Current sys.path: {sys.path[:3]}...")  # Show first few entries
-            self._logger.error(f"Expected solve_it_library at: {parent_path}/solve_it_library")
+            self._logger.error("Failed to import solve_it_library: %s", e)
+            self._logger.debug(
+                "sys.path[:3]=%r expected=%s/solve_it_library", sys.path[:3], parent_path
+            )
             raise ValueError(f"SOLVE-IT knowledge base import failed: {e}")
         except Exception as e:
             self._logger.error(f"Failed to create knowledge base: {e}")
@@ -201,6 +208,10 @@ class SharedKnowledgeBase:
         """
         Get statistics about the loaded knowledge base.
         
+        The statistics are computed on first use and cached, since the
+        knowledge base does not change after initialization. Code that
+        mutates the knowledge base must call invalidate_stats().
+        
         Returns:
             Dict[str, Any]: Statistics about techniques, weaknesses, mitigations, etc.
         """
@@ -208,19 +219,31 @@ class SharedKnowledgeBase:
             if self._knowledge_base is None:
                 return {"error": "Knowledge base not initialized"}
             
-            return {
-                "techniques": len(self._knowledge_base.list_techniques()),
-                "weaknesses": len(self._knowledge_base.list_weaknesses()),
-                "mitigations": len(self._knowledge_base.list_mitigations()),
-                "objectives": len(self._knowledge_base.list_objectives()),
-                "current_mapping": self._knowledge_base.current_mapping_name,
-                "data_path": self._data_path,
-                "singleton_id": id(self._knowledge_base)  # For debugging shared instance
-            }
+            if self._stats is None:
+                self._stats = {
+                    "techniques": len(self._knowledge_base.list_techniques()),
+                    "weaknesses": len(self._knowledge_base.list_weaknesses()),
+                    "mitigations": len(self._knowledge_base.list_mitigations()),
+                    "objectives": len(self._knowledge_base.list_objectives()),
+                    "current_mapping": self._knowledge_base.current_mapping_name,
+                    "data_path": self._data_path,
+                    "singleton_id": id(self._knowledge_base)  # For debugging shared instance
+                }
+            return dict(self._stats)
         except Exception as e:
             self._logger.error(f"Failed to get knowledge base stats: {e}")
             return {"error": str(e)}
     
+    def invalidate_stats(self) -> None:
+        """
+        Discard cached knowledge base statistics.
+        
+        The next call to get_knowledge_base_stats() recomputes them. This must
+        be called after anything that changes the knowledge base contents, such
+        as loading a different objective mapping.
+        """
+        self._stats = None
+    
     @classmethod
     def reset_singleton(cls) -> None:
         """
@@ -234,6 +257,7 @@ class SharedKnowledgeBase:
         cls._instance = None
         cls._knowledge_base = None
         cls._data_path = None
+        cls._stats = None
         if cls._logger:
             cls._logger.debug("Singleton instance reset")
 
@@ -264,3 +288,27 @@ def get_shared_knowledge_base_stats(data_path: Optional[str] = None) -> Dict[str
     """
     manager = SharedKnowledgeBase(data_path)
     return manager.get_knowledge_base_stats()
+
+
+def knowledge_base_generation() -> int:
+    """
+    Return the current knowledge base generation.
+    
+    Caches derived from knowledge base contents should include this in their
+    key; it changes on every invalidate_shared_knowledge_base_stats() call.
+    """
+    return _kb_generation
+
+
+def invalidate_shared_knowledge_base_stats() -> None:
+    """
+    Convenience function to invalidate cached knowledge base statistics.
+    
+    Also bumps the knowledge base generation, which invalidates per-tool
+    caches in both shared and legacy (per-tool) mode. The shared manager's
+    own stats are only reset if it has been created.
+    """
+    global _kb_generation
+    _kb_generation += 1
+    if SharedKnowledgeBase._instance is not None:
+        SharedKnowledgeBase._instance.invalidate_stats()
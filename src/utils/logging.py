@@ -69,6 +69,18 @@ except Exception as e:
 - **ERROR**: A serious problem occurred; the tool couldn't perform its function
 - **CRITICAL**: A very serious error occurred; the server might be unable to continue
 
+## Deferred Message Formatting
+
+`get_logger()` returns a `LazyLogger`, which accepts a zero-argument callable
+in place of the message. The callable only runs when the level is enabled,
+so expensive f-strings cost nothing on filtered levels:
+
+```python
+logger.debug(lambda: f"expensive {compute()}")
+```
+
+Plain strings and `%`-style arguments work exactly as with `logging.Logger`.
+
 ## Production Considerations
 
 For production deployments, consider:
@@ -105,17 +117,31 @@ file_handler.setLevel(logging.DEBUG)          # File: everything
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import random
 import sys
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import Mapping, Optional
+
+# Background listener that drains the log queue into the real handlers.
+# Only one pipeline is active at a time; configure_logging() replaces it.
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Correlation ID of the request being handled by the current task/thread
+_correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
 
-@dataclass
 class LogConfig:
     """Configuration for logging system.
 
@@ -131,6 +157,18 @@ class LogConfig:
         LOG_SYSLOG_FACILITY: Syslog facility (default: local0)
         LOG_FORMAT: Log format (human/json)
         LOG_CORRELATION_IDS: Enable correlation ID tracking (true/false)
+        LOG_FILE_MAX_BYTES: Rotate the log file at this size (default: 0, never)
+        LOG_FILE_BACKUP_COUNT: Number of rotated log files to keep (default: 5)
+        LOG_BUFFER_RECORDS: Records buffered before writing to the log file
+        LOG_BATCH_WRITES: Write buffered records with a single writev() call
+            (true/false, default: false; disables rotation)
+        LOG_FLUSH_INTERVAL: Maximum seconds a buffered record waits (default: 1.0)
+        LOG_QUEUE_SIZE: Maximum records buffered for the background writer
+        LOG_DROP_ON_FULL: Drop records instead of blocking when the queue is full
+        LOG_DEDUP_WINDOW: Suppress identical records within this many seconds
+            (default: 0, disabled)
+        LOG_DEDUP_MODE: Duplicate tracking: exact, bloom or off (default: exact)
+        LOG_DEBUG_SAMPLE_RATE: Fraction of DEBUG records to keep (default: 1.0)
 
     Examples:
         # Development (default)
@@ -151,13 +189,67 @@ class LogConfig:
         LOG_TO_FILE=true
     """
 
-    level: str = "INFO"
-    console: bool = True
-    file_path: Optional[str] = None
-    syslog: bool = False
-    syslog_facility: str = "local0"
-    format_type: str = "human"  # "human" or "json"
-    correlation_ids: bool = True
+    __slots__ = (
+        "level",
+        "console",
+        "file_path",
+        "syslog",
+        "syslog_facility",
+        "format_type",
+        "correlation_ids",
+        "file_max_bytes",
+        "file_backup_count",
+        "file_buffer_records",
+        "file_flush_interval",
+        "batch_writes",
+        "queue_size",
+        "drop_on_full",
+        "dedup_window",
+        "dedup_mode",
+        "debug_sample_rate",
+    )
+
+    def __init__(
+        self,
+        level: str = "INFO",
+        console: bool = True,
+        file_path: Optional[str] = None,
+        syslog: bool = False,
+        syslog_facility: str = "local0",
+        format_type: str = "human",  # "human" or "json"
+        correlation_ids: bool = True,
+        file_max_bytes: int = 0,
+        file_backup_count: int = 5,
+        file_buffer_records: int = 512,
+        file_flush_interval: float = 1.0,
+        batch_writes: bool = False,
+        queue_size: int = 10000,
+        drop_on_full: bool = False,
+        dedup_window: float = 0.0,
+        dedup_mode: str = "exact",  # "exact", "bloom" or "off"
+        debug_sample_rate: float = 1.0,
+    ) -> None:
+        self.level = level
+        self.console = console
+        self.file_path = file_path
+        self.syslog = syslog
+        self.syslog_facility = syslog_facility
+        self.format_type = format_type
+        self.correlation_ids = correlation_ids
+        self.file_max_bytes = file_max_bytes
+        self.file_backup_count = file_backup_count
+        self.file_buffer_records = file_buffer_records
+        self.file_flush_interval = file_flush_interval
+        self.batch_writes = batch_writes
+        self.queue_size = queue_size
+        self.drop_on_full = drop_on_full
+        self.dedup_window = dedup_window
+        self.dedup_mode = dedup_mode
+        self.debug_sample_rate = debug_sample_rate
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"LogConfig({fields})"
 
     @classmethod
     def from_env(cls) -> "LogConfig":
@@ -177,8 +269,27 @@ class LogConfig:
             syslog_facility=os.getenv("LOG_SYSLOG_FACILITY", "local0"),
             format_type=os.getenv("LOG_FORMAT", "human").lower(),
             correlation_ids=_env_bool("LOG_CORRELATION_IDS", True),
+            file_max_bytes=int(os.getenv("LOG_FILE_MAX_BYTES", "0")),
+            file_backup_count=int(os.getenv("LOG_FILE_BACKUP_COUNT", "5")),
+            file_buffer_records=int(os.getenv("LOG_BUFFER_RECORDS", "512")),
+            file_flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL", "1.0")),
+            batch_writes=_env_bool("LOG_BATCH_WRITES", False),
+            queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            drop_on_full=_env_bool("LOG_DROP_ON_FULL", False),
+            dedup_window=float(os.getenv("LOG_DEDUP_WINDOW", "0")),
+            dedup_mode=os.getenv("LOG_DEDUP_MODE", "exact").lower(),
+            debug_sample_rate=float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0")),
         )
 
+    @staticmethod
+    def clear_env_cache() -> None:
+        """Forget the cached environment configuration used by get_logger().
+
+        Call this after changing LOG_* environment variables (e.g. in tests)
+        so the next fallback logger picks up the new values.
+        """
+        _cached_env_config.cache_clear()
+
 
 def _env_bool(key: str, default: bool = False) -> bool:
     """Convert environment variable to boolean.
@@ -200,12 +311,64 @@ def _env_bool(key: str, default: bool = False) -> bool:
     return default
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_env_config() -> LogConfig:
+    """Return LogConfig.from_env(), parsed once per process.
+
+    get_logger() falls back to the environment configuration for every
+    module logger created before configure_logging() runs, so the parse is
+    shared rather than repeated at each import.
+    """
+    return LogConfig.from_env()
+
+
+# Standard LogRecord attributes that are never emitted as extra fields
+_RESERVED_RECORD_KEYS = frozenset({
+    "name",
+    "msg",
+    "args",
+    "levelname",
+    "levelno",
+    "pathname",
+    "filename",
+    "module",
+    "lineno",
+    "funcName",
+    "created",
+    "msecs",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "processName",
+    "process",
+    "taskName",
+    "getMessage",
+    "message",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+    "correlation_id",
+})
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    _json_dumps = json.dumps
+else:
+    def _json_dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging.
 
     Outputs logs in JSON format suitable for log aggregation systems
     like ELK stack, Splunk, or cloud logging services.
 
+    Records are encoded with orjson when it is installed
+    (`pip install solveit-mcp-server[speedups]`), falling back to the
+    standard library json module otherwise.
+
     Output format:
     {
         "timestamp": "2023-12-07T10:30:45.123Z",
@@ -217,17 +380,47 @@ class StructuredFormatter(logging.Formatter):
     }
     """
 
+    # Consecutive records with the same attribute set before specializing
+    _SPECIALIZE_AFTER = 32
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # (attribute key set, compiled format function) or None
+        self._specialized = None
+        self._candidate_shape: Optional[frozenset] = None
+        self._candidate_hits = 0
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
+        Once the same set of record attributes has been seen
+        `_SPECIALIZE_AFTER` times in a row, a format function with those
+        fields unrolled is compiled and used for matching records. Records
+        with any other shape take the generic path.
+
         Args:
             record: Log record to format.
 
         Returns:
             JSON formatted log string.
         """
+        keys = record.__dict__.keys()
+        specialized = self._specialized
+        if specialized is not None and keys == specialized[0]:
+            return specialized[1](record)
+
+        if keys == self._candidate_shape:
+            self._candidate_hits += 1
+            if self._candidate_hits >= self._SPECIALIZE_AFTER:
+                self._specialized = self._compile_specialized(record)
+                self._candidate_hits = 0
+        else:
+            self._candidate_shape = frozenset(keys)
+            self._candidate_hits = 1
+
+        created = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": f"{created}.{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -239,30 +432,432 @@ class StructuredFormatter(logging.Formatter):
 
         # Add any extra fields from the log record
         for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-                "correlation_id",
-            ):
+            if key not in _RESERVED_RECORD_KEYS:
                 log_entry[key] = value
 
-        return json.dumps(log_entry)
+        return _json_dumps(log_entry)
+
+    @staticmethod
+    def _compile_specialized(record: logging.LogRecord) -> tuple:
+        """Generate a format function for records shaped like `record`.
+
+        Returns:
+            Tuple of (attribute key set, format function).
+        """
+        fields = [
+            '"timestamp": f"{_strftime(_TS_FORMAT, _gmtime(record.created))}'
+            '.{int(record.msecs):03d}Z"',
+            '"level": record.levelname',
+            '"logger": record.name',
+            '"message": record.getMessage()',
+        ]
+        attrs = record.__dict__
+        if "correlation_id" in attrs:
+            fields.append('"correlation_id": attrs["correlation_id"]')
+        for key in attrs:
+            if key not in _RESERVED_RECORD_KEYS:
+                fields.append(f"{key!r}: attrs[{key!r}]")
+
+        source = (
+            "def format(record):\n"
+            "    attrs = record.__dict__\n"
+            "    return _dumps({" + ", ".join(fields) + "})\n"
+        )
+        namespace = {
+            "_dumps": _json_dumps,
+            "_strftime": time.strftime,
+            "_gmtime": time.gmtime,
+            "_TS_FORMAT": "%Y-%m-%dT%H:%M:%S",
+        }
+        exec(compile(source, "<StructuredFormatter>", "exec"), namespace)
+        return frozenset(attrs), namespace["format"]
+
+
+# Formatters hold no per-handler state, so every handler shares these
+_HUMAN_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
+_JSON_FORMATTER = StructuredFormatter()
+
+
+def _pick_formatter(config: LogConfig) -> logging.Formatter:
+    """Return the shared formatter for the configured output format."""
+    return _JSON_FORMATTER if config.format_type == "json" else _HUMAN_FORMATTER
+
+
+def set_correlation_id(correlation_id: Optional[str]) -> Token:
+    """Set the correlation ID attached to records logged in this context.
+
+    The value is stored in a ContextVar, so each asyncio task (and thread)
+    sees its own ID. Pass the returned token to reset_correlation_id() when
+    the request finishes.
+
+    Args:
+        correlation_id: ID to attach, or None to stop attaching one.
+
+    Returns:
+        Token restoring the previous value.
+    """
+    return _correlation_id.set(correlation_id)
+
+
+def reset_correlation_id(token: Token) -> None:
+    """Restore the correlation ID that was current before set_correlation_id()."""
+    _correlation_id.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """Filter that copies the context's correlation ID onto each record.
+
+    An explicit `extra={"correlation_id": ...}` on the logging call takes
+    precedence over the context value.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        correlation_id = _correlation_id.get()
+        if correlation_id is not None and not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Filter that keeps a random fraction of DEBUG records.
+
+    INFO and above always pass; DEBUG records pass with probability
+    `debug_rate`, keeping statistical visibility into hot paths without
+    formatting and writing every record.
+    """
+
+    def __init__(self, debug_rate: float = 0.1) -> None:
+        super().__init__()
+        self._rate = debug_rate
+        self._random = random.random
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self._random() < self._rate
+
+
+class DedupFilter(logging.Filter):
+    """Filter that collapses identical records arriving in quick succession.
+
+    Records are keyed on (level, logger name, rendered message). A repeat of
+    a key within `window_s` seconds of the last emitted copy is dropped; the
+    next copy let through after the window notes how many were suppressed.
+    At most `capacity` keys are tracked, evicting the least recently seen.
+    """
+
+    def __init__(self, window_s: float = 5.0, capacity: int = 1024) -> None:
+        super().__init__()
+        self.window = window_s
+        self.capacity = capacity
+        # key -> [time last emitted, duplicates suppressed since]
+        self._seen: OrderedDict[tuple, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        key = (record.levelno, record.name, message)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None:
+                self._seen.move_to_end(key)
+                if now - entry[0] < self.window:
+                    entry[1] += 1
+                    return False
+                suppressed = entry[1]
+                entry[0], entry[1] = now, 0
+            else:
+                suppressed = 0
+                self._seen[key] = [now, 0]
+                if len(self._seen) > self.capacity:
+                    self._seen.popitem(last=False)
+        if suppressed:
+            record.msg = f"{message} (suppressed {suppressed} duplicates)"
+            record.args = None
+        return True
+
+
+class BloomDedupFilter(logging.Filter):
+    """Approximate duplicate filter backed by two rotating Bloom filters.
+
+    Unlike DedupFilter, memory use is fixed (two bit arrays of `size_bytes`)
+    and no per-message objects are kept, which suits very high-cardinality
+    log streams. The trade-offs:
+
+    - A repeat is suppressed for between `window_s` and 2 * `window_s`
+      seconds after its first copy, as the windows rotate.
+    - False positives occasionally drop a unique record. With the default
+      size and both windows checked, the rate stays under 1% up to ~500k
+      distinct messages per window, but reaches ~5% at ~1M; raise
+      `size_bytes` for streams that busy.
+    - Suppressed copies are not counted.
+    """
+
+    _HASHES = 3
+
+    def __init__(self, window_s: float = 5.0, size_bytes: int = 1 << 20) -> None:
+        super().__init__()
+        self.window = window_s
+        self._size = size_bytes
+        self._nbits = size_bytes * 8
+        self._current = bytearray(size_bytes)
+        self._previous = bytearray(size_bytes)
+        self._rotate_at = time.monotonic() + window_s
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        if now >= self._rotate_at:
+            self._previous = self._current
+            self._current = bytearray(self._size)
+            self._rotate_at = now + self.window
+
+        # Double hashing: derive the bit positions from two 32-bit halves
+        h = hash((record.levelno, record.name, record.getMessage())) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        current, previous, nbits = self._current, self._previous, self._nbits
+        positions = []
+        in_current = in_previous = True
+        for i in range(self._HASHES):
+            bit = (h1 + i * h2) % nbits
+            index, mask = bit >> 3, 1 << (bit & 7)
+            positions.append((index, mask))
+            if not current[index] & mask:
+                in_current = False
+            if not previous[index] & mask:
+                in_previous = False
+        if in_current or in_previous:
+            return False
+        # Only emitted copies are recorded, so a message that keeps repeating
+        # ages out of both windows and is let through again
+        for index, mask in positions:
+            current[index] |= mask
+        return True
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a bounded queue with configurable overflow behaviour.
+
+    The stock QueueHandler uses put_nowait(), which reports a full queue as a
+    handler error. This handler either blocks until the background listener
+    catches up, or drops the record and counts it.
+    """
+
+    def __init__(self, log_queue: queue.Queue, drop_on_full: bool = False) -> None:
+        super().__init__(log_queue)
+        self.drop_on_full = drop_on_full
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not self.drop_on_full:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message and arguments once, in the logging thread.
+
+        Produces the same record as QueueHandler.prepare() - message,
+        traceback and stack text folded into `msg`, args and exc_info
+        cleared - but builds it directly instead of running a full
+        Formatter.format() pass, so the listener's handlers never
+        re-interpolate `%` arguments or re-render tracebacks.
+        """
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = "".join(
+                traceback.format_exception(*record.exc_info)
+            ).rstrip("\n")
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{record.stack_info}"
+
+        # Copy so handlers later in the chain still see the original record
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """Memory handler that batches records before writing them to a file.
+
+    The buffer is written out when it holds `capacity` records, when a
+    WARNING or higher record arrives, or when the oldest buffered record has
+    waited longer than `flush_interval` seconds.
+    """
+
+    def __init__(
+        self, capacity: int, target: logging.Handler, flush_interval: float
+    ) -> None:
+        super().__init__(
+            capacity, flushLevel=logging.WARNING, target=target, flushOnClose=True
+        )
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        # MemoryHandler.close() flushes but leaves the target file open
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+class _BatchedWriteHandler(logging.Handler):
+    """File handler that appends batches of records with one writev() call.
+
+    Formatted records are kept as encoded byte strings and written together
+    when `capacity` records are pending, when a WARNING or higher record
+    arrives, or when `flush_interval` seconds have passed since the last
+    write. The file is opened with O_APPEND so each batch lands at the end
+    of the file even if other processes append to it too.
+    """
+
+    # Upper bound on buffers per writev() call (POSIX IOV_MAX is >= 16,
+    # Linux uses 1024)
+    _IOV_MAX = 1024
+
+    def __init__(self, path: str, capacity: int, flush_interval: float) -> None:
+        super().__init__()
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._fd: Optional[int] = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._buf: list[bytes] = []
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buf.append(self.format(record).encode("utf-8") + b"\n")
+            if (
+                len(self._buf) >= self.capacity
+                or record.levelno >= logging.WARNING
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            buf = self._buf
+            if buf and self._fd is not None:
+                for start in range(0, len(buf), self._IOV_MAX):
+                    self._write_all(buf[start:start + self._IOV_MAX])
+                buf.clear()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def _write_all(self, chunks: list[bytes]) -> None:
+        if not hasattr(os, "writev"):
+            os.write(self._fd, b"".join(chunks))
+            return
+        written = os.writev(self._fd, chunks)
+        total = sum(len(chunk) for chunk in chunks)
+        if written < total:
+            # Short write; finish the remainder the slow way
+            rest = b"".join(chunks)[written:]
+            while rest:
+                rest = rest[os.write(self._fd, rest):]
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            try:
+                self.flush()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self.release()
+            super().close()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue goes idle.
+
+    Without this, records sitting in a buffering handler would only be written
+    once the next record arrives.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue, *handlers: logging.Handler,
+        flush_interval: float = 1.0, respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _stop_listener() -> None:
+    """Stop the background log listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+_SYSLOG_FACILITIES: Mapping[str, int] = {
+    "kern": logging.handlers.SysLogHandler.LOG_KERN,
+    "user": logging.handlers.SysLogHandler.LOG_USER,
+    "mail": logging.handlers.SysLogHandler.LOG_MAIL,
+    "daemon": logging.handlers.SysLogHandler.LOG_DAEMON,
+    "auth": logging.handlers.SysLogHandler.LOG_AUTH,
+    "syslog": logging.handlers.SysLogHandler.LOG_SYSLOG,
+    "lpr": logging.handlers.SysLogHandler.LOG_LPR,
+    "news": logging.handlers.SysLogHandler.LOG_NEWS,
+    "uucp": logging.handlers.SysLogHandler.LOG_UUCP,
+    "cron": logging.handlers.SysLogHandler.LOG_CRON,
+    "authpriv": logging.handlers.SysLogHandler.LOG_AUTHPRIV,
+    "ftp": logging.handlers.SysLogHandler.LOG_FTP,
+    "local0": logging.handlers.SysLogHandler.LOG_LOCAL0,
+    "local1": logging.handlers.SysLogHandler.LOG_LOCAL1,
+    "local2": logging.handlers.SysLogHandler.LOG_LOCAL2,
+    "local3": logging.handlers.SysLogHandler.LOG_LOCAL3,
+    "local4": logging.handlers.SysLogHandler.LOG_LOCAL4,
+    "local5": logging.handlers.SysLogHandler.LOG_LOCAL5,
+    "local6": logging.handlers.SysLogHandler.LOG_LOCAL6,
+    "local7": logging.handlers.SysLogHandler.LOG_LOCAL7,
+}
 
 
 def _get_syslog_facility(facility_name: str) -> int:
@@ -277,34 +872,10 @@ def _get_syslog_facility(facility_name: str) -> int:
     Raises:
         ValueError: If facility name is not recognized.
     """
-    facilities = {
-        "kern": logging.handlers.SysLogHandler.LOG_KERN,
-        "user": logging.handlers.SysLogHandler.LOG_USER,
-        "mail": logging.handlers.SysLogHandler.LOG_MAIL,
-        "daemon": logging.handlers.SysLogHandler.LOG_DAEMON,
-        "auth": logging.handlers.SysLogHandler.LOG_AUTH,
-        "syslog": logging.handlers.SysLogHandler.LOG_SYSLOG,
-        "lpr": logging.handlers.SysLogHandler.LOG_LPR,
-        "news": logging.handlers.SysLogHandler.LOG_NEWS,
-        "uucp": logging.handlers.SysLogHandler.LOG_UUCP,
-        "cron": logging.handlers.SysLogHandler.LOG_CRON,
-        "authpriv": logging.handlers.SysLogHandler.LOG_AUTHPRIV,
-        "ftp": logging.handlers.SysLogHandler.LOG_FTP,
-        "local0": logging.handlers.SysLogHandler.LOG_LOCAL0,
-        "local1": logging.handlers.SysLogHandler.LOG_LOCAL1,
-        "local2": logging.handlers.SysLogHandler.LOG_LOCAL2,
-        "local3": logging.handlers.SysLogHandler.LOG_LOCAL3,
-        "local4": logging.handlers.SysLogHandler.LOG_LOCAL4,
-        "local5": logging.handlers.SysLogHandler.LOG_LOCAL5,
-        "local6": logging.handlers.SysLogHandler.LOG_LOCAL6,
-        "local7": logging.handlers.SysLogHandler.LOG_LOCAL7,
-    }
-
-    facility_name = facility_name.lower()
-    if facility_name not in facilities:
-        raise ValueError(f"Unknown syslog facility: {facility_name}")
-
-    return facilities[facility_name]
+    try:
+        return _SYSLOG_FACILITIES[facility_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown syslog facility: {facility_name.lower()}") from None
 
 
 def configure_logging(config: Optional[LogConfig] = None) -> None:
@@ -313,6 +884,11 @@ def configure_logging(config: Optional[LogConfig] = None) -> None:
     This function sets up logging according to the provided configuration,
     adding appropriate handlers for console, file, and syslog output.
 
+    Records are handed to the output handlers through a bounded queue that is
+    drained by a background QueueListener thread, so logging calls on request
+    handling paths only pay for an enqueue rather than formatting and a
+    blocking write/sendto.
+
     Args:
         config: Logging configuration. If None, loads from environment.
 
@@ -321,37 +897,57 @@ def configure_logging(config: Optional[LogConfig] = None) -> None:
         Subsequent calls will reconfigure logging, which may cause issues
         with existing loggers.
     """
+    global _listener
+
     if config is None:
         config = LogConfig.from_env()
 
+    # Flush and stop any pipeline from a previous call
+    _stop_listener()
+
     # Get root logger and clear existing handlers
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
     root_logger.setLevel(getattr(logging, config.level))
 
-    # Create formatters
-    if config.format_type == "json":
-        formatter: logging.Formatter = StructuredFormatter()
-    else:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
+    formatter = _pick_formatter(config)
+
+    handlers: list[logging.Handler] = []
 
     # Console handler (stderr)
     if config.console:
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
     if config.file_path:
         try:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(config.file_path), exist_ok=True)
-            file_handler = logging.FileHandler(config.file_path)
-            file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            file_handler: logging.Handler
+            if config.batch_writes:
+                # One writev() per batch instead of a write() per record
+                file_handler = _BatchedWriteHandler(
+                    config.file_path,
+                    config.file_buffer_records,
+                    config.file_flush_interval,
+                )
+                file_handler.setFormatter(formatter)
+            else:
+                raw_file_handler = logging.handlers.RotatingFileHandler(
+                    config.file_path,
+                    maxBytes=config.file_max_bytes,
+                    backupCount=config.file_backup_count,
+                )
+                raw_file_handler.setFormatter(formatter)
+                # Batch records to amortise write() syscalls across many lines
+                file_handler = _BufferedFileHandler(
+                    config.file_buffer_records,
+                    raw_file_handler,
+                    config.file_flush_interval,
+                )
+            handlers.append(file_handler)
         except (OSError, IOError) as e:
             # Log to console if file logging fails
             print(
@@ -368,13 +964,75 @@ def configure_logging(config: Optional[LogConfig] = None) -> None:
                 facility=facility,
             )
             syslog_handler.setFormatter(formatter)
-            root_logger.addHandler(syslog_handler)
+            handlers.append(syslog_handler)
         except (OSError, ValueError) as e:
             # Log to console if syslog fails
             print(f"Warning: Could not setup syslog logging: {e}", file=sys.stderr)
 
+    if not handlers:
+        return
+
+    # Root logger only enqueues; the listener thread does the actual I/O
+    log_queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
+    queue_handler = _BoundedQueueHandler(log_queue, config.drop_on_full)
+    if config.correlation_ids:
+        # Runs in the logging caller's context, before the record changes thread
+        queue_handler.addFilter(CorrelationFilter())
+    if config.debug_sample_rate < 1.0:
+        # Filters on the root logger do not see propagated records, so
+        # sampling is applied on the handler every record passes through
+        queue_handler.addFilter(SamplingFilter(config.debug_sample_rate))
+    if config.dedup_window > 0 and config.dedup_mode != "off":
+        # Drop duplicates before they are enqueued, formatted or written
+        if config.dedup_mode == "bloom":
+            queue_handler.addFilter(BloomDedupFilter(config.dedup_window))
+        else:
+            queue_handler.addFilter(DedupFilter(config.dedup_window))
+    root_logger.addHandler(queue_handler)
+    _listener = _FlushingQueueListener(
+        log_queue,
+        *handlers,
+        flush_interval=config.file_flush_interval,
+        respect_handler_level=True,
+    )
+    _listener.start()
+
+
+class LazyLogger(logging.LoggerAdapter):
+    """Logger wrapper that checks the level before building the message.
+
+    Messages may be passed as zero-argument callables, which are only
+    invoked when the record will actually be created. Any attribute not
+    defined on the adapter (handlers, propagate, ...) is read from the
+    wrapped logger, so existing code keeps working unchanged.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, None)
+
+    def process(self, msg, kwargs):
+        # Leave the caller's ``extra`` untouched; the adapter adds no context.
+        return msg, kwargs
+
+    def log(self, level, msg, *args, **kwargs):
+        if not self.logger.isEnabledFor(level):
+            return
+        if callable(msg):
+            msg = msg()
+        # Skip this frame so records point at the real call site.
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for missing attributes. During copy and unpickling
+        # self.logger is not set yet, and dunder lookups must not be
+        # forwarded, or this would recurse without end.
+        if name == "logger" or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        return getattr(self.logger, name)
 
-def get_logger(name: str, config: Optional[LogConfig] = None) -> logging.Logger:
+
+def get_logger(name: str, config: Optional[LogConfig] = None) -> LazyLogger:
     """Get a logger configured for MCP Template with structured output.
 
     Creates a logger with consistent formatting and appropriate defaults
@@ -385,11 +1043,12 @@ def get_logger(name: str, config: Optional[LogConfig] = None) -> logging.Logger:
         name: Logger name, typically __name__ of the calling module.
               This helps identify which component generated each log message.
         config: Optional logging configuration. If None, uses environment
-                variables via LogConfig.from_env(). For backward compatibility,
+                variables via LogConfig.from_env() (parsed once and cached; see
+                LogConfig.clear_env_cache()). For backward compatibility,
                 falls back to simple console logging if configuration fails.
 
     Returns:
-        Configured logger instance ready for use.
+        LazyLogger wrapping the configured logger, ready for use.
 
     Example:
         ```python
@@ -408,6 +1067,9 @@ def get_logger(name: str, config: Optional[LogConfig] = None) -> logging.Logger:
         logger.info("Tool started")
         logger.warning("Unusual condition detected")
         logger.error("Operation failed")
+
+        # Deferred formatting for expensive debug messages
+        logger.debug(lambda: f"expensive {compute()}")
         ```
 
     Log Format:
@@ -425,7 +1087,7 @@ def get_logger(name: str, config: Optional[LogConfig] = None) -> logging.Logger:
     root_logger = logging.getLogger()
     if root_logger.handlers:
         # Global logging is configured, return logger that inherits from root
-        return logger
+        return LazyLogger(logger)
 
     # Fallback: Configure this specific logger if no global config exists
     # This maintains backward compatibility with existing code
@@ -433,35 +1095,35 @@ def get_logger(name: str, config: Optional[LogConfig] = None) -> logging.Logger:
         try:
             # Try to use environment configuration
             if config is None:
-                config = LogConfig.from_env()
+                config = _cached_env_config()
 
             # Apply basic configuration for this logger only
             handler = logging.StreamHandler(sys.stderr)
 
-            if config.format_type == "json":
-                formatter: logging.Formatter = StructuredFormatter()
-            else:
-                formatter = logging.Formatter(
-                    fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-                    datefmt="%Y-%m-%dT%H:%M:%S",
-                )
-
-            handler.setFormatter(formatter)
+            handler.setFormatter(_pick_formatter(config))
             logger.addHandler(handler)
             logger.setLevel(getattr(logging, config.level, logging.INFO))
 
         except Exception:
             # Ultimate fallback: simple console logging
             handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-                datefmt="%Y-%m-%dT%H:%M:%S",
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_HUMAN_FORMATTER)
             logger.addHandler(handler)
             logger.setLevel(logging.INFO)
 
-    return logger
-
-
-__all__ = ["get_logger", "configure_logging", "LogConfig", "StructuredFormatter"]
+    return LazyLogger(logger)
+
+
+__all__ = [
+    "get_logger",
+    "configure_logging",
+    "BloomDedupFilter",
+    "CorrelationFilter",
+    "DedupFilter",
+    "LogConfig",
+    "LazyLogger",
+    "SamplingFilter",
+    "StructuredFormatter",
+    "reset_correlation_id",
+    "set_correlation_id",
+]
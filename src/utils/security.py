@@ -17,7 +17,9 @@ provides the utilities but doesn't enforce their use to maintain flexibility.
 - `sanitize_input()`: Clean user input to prevent injection attacks
 - `sanitize_error()`: Clean error messages to prevent information leakage
 - `validate_path()`: Prevent path traversal attacks on file operations
+- `validate_path_async()`: Same check off the event loop, for slow filesystems
 - `RateLimiter`: Prevent abuse through request rate limiting
+- `MultiKeyRateLimiter`: Same, with a separate bucket per client or tool
 
 ## Integration Patterns
 
@@ -35,7 +37,8 @@ class SecureFileTool(BaseTool[FileToolParams]):
             clean_filename = sanitize_input(params.filename)
 
             # 2. Validate file paths to prevent traversal attacks
-            safe_path = await validate_path(params.file_path)
+            # (synchronous; use validate_path_async only for NFS-like mounts)
+            safe_path = validate_path(params.file_path)
 
             # 3. Your business logic here
             result = process_file(safe_path, clean_filename)
@@ -86,7 +89,7 @@ async def invoke(self, params: MyParams) -> str:
 # Properly secured version
 async def invoke(self, params: MyParams) -> str:
     try:
-        safe_path = await validate_path(params.file_path)
+        safe_path = validate_path(params.file_path)
         with open(safe_path, 'r') as f:
             return f.read()
     except Exception as e:
@@ -108,13 +111,28 @@ from __future__ import annotations
 import asyncio
 import os
 import re
-from pathlib import Path
+from array import array
+from pathlib import Path, PurePath
 from time import monotonic
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once at import; these run on every tool request
+_SANITIZE_INPUT_RE = re.compile(r"[^\w\s\-_.]")
+_SANITIZE_ERROR_RE = re.compile(r"[^a-zA-Z0-9 .:_-]")
+
+# Deletion tables derived from the patterns above so the str.translate fast
+# path drops exactly the same ASCII characters as the regexes
+_ASCII_CHARS = [chr(code) for code in range(128)]
+_SANITIZE_INPUT_TABLE = str.maketrans(
+    "", "", "".join(c for c in _ASCII_CHARS if _SANITIZE_INPUT_RE.match(c))
+)
+_SANITIZE_ERROR_TABLE = str.maketrans(
+    "", "", "".join(c for c in _ASCII_CHARS if _SANITIZE_ERROR_RE.match(c))
+)
+
 
 def sanitize_input(input_data: str) -> str:
     """Sanitize user-provided input to prevent injection attacks.
@@ -145,7 +163,10 @@ def sanitize_input(input_data: str) -> str:
         For more nuanced sanitization, implement custom validation in your
         tool's parameter model using Pydantic validators.
     """
-    return re.sub(r"[^\w\s\-_.]", "", input_data)
+    if input_data.isascii():
+        return input_data.translate(_SANITIZE_INPUT_TABLE)
+    # \w and \s also match non-ASCII letters and spaces, so use the regex
+    return _SANITIZE_INPUT_RE.sub("", input_data)
 
 
 def sanitize_error(error: str) -> str:
@@ -178,15 +199,20 @@ def sanitize_error(error: str) -> str:
         where sensitive details are logged internally but not returned
         to clients.
     """
-    sanitized = re.sub(r"[^a-zA-Z0-9 .:_-]", "", error)
+    if not error.isascii():
+        # Only ASCII characters are allowed, so drop everything else up front
+        error = error.encode("ascii", "ignore").decode("ascii")
+    sanitized = error.translate(_SANITIZE_ERROR_TABLE)
     return sanitized[:200]
 
 
-async def validate_path(path: str) -> str:
+def validate_path(path: str) -> str:
     """Validate filesystem path to prevent directory traversal attacks.
 
     Checks for path traversal attempts (../) and resolves the path to
     its absolute form to prevent access to unauthorized directories.
+    The traversal check is purely lexical and runs first, so rejected
+    paths never touch the filesystem.
 
     **Security Purpose**: Prevents directory traversal attacks where
     malicious users try to access files outside the intended directory
@@ -204,12 +230,12 @@ async def validate_path(path: str) -> str:
     Example:
         ```python
         # Safe path
-        safe_path = await validate_path("data/file.txt")
+        safe_path = validate_path("data/file.txt")
         # Result: "/app/data/file.txt" (absolute path)
 
         # Dangerous path - raises ValueError
         try:
-            bad_path = await validate_path("../../../etc/passwd")
+            bad_path = validate_path("../../../etc/passwd")
         except ValueError:
             print("Path traversal attempt blocked!")
         ```
@@ -220,11 +246,30 @@ async def validate_path(path: str) -> str:
         2. Verify file permissions before access
         3. Implement additional application-specific path restrictions
     """
-    candidate = Path(path)
-    resolved = candidate.resolve()
-    if ".." in candidate.parts:
+    if ".." in PurePath(path).parts:
         raise ValueError("Invalid path")
-    return str(resolved)
+    return str(Path(path).resolve())
+
+
+async def validate_path_async(path: str) -> str:
+    """Run validate_path() in the default executor.
+
+    This is heavier than calling validate_path() directly: it adds a thread
+    hand-off and an event loop round trip. Only use it when resolving the
+    path may block for a noticeable time, e.g. on NFS or other network
+    filesystems, and the event loop must stay responsive meanwhile.
+
+    Args:
+        path: File path string to validate.
+
+    Returns:
+        Absolute path string if validation passes.
+
+    Raises:
+        ValueError: If path contains traversal attempts (..).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, validate_path, path)
 
 
 class RateLimiter:
@@ -258,10 +303,13 @@ class RateLimiter:
         ```
 
     Thread Safety:
-        This class is async-safe and can be used concurrently across
-        multiple requests using asyncio locks.
+        This class is async-safe: allow() never suspends, so its update runs
+        atomically with respect to other tasks on the same event loop. It is
+        not safe to share one instance across threads or event loops.
     """
 
+    __slots__ = ("rate", "per_seconds", "allowance", "last_check", "_inv_period")
+
     def __init__(self, rate: int, per_seconds: float) -> None:
         """Initialize the rate limiter.
 
@@ -282,7 +330,8 @@ class RateLimiter:
         self.per_seconds = per_seconds
         self.allowance: float = float(rate)
         self.last_check = monotonic()
-        self._lock = asyncio.Lock()
+        # Tokens added per second, precomputed to keep allow() division-free
+        self._inv_period = rate / per_seconds
 
     async def allow(self) -> bool:
         """Check if a request should be allowed based on rate limits.
@@ -308,20 +357,154 @@ class RateLimiter:
             ```
 
         Note:
-            This method is thread-safe and can be called concurrently
-            from multiple async tasks.
+            This method can be called concurrently from multiple async tasks.
+            It contains no await points, so no lock is needed to keep the
+            bucket update consistent. Synchronous callers can use
+            try_acquire() directly and skip the coroutine allocation.
+        """
+        return self.try_acquire()
+
+    def try_acquire(self) -> bool:
+        """Synchronously consume one token if available.
+
+        Same token bucket update as allow(), without creating a coroutine,
+        for hot paths that do not need to await.
+
+        Returns:
+            True if request should be allowed, False if rate limit exceeded.
+        """
+        current = monotonic()
+        allowance = self.allowance + (current - self.last_check) * self._inv_period
+        self.last_check = current
+        if allowance > self.rate:
+            allowance = self.rate
+        if allowance < 1.0:
+            self.allowance = allowance
+            return False
+        self.allowance = allowance - 1.0
+        return True
+
+
+class MultiKeyRateLimiter:
+    """Token bucket rate limiter with an independent bucket per key.
+
+    Use this for per-client or per-tool limits. Instead of one RateLimiter
+    object per key, bucket state is stored column-wise in two contiguous
+    double arrays (allowance and last check time) indexed through a
+    key -> slot dictionary, so a check is a dict lookup plus a few array
+    reads and writes.
+
+    A bucket that has refilled to capacity behaves exactly like a brand new
+    key, so when all `max_keys` slots are in use, full buckets are reclaimed.
+    If every tracked key is still rate limited, requests from new keys are
+    denied rather than growing the table without bound.
+
+    Example:
+        ```python
+        # 10 requests per minute per client
+        limiter = MultiKeyRateLimiter(rate=10, per_seconds=60.0)
+
+        if not await limiter.allow(client_id):
+            raise ToolError("Rate limit exceeded")
+        ```
+
+    Thread Safety:
+        Same as RateLimiter: safe across tasks on one event loop, not across
+        threads or event loops.
+    """
+
+    __slots__ = (
+        "rate", "per_seconds", "max_keys",
+        "_inv_period", "_slots", "_allowance", "_last_check",
+    )
+
+    def __init__(self, rate: int, per_seconds: float, max_keys: int = 10000) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Maximum number of requests allowed per key in the time window.
+            per_seconds: Time window in seconds for the rate limit.
+            max_keys: Maximum number of keys tracked at once.
+        """
+        self.rate = rate
+        self.per_seconds = per_seconds
+        self.max_keys = max_keys
+        self._inv_period = rate / per_seconds
+        self._slots: dict[str, int] = {}
+        self._allowance = array("d")
+        self._last_check = array("d")
+
+    async def allow(self, key: str) -> bool:
+        """Check if a request for `key` should be allowed.
+
+        Args:
+            key: Bucket identifier, e.g. a client or tool name.
+
+        Returns:
+            True if request should be allowed, False if rate limit exceeded.
+        """
+        return self.try_acquire(key)
+
+    def try_acquire(self, key: str) -> bool:
+        """Synchronously consume one token from the bucket for `key`.
+
+        Same update as allow(), without creating a coroutine.
+
+        Args:
+            key: Bucket identifier, e.g. a client or tool name.
+
+        Returns:
+            True if request should be allowed, False if rate limit exceeded.
+        """
+        current = monotonic()
+        slot = self._slots.get(key)
+        if slot is None:
+            if len(self._slots) >= self.max_keys:
+                self._reclaim_full_buckets(current)
+                if len(self._slots) >= self.max_keys:
+                    return False
+            slot = len(self._slots)
+            self._slots[key] = slot
+            self._allowance.append(float(self.rate))
+            self._last_check.append(current)
+
+        allowance = (
+            self._allowance[slot]
+            + (current - self._last_check[slot]) * self._inv_period
+        )
+        self._last_check[slot] = current
+        if allowance > self.rate:
+            allowance = self.rate
+        if allowance < 1.0:
+            self._allowance[slot] = allowance
+            return False
+        self._allowance[slot] = allowance - 1.0
+        return True
+
+    def _reclaim_full_buckets(self, current: float) -> None:
+        """Drop keys whose buckets have refilled to capacity.
+
+        Args:
+            current: Current monotonic time.
         """
-        async with self._lock:
-            current = monotonic()
-            time_passed = current - self.last_check
-            self.last_check = current
-            self.allowance += time_passed * (self.rate / self.per_seconds)
-            if self.allowance > self.rate:
-                self.allowance = self.rate
-            if self.allowance < 1.0:
-                return False
-            self.allowance -= 1.0
-            return True
+        rate = self.rate
+        inv_period = self._inv_period
+        allowance = self._allowance
+        last_check = self._last_check
+
+        slots: dict[str, int] = {}
+        new_allowance = array("d")
+        new_last_check = array("d")
+        for key, slot in self._slots.items():
+            refilled = allowance[slot] + (current - last_check[slot]) * inv_period
+            if refilled < rate:
+                slots[key] = len(slots)
+                new_allowance.append(refilled)
+                new_last_check.append(current)
+
+        self._slots = slots
+        self._allowance = new_allowance
+        self._last_check = new_last_check
 
 
 def validate_tool_security_config(tool: 'BaseTool') -> None:
@@ -395,7 +578,9 @@ __all__ = [
     "sanitize_input", 
     "sanitize_error", 
     "validate_path", 
+    "validate_path_async",
     "RateLimiter",
+    "MultiKeyRateLimiter",
     "validate_tool_security_config",
     "SecurityConfigError"
 ]
@@ -25,8 +25,7 @@ async def handle_tool_call(name: str, arguments: dict):
     # Layer 1 protections are automatically applied
     await security.validate_request(name, arguments)
     
-    async with security.execution_timeout(tool_timeout):
-        result = await tool.invoke(params)
+    result = await security.run_with_timeout(tool.invoke(params), tool_timeout, name)
     
     safe_result = await security.validate_response(result)
     return safe_result
@@ -34,28 +33,95 @@ async def handle_tool_call(name: str, arguments: dict):
 
 ## Configuration
 
-All limits can be configured via environment variables:
+All limits can be configured via environment variables, which are read once
+when this module is imported:
 - MCP_MAX_INPUT_SIZE: Maximum input size in bytes (default: 1MB)
 - MCP_MAX_OUTPUT_SIZE: Maximum output size in bytes (default: 10MB)  
 - MCP_DEFAULT_TIMEOUT: Default tool timeout in seconds (default: 30s)
 - MCP_MAX_TIMEOUT: Maximum allowed timeout in seconds (default: 300s)
 - MCP_RATE_LIMIT: Requests per minute limit (default: 100)
 - MCP_OUTPUT_RATE_LIMIT: Output bytes per minute (default: 50MB)
+- MCP_TOOL_RATE_LIMIT: Requests per minute limit for each tool (default: 0,
+  no per-tool limit)
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
+import math
 import os
 import re
 import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from typing import Any, Awaitable, Dict, Optional, TypeVar
 
 from utils.logging import get_logger
+from utils.security import MultiKeyRateLimiter
+from utils.validator import (
+    CONTAINER_OVERHEAD,
+    KEY_OVERHEAD,
+    SAFE_SCALAR_TYPES,
+    SCALAR_OVERHEAD,
+    STR_OVERHEAD,
+    ValidationViolation,
+    walk,
+)
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Security limits from the environment, parsed once at import time
+_MAX_INPUT_SIZE = int(os.getenv("MCP_MAX_INPUT_SIZE", "1000000"))  # 1MB
+_MAX_STRING_LENGTH = int(os.getenv("MCP_MAX_STRING_LENGTH", "100000"))  # 100KB
+_MAX_OUTPUT_SIZE = int(os.getenv("MCP_MAX_OUTPUT_SIZE", "10000000"))  # 10MB
+_MAX_OUTPUT_LINES = int(os.getenv("MCP_MAX_OUTPUT_LINES", "50000"))  # 50K lines
+_DEFAULT_TIMEOUT = float(os.getenv("MCP_DEFAULT_TIMEOUT", "30.0"))  # 30 seconds
+_MAX_TIMEOUT = float(os.getenv("MCP_MAX_TIMEOUT", "300.0"))  # 5 minutes
+_RATE_LIMIT_PER_MINUTE = int(os.getenv("MCP_RATE_LIMIT", "100"))  # 100 req/min
+_OUTPUT_RATE_LIMIT = int(os.getenv("MCP_OUTPUT_RATE_LIMIT", "52428800"))  # 50MB/min
+_TOOL_RATE_LIMIT_PER_MINUTE = int(os.getenv("MCP_TOOL_RATE_LIMIT", "0"))  # 0 = off
+
+# Markers appended to truncated tool output
+_SIZE_TRUNC_SUFFIX = "\n[OUTPUT TRUNCATED - SIZE LIMIT EXCEEDED]"
+_LINE_TRUNC_SUFFIX = "\n[OUTPUT TRUNCATED - LINE LIMIT EXCEEDED]"
+
+# Largest flat argument dict validated without the full walk
+_FLAT_FAST_PATH_MAX_KEYS = 8
+
+
+def _find_nth_newline(text: str, n: int) -> int:
+    """Return the index of the n-th newline in text (1-based).
+    
+    Slicing text up to this index keeps exactly the first n lines, without
+    splitting the text into a list of lines.
+    
+    Args:
+        text: Text containing at least n newlines.
+        n: Which newline to find.
+        
+    Returns:
+        Index of the n-th newline character.
+    """
+    pos = -1
+    find = text.find
+    for _ in range(n):
+        pos = find("\n", pos + 1)
+    return pos
+
+
+class TrustedOutput(str):
+    """Marker for tool output that is already bounded and structured.
+    
+    Tools that emit small, well-formed payloads (e.g. objective listings)
+    can return TrustedOutput(payload) instead of a plain str. If it also
+    fits the configured size and line limits, validate_response skips the
+    truncation pipeline and only performs output rate-limit accounting.
+    """
+    
+    __slots__ = ()
+
 
 class SecurityError(Exception):
     """Security-related errors that should be logged and handled specially.
@@ -73,23 +139,40 @@ class SecurityConfig:
     for different deployment scenarios.
     """
     
+    __slots__ = (
+        "max_input_size",
+        "max_string_length",
+        "max_output_size",
+        "max_output_lines",
+        "default_timeout",
+        "max_timeout",
+        "rate_limit_per_minute",
+        "output_rate_limit",
+        "tool_rate_limit_per_minute",
+    )
+    
     def __init__(self) -> None:
-        """Initialize security configuration from environment variables."""
+        """Initialize security configuration from environment variables.
+        
+        The environment is parsed once at import time; instances copy the
+        module-level values.
+        """
         # Input protection limits
-        self.max_input_size = int(os.getenv("MCP_MAX_INPUT_SIZE", "1000000"))  # 1MB
-        self.max_string_length = int(os.getenv("MCP_MAX_STRING_LENGTH", "100000"))  # 100KB
+        self.max_input_size = _MAX_INPUT_SIZE
+        self.max_string_length = _MAX_STRING_LENGTH
         
         # Output protection limits  
-        self.max_output_size = int(os.getenv("MCP_MAX_OUTPUT_SIZE", "10000000"))  # 10MB
-        self.max_output_lines = int(os.getenv("MCP_MAX_OUTPUT_LINES", "50000"))  # 50K lines
+        self.max_output_size = _MAX_OUTPUT_SIZE
+        self.max_output_lines = _MAX_OUTPUT_LINES
         
         # Execution time limits
-        self.default_timeout = float(os.getenv("MCP_DEFAULT_TIMEOUT", "30.0"))  # 30 seconds
-        self.max_timeout = float(os.getenv("MCP_MAX_TIMEOUT", "300.0"))  # 5 minutes
+        self.default_timeout = _DEFAULT_TIMEOUT
+        self.max_timeout = _MAX_TIMEOUT
         
         # Rate limiting
-        self.rate_limit_per_minute = int(os.getenv("MCP_RATE_LIMIT", "100"))  # 100 req/min
-        self.output_rate_limit = int(os.getenv("MCP_OUTPUT_RATE_LIMIT", "52428800"))  # 50MB/min
+        self.rate_limit_per_minute = _RATE_LIMIT_PER_MINUTE
+        self.output_rate_limit = _OUTPUT_RATE_LIMIT
+        self.tool_rate_limit_per_minute = _TOOL_RATE_LIMIT_PER_MINUTE
         
         # Log configuration on startup
         logger.info(
@@ -103,69 +186,87 @@ class SecurityConfig:
         )
 
 
-class RateLimiter:
-    """Token bucket rate limiter for preventing abuse and DoS attacks.
+class DualLimiter:
+    """Combined request-rate and output-volume limiter.
+    
+    Holds the state for both Layer 1 rate limits in one object:
     
-    This is an enhanced version of the rate limiter from security.py,
-    optimized for the middleware use case with better async handling.
+    - Requests use a sliding window counter: requests are counted in fixed
+      windows of `per_seconds`, and the effective count is the current
+      window's count plus the previous window's count weighted by how much
+      of it still overlaps the trailing window. This avoids the double
+      burst a fixed window allows at a window boundary with O(1) state.
+    - Output bytes are counted in a fixed one-minute window.
+    
+    Both checks are plain synchronous methods: they contain no await
+    points, so each update is atomic with respect to other tasks on the
+    same event loop without a lock or a coroutine per call. An instance
+    must not be shared across threads or event loops.
     """
     
-    def __init__(self, rate: int, per_seconds: float) -> None:
-        """Initialize the rate limiter.
+    __slots__ = (
+        "rate",
+        "window_size",
+        "window_start",
+        "current_count",
+        "prev_count",
+        "max_bytes",
+        "output_window_start",
+        "bytes_sent",
+    )
+    
+    def __init__(
+        self,
+        request_rate: int,
+        output_bytes_per_min: int,
+        per_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the limiter.
         
         Args:
-            rate: Maximum number of requests allowed in the time window.
-            per_seconds: Time window in seconds for the rate limit.
+            request_rate: Maximum number of requests allowed per window.
+            output_bytes_per_min: Maximum output bytes allowed per minute.
+            per_seconds: Request window length in seconds.
         """
-        self.rate = rate
-        self.per_seconds = per_seconds
-        self.allowance: float = float(rate)
-        self.last_check = time.monotonic()
-        self._lock = asyncio.Lock()
+        now = time.monotonic()
+        
+        # Request rate state
+        self.rate = request_rate
+        self.window_size = float(per_seconds)
+        self.window_start = now
+        self.current_count = 0
+        self.prev_count = 0
+        
+        # Output volume state
+        self.max_bytes = output_bytes_per_min
+        self.output_window_start = now
+        self.bytes_sent = 0
     
-    async def allow(self) -> bool:
+    def check_request(self) -> bool:
         """Check if a request should be allowed based on rate limits.
         
         Returns:
             True if request should be allowed, False if rate limit exceeded.
         """
-        async with self._lock:
-            current = time.monotonic()
-            time_passed = current - self.last_check
-            self.last_check = current
-            
-            # Add tokens based on time passed
-            self.allowance += time_passed * (self.rate / self.per_seconds)
-            if self.allowance > self.rate:
-                self.allowance = self.rate
-            
-            # Check if we have tokens available
-            if self.allowance < 1.0:
-                return False
-            
-            self.allowance -= 1.0
-            return True
-
-
-class OutputRateLimiter:
-    """Rate limiter specifically for output data volume.
-    
-    Prevents tools from overwhelming the server or clients with
-    excessive output data over time.
-    """
+        now = time.monotonic()
+        window_size = self.window_size
+        elapsed = now - self.window_start
+        
+        # Roll the windows forward, keeping window_start on a boundary
+        if elapsed >= window_size:
+            self.prev_count = self.current_count if elapsed < 2 * window_size else 0
+            self.current_count = 0
+            self.window_start += (elapsed // window_size) * window_size
+            elapsed = now - self.window_start
+        
+        weighted = self.prev_count * (1.0 - elapsed / window_size) + self.current_count
+        if weighted >= self.rate:
+            return False
+        
+        self.current_count += 1
+        return True
     
-    def __init__(self, max_bytes_per_minute: int) -> None:
-        """Initialize output rate limiter.
-        
-        Args:
-            max_bytes_per_minute: Maximum bytes allowed per minute.
-        """
-        self.max_bytes = max_bytes_per_minute
-        self.window_start = time.monotonic()
-        self.bytes_sent = 0
-        self._lock = asyncio.Lock()
-    
-    async def check_output_rate(self, output_size: int) -> bool:
+    def check_output(self, output_size: int) -> bool:
         """Check if output can be sent without exceeding rate limit.
         
         Args:
@@ -174,20 +275,19 @@ class OutputRateLimiter:
         Returns:
             True if output is within rate limit, False otherwise.
         """
-        async with self._lock:
-            now = time.monotonic()
-            
-            # Reset window if needed (sliding window)
-            if now - self.window_start > 60:
-                self.window_start = now
-                self.bytes_sent = 0
-            
-            # Check if adding this output would exceed limit
-            if self.bytes_sent + output_size > self.max_bytes:
-                return False
-            
-            self.bytes_sent += output_size
-            return True
+        now = time.monotonic()
+        
+        # Reset window if needed
+        if now - self.output_window_start > 60:
+            self.output_window_start = now
+            self.bytes_sent = 0
+        
+        # Check if adding this output would exceed limit
+        if self.bytes_sent + output_size > self.max_bytes:
+            return False
+        
+        self.bytes_sent += output_size
+        return True
 
 
 class SecurityMiddleware:
@@ -198,6 +298,8 @@ class SecurityMiddleware:
     at the server level.
     """
     
+    __slots__ = ("config", "limiter", "tool_limiter", "_debug_enabled")
+    
     def __init__(self, config: SecurityConfig) -> None:
         """Initialize security middleware with configuration.
         
@@ -206,16 +308,37 @@ class SecurityMiddleware:
         """
         self.config = config
         
-        # Initialize rate limiters
-        self.rate_limiter = RateLimiter(
-            config.rate_limit_per_minute, 
+        # Request and output rate limits share one limiter
+        self.limiter = DualLimiter(
+            config.rate_limit_per_minute,
+            config.output_rate_limit,
             60.0  # per minute
         )
-        self.output_limiter = OutputRateLimiter(config.output_rate_limit)
+        
+        # Optional per-tool request limit, one bucket per tool name
+        self.tool_limiter: Optional[MultiKeyRateLimiter] = None
+        if config.tool_rate_limit_per_minute > 0:
+            self.tool_limiter = MultiKeyRateLimiter(
+                rate=config.tool_rate_limit_per_minute, per_seconds=60.0
+            )
+        
+        # Per-request debug logs are skipped entirely unless enabled
+        self.refresh_log_level()
         
         logger.info("Security middleware initialized")
     
-    async def validate_request(self, name: str, arguments: Dict[str, Any]) -> None:
+    def refresh_log_level(self) -> None:
+        """Re-read whether DEBUG logging is enabled.
+        
+        The result is cached so the per-request debug messages (and their
+        extra dicts) are not built when DEBUG is off. Call this after
+        reconfiguring logging at runtime.
+        """
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    async def validate_request(
+        self, name: str, arguments: Dict[str, Any], raw_size: Optional[int] = None
+    ) -> None:
         """Layer 1: Request validation - always applied.
         
         Validates incoming requests for security threats including:
@@ -223,112 +346,159 @@ class SecurityMiddleware:
         - Oversized inputs
         - Dangerous object types
         
+        Input size is an estimate of the serialized length, accumulated
+        from string and key lengths during the validation walk. The
+        arguments are never stringified, and the walk aborts as soon as the
+        running estimate passes the limit.
+        
         Args:
             name: Tool name being called.
             arguments: Tool arguments dictionary.
+            raw_size: Length in bytes of the arguments as received on the
+                wire, if the transport knows it. When given, it is used for
+                the input size limit and the estimate from the walk is
+                skipped.
             
         Raises:
             SecurityError: If request violates security policies.
         """
         # Rate limiting check
-        if not await self.rate_limiter.allow():
+        if not self.limiter.check_request():
             logger.warning(
                 f"Rate limit exceeded for tool: {name}",
                 extra={"tool_name": name, "security_violation": "rate_limit"}
             )
             raise SecurityError("Rate limit exceeded. Please slow down.")
-        
-        # Input size validation
-        input_str = str(arguments)
-        input_size = len(input_str)
-        
-        if input_size > self.config.max_input_size:
+        if self.tool_limiter is not None and not self.tool_limiter.try_acquire(name):
             logger.warning(
-                f"Input size limit exceeded: {input_size} bytes",
-                extra={
-                    "tool_name": name,
-                    "input_size": input_size,
-                    "limit": self.config.max_input_size,
-                    "security_violation": "input_size"
-                }
+                f"Per-tool rate limit exceeded for tool: {name}",
+                extra={"tool_name": name, "security_violation": "tool_rate_limit"}
             )
-            raise SecurityError(f"Input too large: {input_size} bytes (limit: {self.config.max_input_size})")
-        
-        # String length validation for individual parameters
-        self._validate_string_lengths(arguments, name)
+            raise SecurityError(f"Rate limit exceeded for tool '{name}'. Please slow down.")
+        
+        # The wire size is exact, so check it up front and let the walks
+        # below skip their size estimate
+        size_limit: Optional[float] = None
+        if raw_size is not None:
+            if raw_size > self.config.max_input_size:
+                self._raise_input_too_large(raw_size, name)
+            size_limit = math.inf
+        
+        # Most calls pass a handful of scalar arguments; check those inline
+        # and only run the full validator for anything else
+        input_size = self._validate_flat(arguments, size_limit)
+        if input_size is None:
+            # Size, string length and type safety checks in a single pass
+            input_size = self._validate_structure(arguments, name, size_limit)
+        if raw_size is not None:
+            input_size = raw_size
+        
+        if self._debug_enabled:
+            logger.debug(
+                f"Request validation passed for tool: {name}",
+                extra={"tool_name": name, "input_size": input_size}
+            )
+    
+    def _raise_input_too_large(self, input_size: int, tool_name: str) -> None:
+        """Log an input size violation and raise SecurityError."""
+        logger.warning(
+            f"Input size limit exceeded: {input_size} bytes",
+            extra={
+                "tool_name": tool_name,
+                "input_size": input_size,
+                "limit": self.config.max_input_size,
+                "security_violation": "input_size"
+            }
+        )
+        raise SecurityError(f"Input too large: {input_size} bytes (limit: {self.config.max_input_size})")
+    
+    def _validate_flat(self, arguments: Any, size_limit: Optional[float] = None) -> Optional[int]:
+        """Fast path for small dicts of scalar values.
         
-        # Type safety validation
-        self._validate_safe_types(arguments, name)
+        Performs the same checks as _validate_structure() without recursion
+        for dicts of at most _FLAT_FAST_PATH_MAX_KEYS str keys whose values
+        are plain str/int/float/bool/None.
         
-        logger.debug(
-            f"Request validation passed for tool: {name}",
-            extra={"tool_name": name, "input_size": input_size}
-        )
+        Args:
+            arguments: Tool arguments to validate.
+            size_limit: Size limit to enforce; defaults to max_input_size.
+            
+        Returns:
+            Estimated serialized size in bytes if the arguments are flat and
+            within limits, or None if the full validator must run (including
+            when a limit is exceeded, so it can report the violation).
+        """
+        if type(arguments) is not dict or len(arguments) > _FLAT_FAST_PATH_MAX_KEYS:
+            return None
+        max_str = self.config.max_string_length
+        size = CONTAINER_OVERHEAD
+        for key, value in arguments.items():
+            if type(key) is not str:
+                return None
+            size += len(key) + KEY_OVERHEAD
+            t = type(value)
+            if t is str:
+                if len(value) > max_str:
+                    return None
+                size += len(value) + STR_OVERHEAD
+            elif t in SAFE_SCALAR_TYPES:
+                size += SCALAR_OVERHEAD
+            else:
+                return None
+        if size > (self.config.max_input_size if size_limit is None else size_limit):
+            return None
+        return size
     
-    def _validate_string_lengths(self, obj: Any, tool_name: str, path: str = "") -> None:
-        """Recursively validate string lengths in nested data structures.
+    def _validate_structure(
+        self, obj: Any, tool_name: str, size_limit: Optional[float] = None
+    ) -> int:
+        """Validate nested arguments with the compiled-ready walker.
+        
+        Runs utils.validator.walk(), which checks string lengths and value
+        types while estimating the serialized size in one iterative pass,
+        and turns any violation it reports into a logged SecurityError.
         
         Args:
             obj: Object to validate (can be nested dict/list).
             tool_name: Name of tool for logging.
-            path: Current path in object hierarchy for error reporting.
+            size_limit: Size limit to enforce; defaults to max_input_size.
+            
+        Returns:
+            Estimated serialized size of obj in bytes.
             
         Raises:
-            SecurityError: If any string exceeds maximum length.
+            SecurityError: If any size, length or type check fails.
         """
-        if isinstance(obj, str):
-            if len(obj) > self.config.max_string_length:
+        max_str = self.config.max_string_length
+        max_in = self.config.max_input_size if size_limit is None else size_limit
+        try:
+            return walk(obj, max_str, max_in)
+        except ValidationViolation as v:
+            if v.kind == "string_length":
                 logger.warning(
-                    f"String length limit exceeded at {path}",
+                    f"String length limit exceeded at {v.path}",
                     extra={
                         "tool_name": tool_name,
-                        "string_length": len(obj),
-                        "limit": self.config.max_string_length,
-                        "path": path,
+                        "string_length": v.size,
+                        "limit": max_str,
+                        "path": v.path,
                         "security_violation": "string_length"
                     }
                 )
-                raise SecurityError(f"String too long at {path}: {len(obj)} chars (limit: {self.config.max_string_length})")
-        
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                self._validate_string_lengths(value, tool_name, f"{path}.{key}" if path else key)
-        
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                self._validate_string_lengths(item, tool_name, f"{path}[{i}]" if path else f"[{i}]")
-    
-    def _validate_safe_types(self, obj: Any, tool_name: str, path: str = "") -> None:
-        """Validate that object contains only safe, serializable types.
-        
-        Args:
-            obj: Object to validate.
-            tool_name: Name of tool for logging.
-            path: Current path in object hierarchy.
-            
-        Raises:
-            SecurityError: If dangerous types are detected.
-        """
-        # Check for dangerous types
-        if callable(obj) or hasattr(obj, '__code__'):
-            logger.error(
-                f"Dangerous object type detected: {type(obj).__name__}",
-                extra={
-                    "tool_name": tool_name,
-                    "object_type": type(obj).__name__,
-                    "path": path,
-                    "security_violation": "dangerous_type"
-                }
-            )
-            raise SecurityError(f"Dangerous object type not allowed: {type(obj).__name__}")
-        
-        # Recursively check nested structures
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                self._validate_safe_types(value, tool_name, f"{path}.{key}" if path else key)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                self._validate_safe_types(item, tool_name, f"{path}[{i}]" if path else f"[{i}]")
+                raise SecurityError(f"String too long at {v.path}: {v.size} chars (limit: {max_str})") from None
+            if v.kind == "dangerous_type":
+                logger.error(
+                    f"Dangerous object type detected: {v.type_name}",
+                    extra={
+                        "tool_name": tool_name,
+                        "object_type": v.type_name,
+                        "path": v.path,
+                        "security_violation": "dangerous_type"
+                    }
+                )
+                raise SecurityError(f"Dangerous object type not allowed: {v.type_name}") from None
+            self._raise_input_too_large(v.size, tool_name)
+            raise
     
     async def validate_response(self, result: Any, tool_name: str) -> str:
         """Layer 1: Response validation - always applied.
@@ -348,13 +518,26 @@ class SecurityMiddleware:
         Raises:
             SecurityError: If output rate limits are exceeded.
         """
-        result_str = str(result)
+        max_output_size = self.config.max_output_size
+        max_output_lines = self.config.max_output_lines
+        
+        # Trusted fast path: the tool vouches for the shape, we only check
+        # the limits and account the output against the rate limit
+        if (
+            type(result) is TrustedOutput
+            and len(result) <= max_output_size
+            and result.count('\n') < max_output_lines
+        ):
+            self._check_output_rate(len(result), tool_name)
+            return result
+        
+        result_str = result if isinstance(result, str) else str(result)
         original_size = len(result_str)
         truncated = False
         
         # Output size check with truncation
-        if len(result_str) > self.config.max_output_size:
-            result_str = result_str[:self.config.max_output_size] + "\n[OUTPUT TRUNCATED - SIZE LIMIT EXCEEDED]"
+        if original_size > max_output_size:
+            result_str = result_str[:max_output_size] + _SIZE_TRUNC_SUFFIX
             truncated = True
             
             logger.warning(
@@ -363,42 +546,34 @@ class SecurityMiddleware:
                     "tool_name": tool_name,
                     "original_size": original_size,
                     "truncated_size": len(result_str),
-                    "limit": self.config.max_output_size,
+                    "limit": max_output_size,
                     "security_action": "truncate_output"
                 }
             )
         
-        # Line count check with truncation
-        lines = result_str.split('\n')
-        if len(lines) > self.config.max_output_lines:
-            result_str = '\n'.join(lines[:self.config.max_output_lines]) + "\n[OUTPUT TRUNCATED - LINE LIMIT EXCEEDED]"
+        # Line count check with truncation (counted in place, no line list)
+        line_count = result_str.count('\n') + 1
+        if line_count > max_output_lines:
+            cut = _find_nth_newline(result_str, max_output_lines)
+            result_str = result_str[:cut] + _LINE_TRUNC_SUFFIX
             truncated = True
             
             logger.warning(
                 f"Output truncated due to line limit",
                 extra={
                     "tool_name": tool_name,
-                    "original_lines": len(lines),
-                    "truncated_lines": self.config.max_output_lines,
+                    "original_lines": line_count,
+                    "truncated_lines": max_output_lines,
                     "security_action": "truncate_lines"
                 }
             )
         
         # Output rate limiting check
         final_size = len(result_str)
-        if not await self.output_limiter.check_output_rate(final_size):
-            logger.error(
-                f"Output rate limit exceeded",
-                extra={
-                    "tool_name": tool_name,
-                    "output_size": final_size,
-                    "security_violation": "output_rate_limit"
-                }
-            )
-            raise SecurityError("Output rate limit exceeded - server is sending too much data")
+        self._check_output_rate(final_size, tool_name)
         
         # Log successful validation
-        if not truncated:
+        if not truncated and self._debug_enabled:
             logger.debug(
                 f"Response validation passed for tool: {tool_name}",
                 extra={"tool_name": tool_name, "output_size": final_size}
@@ -406,20 +581,36 @@ class SecurityMiddleware:
         
         return result_str
     
-    @asynccontextmanager
-    async def execution_timeout(self, tool_timeout: float, tool_name: str):
-        """Layer 1: Execution timeout - always applied.
+    def _check_output_rate(self, output_size: int, tool_name: str) -> None:
+        """Account output against the output rate limit.
         
-        Provides automatic timeout enforcement for tool execution.
-        The effective timeout is the minimum of the requested timeout
-        and the configured maximum timeout.
+        Args:
+            output_size: Size of the output being sent, in characters.
+            tool_name: Name of tool that generated the output.
+            
+        Raises:
+            SecurityError: If output rate limits are exceeded.
+        """
+        if not self.limiter.check_output(output_size):
+            logger.error(
+                f"Output rate limit exceeded",
+                extra={
+                    "tool_name": tool_name,
+                    "output_size": output_size,
+                    "security_violation": "output_rate_limit"
+                }
+            )
+            raise SecurityError("Output rate limit exceeded - server is sending too much data")
+    
+    def _effective_timeout(self, tool_timeout: float, tool_name: str) -> float:
+        """Cap a requested tool timeout at the configured maximum.
         
         Args:
             tool_timeout: Requested timeout in seconds.
             tool_name: Name of tool for logging.
             
-        Raises:
-            SecurityError: If execution exceeds timeout.
+        Returns:
+            The timeout to enforce, in seconds.
         """
         effective_timeout = min(tool_timeout, self.config.max_timeout)
         
@@ -433,20 +624,68 @@ class SecurityMiddleware:
                     "max_timeout": self.config.max_timeout
                 }
             )
+        return effective_timeout
+    
+    def _timeout_error(self, effective_timeout: float, tool_name: str) -> SecurityError:
+        """Log an execution timeout and build the error to raise."""
+        logger.error(
+            f"Tool execution timeout",
+            extra={
+                "tool_name": tool_name,
+                "timeout_seconds": effective_timeout,
+                "security_violation": "execution_timeout"
+            }
+        )
+        return SecurityError(f"Tool '{tool_name}' execution timeout ({effective_timeout}s)")
+    
+    async def run_with_timeout(self, coro: Awaitable[T], tool_timeout: float, tool_name: str) -> T:
+        """Layer 1: Execution timeout - always applied.
+        
+        Awaits `coro` in the current task under asyncio.timeout(). The
+        effective timeout is the minimum of the requested timeout and the
+        configured maximum timeout. Unlike asyncio.wait_for(), no extra Task
+        is created per call, and unlike execution_timeout() there is no
+        async generator context manager around it.
+        
+        Args:
+            coro: Awaitable performing the tool execution.
+            tool_timeout: Requested timeout in seconds.
+            tool_name: Name of tool for logging.
+            
+        Returns:
+            The result of `coro`.
+            
+        Raises:
+            SecurityError: If execution exceeds timeout.
+        """
+        effective_timeout = self._effective_timeout(tool_timeout, tool_name)
+        try:
+            async with asyncio.timeout(effective_timeout):
+                return await coro
+        except asyncio.TimeoutError:
+            raise self._timeout_error(effective_timeout, tool_name) from None
+    
+    @asynccontextmanager
+    async def execution_timeout(self, tool_timeout: float, tool_name: str):
+        """Layer 1: Execution timeout as an async context manager.
+        
+        Deprecated: use run_with_timeout(), which avoids the context manager
+        overhead. Kept for existing callers.
+        
+        Args:
+            tool_timeout: Requested timeout in seconds.
+            tool_name: Name of tool for logging.
+            
+        Raises:
+            SecurityError: If execution exceeds timeout.
+        """
+        effective_timeout = self._effective_timeout(tool_timeout, tool_name)
         
         try:
             async with asyncio.timeout(effective_timeout):
                 yield
         except asyncio.TimeoutError:
-            logger.error(
-                f"Tool execution timeout",
-                extra={
-                    "tool_name": tool_name,
-                    "timeout_seconds": effective_timeout,
-                    "security_violation": "execution_timeout"
-                }
-            )
-            raise SecurityError(f"Tool '{tool_name}' execution timeout ({effective_timeout}s)")
+            raise self._timeout_error(effective_timeout, tool_name)
 
 
-__all__ = ["SecurityMiddleware", "SecurityConfig", "SecurityError"]
+__all__ = ["SecurityMiddleware", "SecurityConfig", "SecurityError", "TrustedOutput"]
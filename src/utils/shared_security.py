@@ -3,8 +3,14 @@
 This module provides a singleton pattern for managing the security configuration
 across all tools, eliminating the performance issue where each tool was creating
 its own security configuration instance.
+
+The shared SecurityConfig is built once when this module is imported, so the
+module itself acts as the singleton and import locking makes initialization
+thread-safe. SharedSecurityConfig remains as a thin manager around it for
+existing callers.
 """
 
+from functools import lru_cache
 from typing import Optional
 import logging
 
@@ -12,6 +18,10 @@ from .logging import get_logger
 from .security_middleware import SecurityConfig
 
 
+# Built at import time; the import lock guarantees a single instance
+_SHARED_CONFIG: SecurityConfig = SecurityConfig()
+
+
 class SharedSecurityConfig:
     """
     Singleton manager for security configuration.
@@ -43,11 +53,10 @@ class SharedSecurityConfig:
     
     def _init_security_config(self) -> None:
         """
-        Initialize the security configuration once for all tools.
+        Attach the module-level security configuration shared by all tools.
         """
         try:
-            # Initialize security configuration
-            self._security_config = SecurityConfig()
+            self._security_config = _SHARED_CONFIG
             
             # Log successful initialization
             self._logger.info(
@@ -93,6 +102,7 @@ class SharedSecurityConfig:
                 "max_timeout": self._security_config.max_timeout,
                 "rate_limit_per_minute": self._security_config.rate_limit_per_minute,
                 "output_rate_limit": self._security_config.output_rate_limit,
+                "tool_rate_limit_per_minute": self._security_config.tool_rate_limit_per_minute,
                 "singleton_id": id(self._security_config)  # For debugging shared instance
             }
         except Exception as e:
@@ -104,13 +114,19 @@ class SharedSecurityConfig:
         """
         Reset the singleton instance.
         
-        This method is primarily for testing purposes, allowing tests to
-        create fresh instances with different configurations.
+        This method is primarily for testing purposes, giving tests a fresh
+        SecurityConfig instance. The limits themselves are parsed from the
+        environment when security_middleware is imported, so the new
+        instance has the same values; tests that need other limits should
+        set them on the instance.
         
         Warning: This should not be used in production code.
         """
+        global _SHARED_CONFIG
+        _SHARED_CONFIG = SecurityConfig()
         cls._instance = None
         cls._security_config = None
+        _resolve_shared_stats.cache_clear()
         if cls._logger:
             cls._logger.debug("Security singleton instance reset")
 
@@ -122,8 +138,7 @@ def get_shared_security_config() -> SecurityConfig:
     Returns:
         SecurityConfig: The shared security configuration instance
     """
-    manager = SharedSecurityConfig()
-    return manager.get_security_config()
+    return _SHARED_CONFIG
 
 
 def get_shared_security_config_stats() -> dict:
@@ -133,5 +148,11 @@ def get_shared_security_config_stats() -> dict:
     Returns:
         dict: Security configuration statistics
     """
-    manager = SharedSecurityConfig()
-    return manager.get_security_config_stats()
+    # Copy so callers can't mutate the cached stats
+    return dict(_resolve_shared_stats())
+
+
+@lru_cache(maxsize=1)
+def _resolve_shared_stats() -> dict:
+    """Resolve the shared configuration stats once per singleton lifetime."""
+    return SharedSecurityConfig().get_security_config_stats()
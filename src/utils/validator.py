@@ -0,0 +1,158 @@
+"""Request argument walker for Layer 1 security validation.
+
+This module holds the hot loop behind SecurityMiddleware.validate_request():
+a single iterative pass over the tool arguments that checks string lengths,
+rejects non-JSON value types and keeps a running estimate of the serialized
+input size.
+
+It is deliberately free of logging and middleware state and uses plain type
+annotations, so it can be compiled to a C extension with mypyc. Wheel builds
+do this when the mypyc build hook is enabled:
+
+```bash
+HATCH_BUILD_HOOK_ENABLE_MYPYC=true python -m build --wheel
+```
+
+Without compilation the module runs as ordinary Python with the same API.
+Violations are reported by raising ValidationViolation; the middleware turns
+them into logged SecurityErrors.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+# Approximate repr() overhead used when estimating request size: quotes
+# around strings, quotes/colon/separator around keys, brackets around
+# containers, and a flat allowance for numbers, booleans and None
+STR_OVERHEAD = 2
+KEY_OVERHEAD = 4
+CONTAINER_OVERHEAD = 2
+SCALAR_OVERHEAD = 8
+
+# Value types accepted in tool arguments; anything that is not one of these
+# (or a str/dict/list subclass) is rejected as a dangerous type
+SAFE_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+JSON_TYPES = SAFE_SCALAR_TYPES | {str, dict, list}
+
+
+class ValidationViolation(Exception):
+    """A security limit violated while walking request arguments.
+
+    Attributes:
+        kind: "string_length", "dangerous_type" or "input_size".
+        path: Path to the offending value, e.g. ``a.b[0].c``.
+        size: String length or running input size, for size violations.
+        type_name: Name of the rejected type, for type violations.
+    """
+
+    def __init__(self, kind: str, path: str = "", size: int = 0, type_name: str = "") -> None:
+        super().__init__(kind)
+        self.kind = kind
+        self.path = path
+        self.size = size
+        self.type_name = type_name
+
+
+def format_path(path_stack: List[Any]) -> str:
+    """Render a validation path stack as ``a.b[0].c`` for error messages.
+
+    Args:
+        path_stack: Dict keys (str) and list indices (int) from the root.
+
+    Returns:
+        Dotted path string, empty for the root object.
+    """
+    parts: List[str] = []
+    for part in path_stack:
+        if type(part) is int:
+            parts.append(f"[{part}]")
+        elif parts:
+            parts.append(f".{part}")
+        else:
+            parts.append(str(part))
+    return "".join(parts)
+
+
+def _entry_path(entry: Optional[Tuple[Any, Any, Any]]) -> str:
+    """Render the path of a walk stack entry from its parent chain."""
+    parts: List[Any] = []
+    while entry is not None and entry[2] is not None:
+        parts.append(entry[1])
+        entry = entry[2]
+    parts.reverse()
+    return format_path(parts)
+
+
+def walk(obj: object, max_str: int, max_in: float) -> int:
+    """Validate nested arguments in one iterative traversal.
+
+    Nodes are dispatched on their exact type; subclasses of str/dict/list
+    take the isinstance path, and any other type outside the JSON scalar
+    whitelist is rejected. The walk uses an explicit stack of
+    ``(value, key, parent_entry)`` tuples rather than recursion, and the
+    path to a node is only rendered when reporting a violation.
+
+    Args:
+        obj: Object to validate (can be nested dict/list).
+        max_str: Maximum length of any string value.
+        max_in: Maximum estimated serialized size in bytes.
+
+    Returns:
+        Estimated serialized size of obj in bytes.
+
+    Raises:
+        ValidationViolation: If any size, length or type check fails.
+    """
+    size = 0
+    stack: List[Tuple[Any, Any, Any]] = [(obj, None, None)]
+
+    while stack:
+        entry = stack.pop()
+        value = entry[0]
+        t = type(value)
+        if t not in JSON_TYPES:
+            # Rare: subclasses of the JSON containers/strings; anything
+            # else is rejected below
+            if isinstance(value, str):
+                t = str
+            elif isinstance(value, dict):
+                t = dict
+            elif isinstance(value, list):
+                t = list
+
+        if t is str:
+            if len(value) > max_str:
+                raise ValidationViolation("string_length", _entry_path(entry), len(value))
+            size += len(value) + STR_OVERHEAD
+
+        elif t is dict:
+            size += CONTAINER_OVERHEAD
+            # Pushed in reverse so items are visited in their original order
+            for key, item in reversed(value.items()):
+                if type(key) is not str:
+                    # Keep ints in paths unambiguous as list indices
+                    key = str(key)
+                size += len(key) + KEY_OVERHEAD
+                stack.append((item, key, entry))
+
+        elif t is list:
+            size += CONTAINER_OVERHEAD
+            for i in range(len(value) - 1, -1, -1):
+                stack.append((value[i], i, entry))
+
+        elif t in SAFE_SCALAR_TYPES:
+            size += SCALAR_OVERHEAD
+
+        else:
+            raise ValidationViolation(
+                "dangerous_type", _entry_path(entry), type_name=type(value).__name__
+            )
+
+        if size > max_in:
+            raise ValidationViolation("input_size", size=size)
+
+    return size
+
+
+__all__ = ["ValidationViolation", "format_path", "walk"]
@@ -2,18 +2,53 @@
 
 import json
 import os
+import shutil
+import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 from typing import Any, Dict, List, Optional
 
 import pytest
 
+from utils import data_path, json_fast
 
-@pytest.fixture
-def mock_knowledge_base():
-    """Mock SOLVE-IT KnowledgeBase with sample data."""
-    mock_kb = MagicMock()
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
+
+# RAM-backed location for the session data layouts, when available
+_SHM_DIR = "/dev/shm"
+
+
+if uvloop is not None:
+    
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed.
+        
+        Only defined with uvloop available, since pytest-asyncio rejects an
+        empty result; otherwise the default asyncio loop is used. The hook
+        needs pytest-asyncio 1.4 or later; older versions fail at startup
+        rather than silently ignoring it.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def reset_data_path_validation_cache(monkeypatch):
+    """Give each test a fresh validate_solve_it_data_path() memo."""
+    monkeypatch.setattr(data_path, "_validate_cache", {})
+
+
+@pytest.fixture(scope="session")
+def mock_knowledge_base_returns():
+    """Canonical return values for the mock KnowledgeBase, built once per session.
     
+    Maps each KnowledgeBase method name to what it returns. Tests must treat
+    these values as read-only; set a new return_value on the mock instead.
+    """
     # Sample test data
     sample_technique = {
         "id": "T1001",
@@ -35,64 +70,88 @@ def mock_knowledge_base():
         "description": "A test mitigation for unit testing"
     }
     
-    # Mock all the methods
-    mock_kb.get_technique.return_value = sample_technique
-    mock_kb.get_weakness.return_value = sample_weakness
-    mock_kb.get_mitigation.return_value = sample_mitigation
-    
-    # Mock search results
-    mock_kb.search.return_value = {
-        "techniques": [sample_technique],
-        "weaknesses": [sample_weakness],
-        "mitigations": [sample_mitigation]
+    return {
+        "get_technique": sample_technique,
+        "get_weakness": sample_weakness,
+        "get_mitigation": sample_mitigation,
+        
+        # Search results
+        "search": {
+            "techniques": [sample_technique],
+            "weaknesses": [sample_weakness],
+            "mitigations": [sample_mitigation]
+        },
+        
+        # Relationship methods
+        "get_weaknesses_for_technique": [sample_weakness],
+        "get_mitigations_for_weakness": [sample_mitigation],
+        "get_techniques_for_weakness": [sample_technique],
+        "get_weaknesses_for_mitigation": [sample_weakness],
+        "get_techniques_for_mitigation": [sample_technique],
+        
+        # Objective methods
+        "list_objectives": ["Test Objective 1", "Test Objective 2"],
+        "get_techniques_for_objective": [sample_technique],
+        "list_available_mappings": ["solve-it.json", "carrier.json"],
+        "load_objective_mapping": True,
+        
+        # List methods
+        "list_techniques": ["T1001", "T1002"],
+        "list_weaknesses": ["W1001", "W1002"],
+        "list_mitigations": ["M1001", "M1002"],
+        
+        # Bulk retrieval methods
+        "get_all_techniques_with_name_and_id": [
+            {"id": "T1001", "name": "Test Technique 1"},
+            {"id": "T1002", "name": "Test Technique 2"}
+        ],
+        "get_all_weaknesses_with_name_and_id": [
+            {"id": "W1001", "name": "Test Weakness 1"},
+            {"id": "W1002", "name": "Test Weakness 2"}
+        ],
+        "get_all_mitigations_with_name_and_id": [
+            {"id": "M1001", "name": "Test Mitigation 1"},
+            {"id": "M1002", "name": "Test Mitigation 2"}
+        ],
+        
+        # Full detail methods
+        "get_all_techniques_with_full_detail": [sample_technique],
+        "get_all_weaknesses_with_full_detail": [sample_weakness],
+        "get_all_mitigations_with_full_detail": [sample_mitigation],
     }
+
+
+@pytest.fixture(scope="session")
+def session_knowledge_base():
+    """The MagicMock behind mock_knowledge_base, built once per session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_knowledge_base(session_knowledge_base, mock_knowledge_base_returns):
+    """Mock SOLVE-IT KnowledgeBase with sample data.
     
-    # Mock relationship methods
-    mock_kb.get_weaknesses_for_technique.return_value = [sample_weakness]
-    mock_kb.get_mitigations_for_weakness.return_value = [sample_mitigation]
-    mock_kb.get_techniques_for_weakness.return_value = [sample_technique]
-    mock_kb.get_weaknesses_for_mitigation.return_value = [sample_weakness]
-    mock_kb.get_techniques_for_mitigation.return_value = [sample_technique]
-    
-    # Mock objective methods
-    mock_kb.list_objectives.return_value = ["Test Objective 1", "Test Objective 2"]
-    mock_kb.get_techniques_for_objective.return_value = [sample_technique]
-    mock_kb.list_available_mappings.return_value = ["solve-it.json", "carrier.json"]
-    mock_kb.load_objective_mapping.return_value = True
+    The session mock is reset and reconfigured for each test, so call
+    records and side_effect/return_value overrides don't leak between tests.
+    """
+    mock_kb = session_knowledge_base
+    mock_kb.reset_mock(return_value=True, side_effect=True)
+    mock_kb.configure_mock(**{
+        f"{method}.return_value": value
+        for method, value in mock_knowledge_base_returns.items()
+    })
     mock_kb.current_mapping_name = "solve-it.json"
-    
-    # Mock list methods
-    mock_kb.list_techniques.return_value = ["T1001", "T1002"]
-    mock_kb.list_weaknesses.return_value = ["W1001", "W1002"]
-    mock_kb.list_mitigations.return_value = ["M1001", "M1002"]
-    
-    # Mock bulk retrieval methods
-    mock_kb.get_all_techniques_with_name_and_id.return_value = [
-        {"id": "T1001", "name": "Test Technique 1"},
-        {"id": "T1002", "name": "Test Technique 2"}
-    ]
-    mock_kb.get_all_weaknesses_with_name_and_id.return_value = [
-        {"id": "W1001", "name": "Test Weakness 1"},
-        {"id": "W1002", "name": "Test Weakness 2"}
-    ]
-    mock_kb.get_all_mitigations_with_name_and_id.return_value = [
-        {"id": "M1001", "name": "Test Mitigation 1"},
-        {"id": "M1002", "name": "Test Mitigation 2"}
-    ]
-    
-    # Mock full detail methods
-    mock_kb.get_all_techniques_with_full_detail.return_value = [sample_technique]
-    mock_kb.get_all_weaknesses_with_full_detail.return_value = [sample_weakness]
-    mock_kb.get_all_mitigations_with_full_detail.return_value = [sample_mitigation]
-    
     return mock_kb
 
 
-@pytest.fixture
-def mock_data_path(tmp_path):
-    """Mock data path with temporary directory."""
+@pytest.fixture(scope="session")
+def mock_data_path(tmp_path_factory):
+    """Mock data path with temporary directory.
+    
+    Tests only read these files, so the directory is written once per session.
+    """
     # Create a temporary SOLVE-IT data structure
-    data_dir = tmp_path / "data"
+    data_dir = tmp_path_factory.mktemp("solveit") / "data"
     data_dir.mkdir()
     
     # Create sample data files
@@ -108,6 +167,86 @@ def mock_data_path(tmp_path):
     return str(data_dir)
 
 
+_SOLVEIT_DATA_DIRS = ("techniques", "weaknesses", "mitigations")
+
+
+def _make_solveit_data_dir(root: Path, with_json: bool = True, skip_dir: Optional[str] = None) -> Path:
+    """Create root/solve-it-main/data with the standard layout, minus the given parts."""
+    data_dir = root / "solve-it-main" / "data"
+    data_dir.mkdir(parents=True)
+    if with_json:
+        (data_dir / "solve-it.json").write_text('{"test": "data"}')
+    for name in _SOLVEIT_DATA_DIRS:
+        if name != skip_dir:
+            (data_dir / name).mkdir()
+    return data_dir
+
+
+def copy_solveit_layout(src: Path, dst: Path) -> Path:
+    """Copy a session data layout to dst for a test that needs to modify it.
+    
+    Files are hard-linked rather than copied where src and dst share a
+    filesystem, so only the directory tree is duplicated; rewrite files with
+    replace-then-write, not in place.
+    """
+    shutil.copytree(src, dst, copy_function=_link_or_copy)
+    return dst
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, copying instead across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+# Read-only data directory layouts, built once per session. Tests must not
+# modify them; use tmp_path for anything that does.
+
+@pytest.fixture(scope="session")
+def session_layout_root(tmp_path_factory):
+    """Directory holding the session data layouts, on tmpfs when available.
+    
+    The data path tests scan these trees over and over; on tmpfs they never
+    reach the block device. The directory is unique to this run, so
+    concurrent runs do not clear each other's layouts.
+    """
+    if not (os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK)):
+        yield tmp_path_factory.mktemp("solveit_layouts")
+        return
+    root = Path(tempfile.mkdtemp(dir=_SHM_DIR, prefix="pytest-solveit-"))
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def session_valid_data_dir(session_layout_root):
+    """A complete SOLVE-IT data directory (solve-it-main/data)."""
+    return _make_solveit_data_dir(session_layout_root / "valid")
+
+
+@pytest.fixture(scope="session")
+def session_incomplete_data_dirs(session_layout_root):
+    """SOLVE-IT data directories each missing one artifact, keyed by its name."""
+    layouts = {"solve-it.json": _make_solveit_data_dir(
+        session_layout_root / "no_json", with_json=False
+    )}
+    for name in _SOLVEIT_DATA_DIRS:
+        layouts[name] = _make_solveit_data_dir(
+            session_layout_root / f"no_{name}", skip_dir=name
+        )
+    return layouts
+
+
+@pytest.fixture
+def clean_solveit_env(monkeypatch):
+    """Unset SOLVE_IT_DATA_PATH so a developer's setting can't leak into tests."""
+    monkeypatch.delenv("SOLVE_IT_DATA_PATH", raising=False)
+
+
 @pytest.fixture
 def mock_solve_it_environment(mock_data_path, mock_knowledge_base):
     """Mock the entire SOLVE-IT environment."""
@@ -123,11 +262,98 @@ def mock_solve_it_environment(mock_data_path, mock_knowledge_base):
         mock_get_path.return_value = mock_data_path
         mock_validate.return_value = True
         
-        yield {
-            'data_path': mock_data_path,
-            'knowledge_base': mock_knowledge_base,
-            'kb_class': mock_solve_it_library.KnowledgeBase
-        }
+        yield SimpleNamespace(
+            data_path=mock_data_path,
+            knowledge_base=mock_knowledge_base,
+            kb_class=mock_solve_it_library.KnowledgeBase,
+        )
+
+
+@contextmanager
+def stub_tools(*tool_classes):
+    """Stub _resolve_data_path and _init_knowledge_base for the given tool classes.
+    
+    Each method is patched on the class that defines it, so tools sharing
+    SolveItBaseTool's implementation are covered by a single patch.
+    """
+    patched: Dict[type, Dict[str, Any]] = {}
+    for tool_class in tool_classes:
+        for attr in ('_resolve_data_path', '_init_knowledge_base'):
+            patched.setdefault(_defining_class(tool_class, attr), {})[attr] = DEFAULT
+    with ExitStack() as stack:
+        for owner, attrs in patched.items():
+            stack.enter_context(patch.multiple(owner, **attrs))
+        yield
+
+
+def _defining_class(cls: type, attr: str) -> type:
+    """Return the class in cls's MRO whose own namespace defines attr."""
+    return next(klass for klass in cls.__mro__ if attr in vars(klass))
+
+
+@pytest.fixture(scope="class")
+def stub_tool_init():
+    """Stub out data path resolution and KB loading for every SOLVE-IT tool.
+    
+    Patched once per test class on SolveItBaseTool rather than per tool
+    class inside each test; tests then attach the mock knowledge base.
+    Plain no-op functions are cheaper to call than MagicMocks.
+    """
+    from tools.solveit_base import SolveItBaseTool
+    
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(SolveItBaseTool, "_resolve_data_path", lambda self, custom_path=None: None)
+    monkeypatch.setattr(SolveItBaseTool, "_init_knowledge_base", lambda self: None)
+    yield
+    monkeypatch.undo()
+
+
+class _ToolCache(dict):
+    """Tool instances keyed by class, built on first lookup."""
+    
+    def __missing__(self, tool_class):
+        # Shared-KB mode: no data path or knowledge base needed
+        tool = self[tool_class] = tool_class(init_kb=False)
+        return tool
+
+
+@pytest.fixture(scope="session")
+def shared_tools():
+    """One instance of each tool class for the whole session, e.g. shared_tools[SearchTool].
+    
+    Only for tests that read tool metadata; tests that attach a knowledge
+    base or invoke the tool must build their own instance.
+    """
+    return _ToolCache()
+
+
+@pytest.fixture(scope="session")
+def real_solveit_tools():
+    """Real-library tool instances shared by the whole test session, keyed by tool name.
+    
+    Each tool loads the SOLVE-IT knowledge base on construction, so they are
+    built once instead of per test. Skips dependent tests if the library
+    or data is unavailable.
+    """
+    from tools.solveit_tools import (
+        GetDatabaseDescriptionTool,
+        GetMitigationDetailsTool,
+        GetTechniqueDetailsTool,
+        GetWeaknessDetailsTool,
+        SearchTool,
+    )
+    
+    try:
+        tools = [
+            GetDatabaseDescriptionTool(),
+            SearchTool(),
+            GetTechniqueDetailsTool(),
+            GetWeaknessDetailsTool(),
+            GetMitigationDetailsTool(),
+        ]
+    except Exception as e:
+        pytest.skip(f"Real library integration failed: {e}")
+    return {tool.name: tool for tool in tools}
 
 
 @pytest.fixture
@@ -209,11 +435,32 @@ def mcp_server_config():
 def validate_json_response(response: str) -> Dict[str, Any]:
     """Validate that a response is valid JSON and return parsed data."""
     try:
-        return json.loads(response)
+        return json_fast.loads(response)
     except json.JSONDecodeError as e:
         pytest.fail(f"Response is not valid JSON: {e}\nResponse: {response}")
 
 
+def assert_json_keys(response: str, required_keys: List[str]) -> None:
+    """Cheaply assert that a JSON response mentions each key, without parsing it.
+    
+    Only checks that each '"key"' appears in the raw text; parse with
+    validate_json_response() when values need to be inspected.
+    """
+    assert isinstance(response, str)
+    missing = [key for key in required_keys if f'"{key}"' not in response]
+    assert not missing, f"Response is missing keys {missing}"
+
+
+def failing_knowledge_base(method: str, error: Optional[Exception] = None) -> Mock:
+    """Mock knowledge base whose one method raises, for error-path tests.
+    
+    The KnowledgeBase class lives in the optional solve_it_library, so the
+    mock is specced by the single method the tool under test calls.
+    """
+    error = error if error is not None else Exception("Test error")
+    return Mock(spec=[method], **{f"{method}.side_effect": error})
+
+
 def assert_error_response(response: str, expected_error_type: str = None):
     """Assert that a response contains an error message."""
     assert isinstance(response, str)
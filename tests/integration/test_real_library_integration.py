@@ -1,23 +1,23 @@
 """Integration tests using the real SOLVE-IT library."""
 
-import json
 import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 
 from tools.solveit_tools import (
-    GetDatabaseDescriptionTool,
     GetDatabaseDescriptionParams,
-    SearchTool,
     SearchParams,
-    GetTechniqueDetailsTool,
     GetTechniqueDetailsParams,
-    GetWeaknessDetailsTool,
     GetWeaknessDetailsParams,
-    GetMitigationDetailsTool,
     GetMitigationDetailsParams,
 )
+from utils import json_fast
+from conftest import assert_json_keys
+
+# Grouped so that, under `pytest -n auto --dist loadgroup`, these modules
+# share one worker and its session fixtures while unit tests fan out
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("solveit_integration")]
 
 
 class TestRealLibraryIntegration:
@@ -40,10 +40,10 @@ class TestRealLibraryIntegration:
         except ImportError as e:
             pytest.skip(f"solve_it_library not available: {e}")
     
-    def test_get_database_description_tool_with_real_library(self):
+    def test_get_database_description_tool_with_real_library(self, real_solveit_tools):
         """Test GetDatabaseDescriptionTool with real library."""
         try:
-            tool = GetDatabaseDescriptionTool()
+            tool = real_solveit_tools["get_database_description"]
             
             # This should work if the library is available
             assert tool.name == "get_database_description"
@@ -53,18 +53,18 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real library integration failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_get_database_description_invoke_with_real_library(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_get_database_description_invoke_with_real_library(self, real_solveit_tools):
         """Test GetDatabaseDescriptionTool invoke with real library."""
         try:
-            tool = GetDatabaseDescriptionTool()
+            tool = real_solveit_tools["get_database_description"]
             params = GetDatabaseDescriptionParams()
             
             result = await tool.invoke(params)
             
             # Validate response structure
             assert isinstance(result, str)
-            data = json.loads(result)
+            data = json_fast.loads(result)
             
             assert "database_name" in data
             assert "description" in data
@@ -89,18 +89,18 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real library integration failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_search_tool_with_real_library(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_search_tool_with_real_library(self, real_solveit_tools):
         """Test SearchTool with real library."""
         try:
-            tool = SearchTool()
+            tool = real_solveit_tools["search"]
             params = SearchParams(keywords="forensic")
             
             result = await tool.invoke(params)
             
             # Validate response structure
             assert isinstance(result, str)
-            data = json.loads(result)
+            data = json_fast.loads(result)
             
             assert "techniques" in data
             assert "weaknesses" in data
@@ -113,25 +113,16 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real library integration failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_technique_details_tool_with_real_library(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_technique_details_tool_with_real_library(self, real_solveit_tools):
         """Test GetTechniqueDetailsTool with real library."""
         try:
-            # First, get a list of techniques to test with
-            desc_tool = GetDatabaseDescriptionTool()
-            desc_params = GetDatabaseDescriptionParams()
-            desc_result = await desc_tool.invoke(desc_params)
-            desc_data = json.loads(desc_result)
-            
-            # Skip if no techniques
-            if desc_data["statistics"]["techniques"] == 0:
-                pytest.skip("No techniques available in database")
-            
-            # Try to get details for a technique (we'll use a search to find one)
-            search_tool = SearchTool()
+            # Find a technique to test with; the search comes back empty
+            # (and the test skips) if the database has no techniques
+            search_tool = real_solveit_tools["search"]
             search_params = SearchParams(keywords="analysis", item_types=["techniques"])
             search_result = await search_tool.invoke(search_params)
-            search_data = json.loads(search_result)
+            search_data = json_fast.loads(search_result)
             
             if len(search_data["techniques"]) == 0:
                 pytest.skip("No techniques found in search")
@@ -139,14 +130,14 @@ class TestRealLibraryIntegration:
             # Get details for the first technique
             technique_id = search_data["techniques"][0]["id"]
             
-            tool = GetTechniqueDetailsTool()
+            tool = real_solveit_tools["get_technique_details"]
             params = GetTechniqueDetailsParams(technique_id=technique_id)
             
             result = await tool.invoke(params)
             
             # Validate response structure
             assert isinstance(result, str)
-            data = json.loads(result)
+            data = json_fast.loads(result)
             
             assert "id" in data
             assert "name" in data
@@ -155,15 +146,15 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real library integration failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_weakness_details_tool_with_real_library(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_weakness_details_tool_with_real_library(self, real_solveit_tools):
         """Test GetWeaknessDetailsTool with real library."""
         try:
             # First, search for weaknesses
-            search_tool = SearchTool()
+            search_tool = real_solveit_tools["search"]
             search_params = SearchParams(keywords="limitation", item_types=["weaknesses"])
             search_result = await search_tool.invoke(search_params)
-            search_data = json.loads(search_result)
+            search_data = json_fast.loads(search_result)
             
             if len(search_data["weaknesses"]) == 0:
                 pytest.skip("No weaknesses found in search")
@@ -171,14 +162,14 @@ class TestRealLibraryIntegration:
             # Get details for the first weakness
             weakness_id = search_data["weaknesses"][0]["id"]
             
-            tool = GetWeaknessDetailsTool()
+            tool = real_solveit_tools["get_weakness_details"]
             params = GetWeaknessDetailsParams(weakness_id=weakness_id)
             
             result = await tool.invoke(params)
             
             # Validate response structure
             assert isinstance(result, str)
-            data = json.loads(result)
+            data = json_fast.loads(result)
             
             assert "id" in data
             assert "name" in data
@@ -187,15 +178,15 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real library integration failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_mitigation_details_tool_with_real_library(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_mitigation_details_tool_with_real_library(self, real_solveit_tools):
         """Test GetMitigationDetailsTool with real library."""
         try:
             # First, search for mitigations
-            search_tool = SearchTool()
+            search_tool = real_solveit_tools["search"]
             search_params = SearchParams(keywords="training", item_types=["mitigations"])
             search_result = await search_tool.invoke(search_params)
-            search_data = json.loads(search_result)
+            search_data = json_fast.loads(search_result)
             
             if len(search_data["mitigations"]) == 0:
                 pytest.skip("No mitigations found in search")
@@ -203,14 +194,14 @@ class TestRealLibraryIntegration:
             # Get details for the first mitigation
             mitigation_id = search_data["mitigations"][0]["id"]
             
-            tool = GetMitigationDetailsTool()
+            tool = real_solveit_tools["get_mitigation_details"]
             params = GetMitigationDetailsParams(mitigation_id=mitigation_id)
             
             result = await tool.invoke(params)
             
             # Validate response structure
             assert isinstance(result, str)
-            data = json.loads(result)
+            data = json_fast.loads(result)
             
             assert "id" in data
             assert "name" in data
@@ -242,16 +233,10 @@ class TestRealLibraryIntegration:
         except Exception as e:
             pytest.skip(f"Real environment data path resolution failed: {e}")
     
-    def test_multiple_tools_initialization(self):
+    def test_multiple_tools_initialization(self, real_solveit_tools):
         """Test that multiple tools can be initialized simultaneously."""
         try:
-            tools = [
-                GetDatabaseDescriptionTool(),
-                SearchTool(),
-                GetTechniqueDetailsTool(),
-                GetWeaknessDetailsTool(),
-                GetMitigationDetailsTool(),
-            ]
+            tools = list(real_solveit_tools.values())
             
             # All tools should be initialized successfully
             for tool in tools:
@@ -271,14 +256,17 @@ class TestRealLibraryIntegration:
 class TestRealLibraryPerformance:
     """Performance tests using the real SOLVE-IT library."""
     
-    @pytest.mark.asyncio
-    async def test_search_performance(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_search_performance(self, real_solveit_tools):
         """Test search performance with real library."""
         try:
             import time
             
-            tool = SearchTool()
+            tool = real_solveit_tools["search"]
             params = SearchParams(keywords="forensic")
+            # The shared tool may have cached this query in an earlier test;
+            # time a real search, not a cache hit
+            tool.clear_result_cache()
             
             start_time = time.time()
             result = await tool.invoke(params)
@@ -286,42 +274,46 @@ class TestRealLibraryPerformance:
             
             duration = end_time - start_time
             
-            # Search should complete within reasonable time (5 seconds)
-            assert duration < 5.0, f"Search took too long: {duration:.2f}s"
+            # Search should complete within reasonable time (2 seconds)
+            assert duration < 2.0, f"Search took too long: {duration:.2f}s"
             
-            # Result should be valid
-            assert isinstance(result, str)
-            data = json.loads(result)
-            assert "techniques" in data
+            # Result should contain the expected sections
+            assert_json_keys(result, ["techniques", "weaknesses", "mitigations"])
             
         except Exception as e:
             pytest.skip(f"Real library performance test failed: {e}")
     
-    @pytest.mark.asyncio
-    async def test_bulk_operations_performance(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_bulk_operations_performance(self, real_solveit_tools):
         """Test bulk operations performance with real library."""
         try:
+            import asyncio
             import time
             
-            # Test multiple operations in sequence
+            # Independent operations, run concurrently
             tools_and_params = [
-                (GetDatabaseDescriptionTool(), GetDatabaseDescriptionParams()),
-                (SearchTool(), SearchParams(keywords="analysis")),
-                (SearchTool(), SearchParams(keywords="forensic")),
+                (real_solveit_tools["get_database_description"], GetDatabaseDescriptionParams()),
+                (real_solveit_tools["search"], SearchParams(keywords="analysis")),
+                (real_solveit_tools["search"], SearchParams(keywords="forensic")),
             ]
+            # Time real searches rather than results cached by earlier tests
+            real_solveit_tools["search"].clear_result_cache()
             
             start_time = time.time()
             
-            for tool, params in tools_and_params:
-                result = await tool.invoke(params)
+            results = await asyncio.gather(
+                *(tool.invoke(params) for tool, params in tools_and_params)
+            )
+            
+            for result in results:
                 assert isinstance(result, str)
-                json.loads(result)  # Validate JSON
+                json_fast.loads(result)  # Validate JSON
             
             end_time = time.time()
             duration = end_time - start_time
             
-            # All operations should complete within reasonable time (10 seconds)
-            assert duration < 10.0, f"Bulk operations took too long: {duration:.2f}s"
+            # All operations should complete within reasonable time (5 seconds)
+            assert duration < 5.0, f"Bulk operations took too long: {duration:.2f}s"
             
         except Exception as e:
             pytest.skip(f"Real library bulk performance test failed: {e}")
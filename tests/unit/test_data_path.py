@@ -1,53 +1,48 @@
 """Unit tests for data path resolution utilities."""
 
+import logging
 import os
 import tempfile
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from conftest import copy_solveit_layout
 from solveit_mcp_server.utils.data_path import (
+    _read_cached_data_path,
+    _write_cached_data_path,
     get_solve_it_data_path,
     validate_solve_it_data_path
 )
 
+pytestmark = pytest.mark.usefixtures("clean_solveit_env")
 
+
+@pytest.mark.filesystem
 class TestGetSolveItDataPath:
     """Test the get_solve_it_data_path function."""
     
-    def test_environment_variable_path(self):
+    def test_environment_variable_path(self, monkeypatch):
         """Test that environment variable takes precedence."""
         test_path = "/custom/solve-it/path"
-        with patch.dict(os.environ, {'SOLVE_IT_DATA_PATH': test_path}):
-            with patch('solveit_mcp_server.utils.data_path.validate_solve_it_data_path', return_value=True):
-                result = get_solve_it_data_path()
-                assert result == test_path
+        monkeypatch.setenv('SOLVE_IT_DATA_PATH', test_path)
+        with patch('solveit_mcp_server.utils.data_path.validate_solve_it_data_path', return_value=True):
+            result = get_solve_it_data_path()
+            assert result == test_path
     
-    def test_custom_path_provided(self, tmp_path):
+    def test_custom_path_provided(self, session_valid_data_dir):
         """Test that custom path takes precedence."""
-        # Create a valid data directory
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
+        data_dir = session_valid_data_dir
         
-        result = get_solve_it_data_path(str(data_dir))
+        result = get_solve_it_data_path(data_dir)
         assert result == str(data_dir)
     
-    def test_custom_path_with_parent_directory(self, tmp_path):
+    def test_custom_path_with_parent_directory(self, session_valid_data_dir):
         """Test custom path pointing to parent directory."""
-        # Create a solve-it directory with data subdirectory
-        solve_it_dir = tmp_path / "solve-it-main"
-        solve_it_dir.mkdir()
-        data_dir = solve_it_dir / "data"
-        data_dir.mkdir()
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
+        data_dir = session_valid_data_dir
+        solve_it_dir = data_dir.parent
         
-        result = get_solve_it_data_path(str(solve_it_dir))
+        result = get_solve_it_data_path(solve_it_dir)
         assert result == str(data_dir)
     
     def test_invalid_custom_path_raises_error(self):
@@ -55,100 +50,98 @@ class TestGetSolveItDataPath:
         with pytest.raises(FileNotFoundError, match="Custom path .* does not exist"):
             get_solve_it_data_path("/invalid/path")
     
-    def test_environment_variable_with_data_subdir(self, tmp_path):
+    def test_environment_variable_with_data_subdir(self, session_valid_data_dir, monkeypatch):
         """Test environment variable pointing to parent with data subdir."""
-        # Create a solve-it directory with data subdirectory
-        solve_it_dir = tmp_path / "solve-it-main"
-        solve_it_dir.mkdir()
-        data_dir = solve_it_dir / "data"
-        data_dir.mkdir()
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
+        data_dir = session_valid_data_dir
+        solve_it_dir = data_dir.parent
         
-        with patch.dict(os.environ, {'SOLVE_IT_DATA_PATH': str(solve_it_dir)}):
-            result = get_solve_it_data_path()
-            assert result == str(data_dir)
+        monkeypatch.setenv('SOLVE_IT_DATA_PATH', str(solve_it_dir))
+        result = get_solve_it_data_path()
+        assert result == str(data_dir)
     
-    def test_no_path_found_raises_error(self):
+    def test_no_path_found_raises_error(self, monkeypatch):
         """Test that error is raised when no path is found."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('pathlib.Path.exists', return_value=False):
-                with pytest.raises(FileNotFoundError, match="SOLVE-IT data directory not found"):
-                    get_solve_it_data_path()
+        monkeypatch.setenv("SOLVE_IT_DISABLE_PATH_CACHE", "1")
+        # The auto-detected locations are fixed relative to the package, so
+        # stub the probe at its import site rather than pathlib globally
+        monkeypatch.setattr(
+            "solveit_mcp_server.utils.data_path._probe_solve_it_data", lambda parent: None
+        )
+        with pytest.raises(FileNotFoundError, match="SOLVE-IT data directory not found"):
+            get_solve_it_data_path()
 
 
+@pytest.mark.filesystem
 class TestValidateSolveItDataPath:
     """Test the validate_solve_it_data_path function."""
     
-    def test_valid_path_with_required_files(self, tmp_path):
+    def test_valid_path_with_required_files(self, session_valid_data_dir):
         """Test validation with all required files present."""
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        
-        # Create required files
-        (data_dir / "solve-it.json").write_text('{"test": "data"}')
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
-        
-        assert validate_solve_it_data_path(str(data_dir)) is True
+        assert validate_solve_it_data_path(session_valid_data_dir) is True
     
     def test_nonexistent_path(self):
         """Test validation with nonexistent path."""
         assert validate_solve_it_data_path("/nonexistent/path") is False
     
-    def test_missing_solve_it_json(self, tmp_path):
-        """Test validation with missing solve-it.json file."""
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        
-        # Create directories but not solve-it.json
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
+    @pytest.mark.parametrize("omit", ["techniques", "weaknesses", "mitigations"])
+    def test_missing_required_artifact(self, session_incomplete_data_dirs, omit):
+        """Test validation when a required directory is missing."""
+        assert validate_solve_it_data_path(session_incomplete_data_dirs[omit]) is False
+    
+    def test_missing_mapping_files_only_warns(self, session_incomplete_data_dirs, caplog):
+        """Test that objective mapping files are optional and only logged."""
+        with caplog.at_level(logging.WARNING):
+            assert validate_solve_it_data_path(session_incomplete_data_dirs["solve-it.json"]) is True
         
-        assert validate_solve_it_data_path(str(data_dir)) is False
+        assert "No objective mapping files" in caplog.text
     
-    def test_missing_techniques_directory(self, tmp_path):
-        """Test validation with missing techniques directory."""
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
+    def test_result_memoized_within_ttl(self, tmp_path, monkeypatch, session_valid_data_dir):
+        """Test that a repeated validation within the TTL skips the filesystem."""
+        data_dir = copy_solveit_layout(session_valid_data_dir, tmp_path / "data")
+        assert validate_solve_it_data_path(data_dir) is True
         
-        # Create solve-it.json but not techniques directory
-        (data_dir / "solve-it.json").write_text('{"test": "data"}')
-        (data_dir / "weaknesses").mkdir()
-        (data_dir / "mitigations").mkdir()
+        (data_dir / "techniques").rmdir()
+        assert validate_solve_it_data_path(data_dir) is True
         
-        assert validate_solve_it_data_path(str(data_dir)) is False
+        monkeypatch.setattr("solveit_mcp_server.utils.data_path._VALIDATE_CACHE_TTL", 0.0)
+        assert validate_solve_it_data_path(data_dir) is False
     
-    def test_missing_weaknesses_directory(self, tmp_path):
-        """Test validation with missing weaknesses directory."""
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        
-        # Create solve-it.json but not weaknesses directory
-        (data_dir / "solve-it.json").write_text('{"test": "data"}')
-        (data_dir / "techniques").mkdir()
-        (data_dir / "mitigations").mkdir()
+    def test_file_instead_of_directory(self, session_valid_data_dir):
+        """Test validation when path points to a file instead of directory."""
+        test_file = session_valid_data_dir / "solve-it.json"
         
-        assert validate_solve_it_data_path(str(data_dir)) is False
+        assert validate_solve_it_data_path(test_file) is False
+
+
+@pytest.mark.filesystem
+class TestDataPathCache:
+    """Test the on-disk cache for auto-detected data paths."""
     
-    def test_missing_mitigations_directory(self, tmp_path):
-        """Test validation with missing mitigations directory."""
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
+    def test_cache_round_trip(self, tmp_path, session_valid_data_dir):
+        """Test that a written path is returned on the next lookup."""
+        data_dir = session_valid_data_dir
         
-        # Create solve-it.json but not mitigations directory
-        (data_dir / "solve-it.json").write_text('{"test": "data"}')
-        (data_dir / "techniques").mkdir()
-        (data_dir / "weaknesses").mkdir()
+        with patch('solveit_mcp_server.utils.data_path._PATH_CACHE_DIR', tmp_path / "cache"):
+            assert _read_cached_data_path() is None
+            _write_cached_data_path(str(data_dir))
+            assert _read_cached_data_path() == str(data_dir)
+    
+    def test_cache_invalidated_when_directory_changes(self, tmp_path, session_valid_data_dir):
+        """Test that a cached path is ignored once its mtime changes."""
+        data_dir = copy_solveit_layout(session_valid_data_dir, tmp_path / "data")
         
-        assert validate_solve_it_data_path(str(data_dir)) is False
+        with patch('solveit_mcp_server.utils.data_path._PATH_CACHE_DIR', tmp_path / "cache"):
+            _write_cached_data_path(str(data_dir))
+            os.utime(data_dir, (1, 1))
+            assert _read_cached_data_path() is None
     
-    def test_file_instead_of_directory(self, tmp_path):
-        """Test validation when path points to a file instead of directory."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
+    def test_unknown_home_directory_is_a_cache_miss(self, monkeypatch, session_valid_data_dir):
+        """Test that the cache is skipped when no home directory can be found."""
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+        
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr("solveit_mcp_server.utils.data_path.Path.home", no_home)
         
-        assert validate_solve_it_data_path(str(test_file)) is False
+        _write_cached_data_path(str(session_valid_data_dir))
+        assert _read_cached_data_path() is None
@@ -0,0 +1,378 @@
+"""Unit tests for the logging pipeline: formatters, filters and queue handling."""
+
+import copy
+import json
+import logging
+import pickle
+import queue
+import sys
+
+import pytest
+
+from solveit_mcp_server.utils import logging as solveit_logging
+from solveit_mcp_server.utils.logging import (
+    BloomDedupFilter,
+    CorrelationFilter,
+    DedupFilter,
+    LazyLogger,
+    LogConfig,
+    SamplingFilter,
+    StructuredFormatter,
+    configure_logging,
+    get_logger,
+    reset_correlation_id,
+    set_correlation_id,
+)
+
+
+class _Clock:
+    """Stand-in for time.monotonic() that tests advance by hand."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive time.monotonic() as seen by utils.logging."""
+    fake = _Clock()
+    monkeypatch.setattr(solveit_logging.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger after a test calls configure_logging()."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    solveit_logging._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _record(message, level=logging.INFO, name="solveit.test", args=None, **extra):
+    record = logging.LogRecord(name, level, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructuredFormatter:
+    """Test the JSON formatter and its compiled fast path."""
+
+    def test_specialized_output_matches_generic_path(self):
+        """Test that the exec-compiled formatter emits the same JSON."""
+        formatter = StructuredFormatter()
+        records = [
+            _record("request %s", args=(i,), correlation_id="req-1", tool_name="search")
+            for i in range(StructuredFormatter._SPECIALIZE_AFTER + 5)
+        ]
+
+        outputs = [formatter.format(record) for record in records]
+
+        assert formatter._specialized is not None
+        for record, output in zip(records, outputs):
+            # A fresh formatter always takes the generic path on its first record
+            assert output == StructuredFormatter().format(record)
+        assert json.loads(outputs[-1])["tool_name"] == "search"
+
+    def test_other_shapes_use_generic_path(self):
+        """Test that a record with different attributes is not mis-formatted."""
+        formatter = StructuredFormatter()
+        for _ in range(StructuredFormatter._SPECIALIZE_AFTER):
+            formatter.format(_record("same shape", tool_name="search"))
+
+        record = _record("new shape", input_size=12)
+
+        assert json.loads(formatter.format(record)) == json.loads(
+            StructuredFormatter().format(record)
+        )
+        assert "tool_name" not in json.loads(formatter.format(record))
+
+
+class TestCorrelationFilter:
+    """Test copying the context correlation ID onto records."""
+
+    def test_context_id_is_attached(self):
+        """Test that records pick up the ID set for the current context."""
+        token = set_correlation_id("req-1")
+        try:
+            record = _record("hello")
+            assert CorrelationFilter().filter(record) is True
+        finally:
+            reset_correlation_id(token)
+
+        assert record.correlation_id == "req-1"
+
+    def test_explicit_id_takes_precedence(self):
+        """Test that an extra={"correlation_id": ...} value is kept."""
+        token = set_correlation_id("req-1")
+        try:
+            record = _record("hello", correlation_id="explicit")
+            CorrelationFilter().filter(record)
+        finally:
+            reset_correlation_id(token)
+
+        assert record.correlation_id == "explicit"
+
+    def test_no_id_outside_a_request(self):
+        """Test that nothing is attached when no ID is set."""
+        record = _record("hello")
+        CorrelationFilter().filter(record)
+
+        assert not hasattr(record, "correlation_id")
+
+
+class TestSamplingFilter:
+    """Test DEBUG sampling."""
+
+    @pytest.mark.parametrize("draw, expected", [(0.3, True), (0.7, False)])
+    def test_debug_records_are_sampled(self, draw, expected):
+        """Test that DEBUG records pass with probability debug_rate."""
+        sampler = SamplingFilter(debug_rate=0.5)
+        sampler._random = lambda: draw
+
+        assert sampler.filter(_record("debug", logging.DEBUG)) is expected
+
+    def test_info_and_above_always_pass(self):
+        """Test that sampling never drops INFO or higher."""
+        sampler = SamplingFilter(debug_rate=0.0)
+
+        assert sampler.filter(_record("info", logging.INFO)) is True
+        assert sampler.filter(_record("error", logging.ERROR)) is True
+        assert sampler.filter(_record("debug", logging.DEBUG)) is False
+
+
+class TestDedupFilter:
+    """Test exact duplicate suppression."""
+
+    def test_repeats_are_counted_and_reported(self, clock):
+        """Test that the next copy after the window notes suppressed repeats."""
+        dedup = DedupFilter(window_s=1.0)
+
+        assert dedup.filter(_record("repeated %s", args=("x",))) is True
+        assert dedup.filter(_record("repeated %s", args=("x",))) is False
+        assert dedup.filter(_record("repeated %s", args=("x",))) is False
+        assert dedup.filter(_record("repeated %s", args=("y",))) is True
+
+        clock.now += 1.0
+        record = _record("repeated %s", args=("x",))
+        assert dedup.filter(record) is True
+        assert record.getMessage() == "repeated x (suppressed 2 duplicates)"
+
+    def test_level_and_logger_are_part_of_the_key(self, clock):
+        """Test that the same text from another level or logger is kept."""
+        dedup = DedupFilter(window_s=1.0)
+
+        assert dedup.filter(_record("message")) is True
+        assert dedup.filter(_record("message", logging.WARNING)) is True
+        assert dedup.filter(_record("message", name="solveit.other")) is True
+
+    def test_least_recently_seen_key_is_evicted(self, clock):
+        """Test that at most `capacity` keys are tracked."""
+        dedup = DedupFilter(window_s=1.0, capacity=2)
+
+        for message in ("a", "b", "c"):
+            dedup.filter(_record(message))
+
+        # "a" was evicted, so it is treated as new
+        assert dedup.filter(_record("a")) is True
+        assert dedup.filter(_record("c")) is False
+
+
+class TestBloomDedupFilter:
+    """Test BloomDedupFilter windowing."""
+
+    def test_repeat_within_window_is_dropped(self, clock):
+        """Test that an identical record is suppressed inside the window."""
+        dedup = BloomDedupFilter(window_s=1.0, size_bytes=1024)
+
+        assert dedup.filter(_record("repeated")) is True
+        assert dedup.filter(_record("repeated")) is False
+        assert dedup.filter(_record("different")) is True
+
+    def test_repeating_message_is_emitted_again_after_rotation(self, clock):
+        """Test that a message repeated continuously is let through once per window."""
+        dedup = BloomDedupFilter(window_s=1.0, size_bytes=1024)
+
+        emitted = 0
+        # Ten copies per 0.1 s for 3 s: suppressed copies must not keep the
+        # message alive in the newer window
+        for _ in range(300):
+            emitted += dedup.filter(_record("repeated"))
+            clock.now += 0.01
+
+        # At most one copy per two windows, at least one per three
+        assert 2 <= emitted <= 3
+
+    def test_message_seen_only_in_previous_window_is_dropped(self, clock):
+        """Test that a repeat just after a rotation is still suppressed."""
+        dedup = BloomDedupFilter(window_s=1.0, size_bytes=1024)
+
+        assert dedup.filter(_record("repeated")) is True
+        clock.now += 1.5
+        assert dedup.filter(_record("repeated")) is False
+        clock.now += 1.0
+        assert dedup.filter(_record("repeated")) is True
+
+
+class TestLazyLogger:
+    """Test LazyLogger attribute forwarding."""
+
+    def test_forwards_logger_attributes(self):
+        """Test that attributes missing on the adapter come from the logger."""
+        lazy = LazyLogger(logging.getLogger("solveit.test.lazy"))
+
+        assert lazy.name == "solveit.test.lazy"
+        assert lazy.propagate is lazy.logger.propagate
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))],
+        ids=["copy", "deepcopy", "pickle"],
+    )
+    def test_can_be_copied_and_pickled(self, clone):
+        """Test that copying does not recurse through __getattr__."""
+        lazy = get_logger("solveit.test.lazy")
+
+        cloned = clone(lazy)
+
+        assert cloned.logger.name == "solveit.test.lazy"
+
+    def test_missing_dunder_raises_attribute_error(self):
+        """Test that dunder lookups are not forwarded to the logger."""
+        lazy = LazyLogger(logging.getLogger("solveit.test.lazy"))
+
+        with pytest.raises(AttributeError):
+            lazy.__missing_dunder__
+
+
+class TestBoundedQueueHandler:
+    """Test the handler that feeds the background listener."""
+
+    def test_drop_on_full_counts_dropped_records(self):
+        """Test that a full queue drops records instead of blocking."""
+        handler = solveit_logging._BoundedQueueHandler(queue.Queue(maxsize=1), drop_on_full=True)
+
+        handler.emit(_record("first"))
+        handler.emit(_record("second"))
+
+        assert handler.dropped == 1
+        assert handler.queue.get_nowait().getMessage() == "first"
+
+    def test_prepare_merges_message_and_traceback(self):
+        """Test that the queued record carries pre-rendered text only."""
+        handler = solveit_logging._BoundedQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("failed %s", args=("search",))
+            record.exc_info = sys.exc_info()
+
+        prepared = handler.prepare(record)
+
+        assert prepared.msg.startswith("failed search\nTraceback")
+        assert "ValueError: boom" in prepared.msg
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        # The caller's record is left alone for other handlers
+        assert record.args == ("search",)
+
+
+class TestBatchedWriteHandler:
+    """Test batching in _BatchedWriteHandler."""
+
+    @pytest.fixture
+    def handler(self, tmp_path, clock):
+        """A handler writing up to three records per batch to a temp file."""
+        handler = solveit_logging._BatchedWriteHandler(
+            str(tmp_path / "batched.log"), capacity=3, flush_interval=1.0
+        )
+        yield handler
+        handler.close()
+
+    def _lines(self, handler):
+        """Lines written to the handler's file so far."""
+        with open(handler.path) as log_file:
+            return log_file.read().splitlines()
+
+    def test_flushes_at_capacity(self, handler):
+        """Test that records are held until `capacity` are pending."""
+        handler.emit(_record("one"))
+        handler.emit(_record("two"))
+        assert self._lines(handler) == []
+
+        handler.emit(_record("three"))
+        assert self._lines(handler) == ["one", "two", "three"]
+
+    def test_warning_flushes_immediately(self, handler):
+        """Test that a WARNING writes out everything pending."""
+        handler.emit(_record("info"))
+        handler.emit(_record("warning", logging.WARNING))
+
+        assert self._lines(handler) == ["info", "warning"]
+
+    def test_flushes_after_interval(self, handler, clock):
+        """Test that a record arriving after flush_interval writes the batch."""
+        handler.emit(_record("early"))
+        clock.now += 1.0
+        handler.emit(_record("late"))
+
+        assert self._lines(handler) == ["early", "late"]
+
+    def test_close_flushes_pending_records(self, handler):
+        """Test that nothing buffered is lost on close."""
+        handler.emit(_record("pending"))
+        handler.close()
+
+        assert self._lines(handler) == ["pending"]
+
+
+class TestListener:
+    """Test the queue listener pipeline set up by configure_logging()."""
+
+    @pytest.mark.parametrize("batch_writes", [False, True], ids=["buffered", "batched"])
+    def test_stop_flushes_buffered_records(self, root_logger, tmp_path, batch_writes):
+        """Test that stopping the listener writes out records still buffered."""
+        log_path = tmp_path / "server.log"
+        configure_logging(LogConfig(
+            console=False,
+            file_path=str(log_path),
+            file_buffer_records=100,
+            file_flush_interval=60.0,
+            batch_writes=batch_writes,
+            format_type="json",
+        ))
+
+        token = set_correlation_id("req-1")
+        try:
+            logging.getLogger("solveit.test.listener").info("hello %s", "world")
+        finally:
+            reset_correlation_id(token)
+        # What the atexit hook runs
+        solveit_logging._stop_listener()
+
+        entry = json.loads(log_path.read_text())
+        assert entry["message"] == "hello world"
+        assert entry["correlation_id"] == "req-1"
+        assert solveit_logging._listener is None
+
+    def test_reconfiguring_stops_previous_listener(self, root_logger, tmp_path):
+        """Test that configure_logging() flushes the pipeline it replaces."""
+        first = tmp_path / "first.log"
+        configure_logging(LogConfig(
+            console=False, file_path=str(first), file_flush_interval=60.0
+        ))
+        listener = solveit_logging._listener
+        logging.getLogger("solveit.test.listener").info("before")
+
+        configure_logging(LogConfig(
+            console=False, file_path=str(tmp_path / "second.log")
+        ))
+
+        assert solveit_logging._listener is not listener
+        assert "before" in first.read_text()
+        assert len(root_logger.handlers) == 1
@@ -0,0 +1,150 @@
+"""Unit tests for the Layer 1 security middleware."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from solveit_mcp_server.utils import security_middleware
+from solveit_mcp_server.utils.security_middleware import (
+    DualLimiter,
+    SecurityConfig,
+    SecurityError,
+    SecurityMiddleware,
+)
+
+
+def _middleware(**limits):
+    """A SecurityMiddleware whose config overrides the given limits."""
+    config = SecurityConfig()
+    for name, value in limits.items():
+        setattr(config, name, value)
+    return SecurityMiddleware(config)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive time.monotonic() as seen by security_middleware."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(security_middleware, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+class TestDualLimiterRequests:
+    """Test the sliding window request counter."""
+
+    def test_allows_rate_requests_per_window(self, clock):
+        """Test that exactly `rate` requests fit in one window."""
+        limiter = DualLimiter(request_rate=10, output_bytes_per_min=1000)
+
+        assert all(limiter.check_request() for _ in range(10))
+        assert limiter.check_request() is False
+
+    def test_previous_window_is_weighted_by_overlap(self, clock):
+        """Test that a full previous window still counts at a boundary."""
+        limiter = DualLimiter(request_rate=10, output_bytes_per_min=1000)
+        for _ in range(10):
+            limiter.check_request()
+
+        # No double burst right after the boundary
+        clock.now += 60.0
+        assert limiter.check_request() is False
+
+        # Halfway through, half of the previous window still counts
+        clock.now += 30.0
+        assert sum(limiter.check_request() for _ in range(10)) == 5
+
+    def test_idle_for_two_windows_resets(self, clock):
+        """Test that counts older than the previous window are dropped."""
+        limiter = DualLimiter(request_rate=10, output_bytes_per_min=1000)
+        for _ in range(10):
+            limiter.check_request()
+
+        clock.now += 120.0
+
+        assert sum(limiter.check_request() for _ in range(11)) == 10
+
+
+class TestOutputRateLimit:
+    """Test the output bytes-per-minute cap."""
+
+    def test_check_output_caps_bytes_per_minute(self, clock):
+        """Test that output over the cap is refused and not counted."""
+        limiter = DualLimiter(request_rate=10, output_bytes_per_min=100)
+
+        assert limiter.check_output(60) is True
+        assert limiter.check_output(50) is False
+        assert limiter.check_output(40) is True
+
+        clock.now += 61.0
+        assert limiter.check_output(100) is True
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_validate_response_raises_over_cap(self, clock):
+        """Test that validate_response reports an exceeded output rate."""
+        security = _middleware(output_rate_limit=100)
+
+        await security.validate_response("x" * 80, "search")
+        with pytest.raises(SecurityError, match="Output rate limit exceeded"):
+            await security.validate_response("x" * 80, "search")
+        assert await security.validate_response("x" * 20, "search") == "x" * 20
+
+
+class TestPerToolRateLimit:
+    """Test the optional per-tool request limit."""
+
+    def test_disabled_by_default(self):
+        """Test that no per-tool limiter is created when the limit is 0."""
+        assert _middleware(tool_rate_limit_per_minute=0).tool_limiter is None
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_each_tool_has_its_own_bucket(self):
+        """Test that one busy tool does not use up another tool's requests."""
+        security = _middleware(tool_rate_limit_per_minute=2)
+
+        await security.validate_request("search", {"keywords": "a"})
+        await security.validate_request("search", {"keywords": "b"})
+        with pytest.raises(SecurityError, match="'search'"):
+            await security.validate_request("search", {"keywords": "c"})
+
+        await security.validate_request("list_objectives", {})
+
+
+class TestRunWithTimeout:
+    """Test execution timeout enforcement."""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_returns_result_within_timeout(self):
+        """Test that a fast coroutine's result is passed through."""
+        async def tool_call():
+            return "done"
+
+        assert await _middleware().run_with_timeout(tool_call(), 1.0, "search") == "done"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_timeout_raises_security_error(self):
+        """Test that a slow tool is cancelled and reported as a SecurityError."""
+        cancelled = asyncio.Event()
+
+        async def slow_tool_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(SecurityError, match=r"Tool 'search' execution timeout \(0\.01s\)") as exc_info:
+            await _middleware().run_with_timeout(slow_tool_call(), 0.01, "search")
+
+        assert cancelled.is_set()
+        # The TimeoutError is not chained onto the SecurityError
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__ is True
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_timeout_is_capped_at_max_timeout(self):
+        """Test that the configured maximum overrides a longer tool timeout."""
+        security = _middleware(max_timeout=0.01)
+
+        with pytest.raises(SecurityError, match=r"\(0\.01s\)"):
+            await security.run_with_timeout(asyncio.sleep(10), 60.0, "search")
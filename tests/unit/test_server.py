@@ -1,7 +1,10 @@
 """Unit tests for server initialization and tool registration."""
 
-from unittest.mock import patch, MagicMock
+import asyncio
+import re
+from unittest.mock import Mock, patch
 import pytest
+from mcp.server.lowlevel import Server
 
 from server import create_server
 from tools.solveit_tools import (
@@ -28,6 +31,71 @@ from tools.solveit_tools import (
 )
 
 
+# MCP tool names: lowercase, starting with a letter, using _ or - as separators
+_TOOL_NAME_RE = re.compile(r'^[a-z][a-z0-9_-]*$')
+
+# Terms an informative SOLVE-IT tool description mentions at least one of
+_DESCRIPTION_KEYWORD_RE = re.compile(r'solve-it|technique|weakness|mitigation', re.IGNORECASE)
+
+# Tool classes by category, in registration order
+ESSENTIAL_TOOLS = (
+    GetDatabaseDescriptionTool,
+    SearchTool,
+    GetTechniqueDetailsTool,
+    GetWeaknessDetailsTool,
+    GetMitigationDetailsTool,
+)
+
+RELATIONSHIP_TOOLS = (
+    GetWeaknessesForTechniqueTool,
+    GetMitigationsForWeaknessTool,
+    GetTechniquesForWeaknessTool,
+    GetWeaknessesForMitigationTool,
+    GetTechniquesForMitigationTool,
+)
+
+OBJECTIVE_TOOLS = (
+    ListObjectivesTool,
+    GetTechniquesForObjectiveTool,
+    ListAvailableMappingsTool,
+    LoadObjectiveMappingTool,
+)
+
+BULK_TOOLS = (
+    GetAllTechniquesWithNameAndIdTool,
+    GetAllWeaknessesWithNameAndIdTool,
+    GetAllMitigationsWithNameAndIdTool,
+    GetAllTechniquesWithFullDetailTool,
+    GetAllWeaknessesWithFullDetailTool,
+    GetAllMitigationsWithFullDetailTool,
+)
+
+# Every tool the server registers, in registration order
+ALL_TOOL_CLASSES = ESSENTIAL_TOOLS + RELATIONSHIP_TOOLS + OBJECTIVE_TOOLS + BULK_TOOLS
+
+
+class _RecordingServer:
+    """Stand-in for the MCP Server that records register_tool() calls."""
+    
+    __slots__ = ('calls',)
+    
+    def __init__(self):
+        self.calls = []
+    
+    def register_tool(self, tool):
+        self.calls.append(tool)
+
+
+@pytest.fixture(scope="module")
+def tool_instances():
+    """Build one instance of each tool, shared across this module.
+    
+    init_kb=False is the server's shared-knowledge-base mode, which skips
+    data path resolution and KB loading, so no patching is needed.
+    """
+    return {tool_class: tool_class(init_kb=False) for tool_class in ALL_TOOL_CLASSES}
+
+
 class TestServerInitialization:
     """Test server initialization and configuration."""
     
@@ -38,7 +106,7 @@ class TestServerInitialization:
     @patch('server.Server')
     def test_create_server_returns_server(self, mock_server_class):
         """Test that create_server returns a server instance."""
-        mock_server = MagicMock()
+        mock_server = Mock(spec=Server)
         mock_server_class.return_value = mock_server
         
         result = create_server()
@@ -49,7 +117,7 @@ class TestServerInitialization:
     @patch('server.Server')
     def test_server_name_configuration(self, mock_server_class):
         """Test that server is created with correct name."""
-        mock_server = MagicMock()
+        mock_server = Mock(spec=Server)
         mock_server_class.return_value = mock_server
         
         create_server()
@@ -62,338 +130,64 @@ class TestToolRegistration:
     
     def test_expected_tool_count(self):
         """Test that all 20 expected tools are available."""
-        expected_tools = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        assert len(expected_tools) == 20
+        assert len(ALL_TOOL_CLASSES) == 20
     
-    def test_tool_names_are_unique(self):
+    def test_tool_names_are_unique(self, tool_instances):
         """Test that all tool names are unique."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        # Create instances to get tool names
-        tool_names = []
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                tool_names.append(tool.name)
+        tool_names = [tool.name for tool in tool_instances.values()]
         
         # Check that all names are unique
         assert len(tool_names) == len(set(tool_names))
     
-    def test_tool_descriptions_exist(self):
-        """Test that all tools have descriptions."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'description')
-                assert isinstance(tool.description, str)
-                assert len(tool.description) > 0
-    
-    def test_tool_parameter_classes_exist(self):
-        """Test that all tools have parameter classes."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'Params')
-                assert tool.Params is not None
+    def test_tool_surface(self, tool_instances):
+        """Test that every tool exposes a name, description, invoke and Params."""
+        for tool in tool_instances.values():
+            for attr in ('name', 'description', 'invoke', 'Params'):
+                assert hasattr(tool, attr)
+            assert isinstance(tool.description, str)
+            assert len(tool.description) > 0
+            assert tool.Params is not None
     
     @patch('server.Server')
-    def test_tool_registration_with_server(self, mock_server_class):
+    def test_tool_registration_with_server(self, mock_server_class, tool_instances):
         """Test that tools can be registered with server."""
-        mock_server = MagicMock()
+        mock_server = _RecordingServer()
         mock_server_class.return_value = mock_server
         
         server = create_server()
         
         # Verify server was created
-        assert server == mock_server
+        assert server is mock_server
         mock_server_class.assert_called_once_with("solveit_mcp_server")
         
-        # Test that we can register tools (mock the registration)
-        with patch.object(GetDatabaseDescriptionTool, '_resolve_data_path'), \
-             patch.object(GetDatabaseDescriptionTool, '_init_knowledge_base'):
-            tool = GetDatabaseDescriptionTool()
-            
-            # Mock the register method
-            server.register_tool = MagicMock()
-            server.register_tool(tool)
-            
-            # Verify tool was registered
-            server.register_tool.assert_called_once_with(tool)
-
-
-class TestToolCategories:
-    """Test tool categorization and organization."""
-    
-    def test_essential_query_tools(self):
-        """Test essential query tools."""
-        essential_tools = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-        ]
-        
-        for tool_class in essential_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'name')
-                assert hasattr(tool, 'description')
-                assert hasattr(tool, 'invoke')
-    
-    def test_relationship_tools(self):
-        """Test relationship query tools."""
-        relationship_tools = [
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-        ]
-        
-        for tool_class in relationship_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'name')
-                assert hasattr(tool, 'description')
-                assert hasattr(tool, 'invoke')
-    
-    def test_objective_tools(self):
-        """Test objective and mapping tools."""
-        objective_tools = [
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-        ]
-        
-        for tool_class in objective_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'name')
-                assert hasattr(tool, 'description')
-                assert hasattr(tool, 'invoke')
-    
-    def test_bulk_tools(self):
-        """Test bulk retrieval tools."""
-        bulk_tools = [
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
+        # Test that we can register tools (recorded by the stand-in server)
+        tool = tool_instances[GetDatabaseDescriptionTool]
+        server.register_tool(tool)
         
-        for tool_class in bulk_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                assert hasattr(tool, 'name')
-                assert hasattr(tool, 'description')
-                assert hasattr(tool, 'invoke')
+        # Verify tool was registered
+        assert server.calls == [tool]
 
 
 class TestServerCompatibility:
     """Test server compatibility with MCP standards."""
     
-    def test_tool_names_follow_convention(self):
+    def test_tool_names_follow_convention(self, tool_instances):
         """Test that tool names follow MCP conventions."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                
-                # Tool names should be lowercase with underscores
-                assert tool.name.islower()
-                assert ' ' not in tool.name
-                assert tool.name.replace('_', '').replace('-', '').isalnum()
+        for tool in tool_instances.values():
+            # Tool names should be lowercase with underscores
+            assert _TOOL_NAME_RE.match(tool.name)
     
-    def test_tool_descriptions_are_informative(self):
+    def test_tool_descriptions_are_informative(self, tool_instances):
         """Test that tool descriptions are informative."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                
-                # Descriptions should be meaningful and contain key terms
-                assert len(tool.description) > 20
-                assert any(keyword in tool.description.lower() for keyword in ['solve-it', 'technique', 'weakness', 'mitigation'])
+        for tool in tool_instances.values():
+            # Descriptions should be meaningful and contain key terms
+            assert len(tool.description) > 20
+            assert _DESCRIPTION_KEYWORD_RE.search(tool.description)
     
-    def test_tools_have_async_invoke_methods(self):
+    def test_tools_have_async_invoke_methods(self, tool_instances):
         """Test that all tools have async invoke methods."""
-        tool_classes = [
-            GetDatabaseDescriptionTool,
-            SearchTool,
-            GetTechniqueDetailsTool,
-            GetWeaknessDetailsTool,
-            GetMitigationDetailsTool,
-            GetWeaknessesForTechniqueTool,
-            GetMitigationsForWeaknessTool,
-            GetTechniquesForWeaknessTool,
-            GetWeaknessesForMitigationTool,
-            GetTechniquesForMitigationTool,
-            ListObjectivesTool,
-            GetTechniquesForObjectiveTool,
-            ListAvailableMappingsTool,
-            LoadObjectiveMappingTool,
-            GetAllTechniquesWithNameAndIdTool,
-            GetAllWeaknessesWithNameAndIdTool,
-            GetAllMitigationsWithNameAndIdTool,
-            GetAllTechniquesWithFullDetailTool,
-            GetAllWeaknessesWithFullDetailTool,
-            GetAllMitigationsWithFullDetailTool,
-        ]
-        
-        for tool_class in tool_classes:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                tool = tool_class()
-                
-                # Check that invoke method exists and is async
-                assert hasattr(tool, 'invoke')
-                assert callable(tool.invoke)
-                # Check if it's a coroutine function
-                import asyncio
-                assert asyncio.iscoroutinefunction(tool.invoke)
+        for tool in tool_instances.values():
+            # Check that invoke method exists and is async
+            assert hasattr(tool, 'invoke')
+            assert callable(tool.invoke)
+            assert asyncio.iscoroutinefunction(tool.invoke)
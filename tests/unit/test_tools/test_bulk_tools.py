@@ -1,7 +1,6 @@
 """Unit tests for bulk retrieval tools."""
 
-import json
-from unittest.mock import patch, MagicMock
+import asyncio
 
 import pytest
 
@@ -19,418 +18,182 @@ from solveit_mcp_server.tools.solveit_tools import (
     GetAllMitigationsWithFullDetailTool,
     GetAllMitigationsWithFullDetailParams,
 )
-from conftest import validate_json_response, assert_error_response
-
-
-class TestGetAllTechniquesWithNameAndIdTool:
-    """Test GetAllTechniquesWithNameAndIdTool functionality."""
-    
-    def test_tool_metadata(self):
+from conftest import validate_json_response, assert_error_response, failing_knowledge_base
+
+pytestmark = pytest.mark.usefixtures("stub_tool_init")
+
+# The bulk tools take no arguments, so one params instance per class is
+# shared by every test instead of being re-validated per invocation
+_EMPTY_PARAMS = {
+    params_class: params_class()
+    for params_class in (
+        GetAllTechniquesWithNameAndIdParams,
+        GetAllWeaknessesWithNameAndIdParams,
+        GetAllMitigationsWithNameAndIdParams,
+        GetAllTechniquesWithFullDetailParams,
+        GetAllWeaknessesWithFullDetailParams,
+        GetAllMitigationsWithFullDetailParams,
+    )
+}
+
+# Keys every item carries in the concise and full-detail bulk responses
+_CONCISE_KEYS = frozenset({'id', 'name'})
+_FULL_DETAIL_KEYS = _CONCISE_KEYS | {'description'}
+
+
+class TestBulkToolsCommon:
+    """Checks shared by all six bulk retrieval tools."""
+    
+    @pytest.mark.parametrize("tool_class, name, description_terms, params_class", [
+        (GetAllTechniquesWithNameAndIdTool, "get_all_techniques_with_name_and_id",
+         ("concise format",), GetAllTechniquesWithNameAndIdParams),
+        (GetAllWeaknessesWithNameAndIdTool, "get_all_weaknesses_with_name_and_id",
+         ("concise format",), GetAllWeaknessesWithNameAndIdParams),
+        (GetAllMitigationsWithNameAndIdTool, "get_all_mitigations_with_name_and_id",
+         ("concise format",), GetAllMitigationsWithNameAndIdParams),
+        (GetAllTechniquesWithFullDetailTool, "get_all_techniques_with_full_detail",
+         ("complete details", "warning"), GetAllTechniquesWithFullDetailParams),
+        (GetAllWeaknessesWithFullDetailTool, "get_all_weaknesses_with_full_detail",
+         ("complete details", "warning"), GetAllWeaknessesWithFullDetailParams),
+        (GetAllMitigationsWithFullDetailTool, "get_all_mitigations_with_full_detail",
+         ("complete details", "warning"), GetAllMitigationsWithFullDetailParams),
+    ])
+    def test_tool_metadata(self, tool_class, name, description_terms, params_class, shared_tools):
         """Test tool metadata is correct."""
-        tool = GetAllTechniquesWithNameAndIdTool()
+        tool = shared_tools[tool_class]
         
-        assert tool.name == "get_all_techniques_with_name_and_id"
-        assert "concise format" in tool.description.lower()
-        assert tool.Params == GetAllTechniquesWithNameAndIdParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_techniques_retrieval(self, mock_solve_it_environment):
-        """Test successful techniques retrieval."""
-        with patch.object(GetAllTechniquesWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllTechniquesWithNameAndIdTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllTechniquesWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 2
-            assert data[0]['id'] == "T1001"
-            assert data[0]['name'] == "Test Technique 1"
-            assert data[1]['id'] == "T1002"
-            assert data[1]['name'] == "Test Technique 2"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_techniques_with_name_and_id.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in techniques retrieval."""
-        with patch.object(GetAllTechniquesWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllTechniquesWithNameAndIdTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_techniques_with_name_and_id.side_effect = Exception("Test error")
-            
-            params = GetAllTechniquesWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetAllWeaknessesWithNameAndIdTool:
-    """Test GetAllWeaknessesWithNameAndIdTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetAllWeaknessesWithNameAndIdTool()
+        assert tool.name == name
+        for term in description_terms:
+            assert term in tool.description.lower()
+        assert tool.Params == params_class
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params_class, method", [
+        (GetAllTechniquesWithNameAndIdTool, GetAllTechniquesWithNameAndIdParams,
+         "get_all_techniques_with_name_and_id"),
+        (GetAllWeaknessesWithNameAndIdTool, GetAllWeaknessesWithNameAndIdParams,
+         "get_all_weaknesses_with_name_and_id"),
+        (GetAllMitigationsWithNameAndIdTool, GetAllMitigationsWithNameAndIdParams,
+         "get_all_mitigations_with_name_and_id"),
+        (GetAllTechniquesWithFullDetailTool, GetAllTechniquesWithFullDetailParams,
+         "get_all_techniques_with_full_detail"),
+        (GetAllWeaknessesWithFullDetailTool, GetAllWeaknessesWithFullDetailParams,
+         "get_all_weaknesses_with_full_detail"),
+        (GetAllMitigationsWithFullDetailTool, GetAllMitigationsWithFullDetailParams,
+         "get_all_mitigations_with_full_detail"),
+    ])
+    async def test_error_handling(self, tool_class, params_class, method):
+        """Test that a knowledge base failure becomes an error response."""
+        tool = tool_class(init_kb=False)
+        tool.knowledge_base = failing_knowledge_base(method)
         
-        assert tool.name == "get_all_weaknesses_with_name_and_id"
-        assert "concise format" in tool.description.lower()
-        assert tool.Params == GetAllWeaknessesWithNameAndIdParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_weaknesses_retrieval(self, mock_solve_it_environment):
-        """Test successful weaknesses retrieval."""
-        with patch.object(GetAllWeaknessesWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllWeaknessesWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllWeaknessesWithNameAndIdTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllWeaknessesWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 2
-            assert data[0]['id'] == "W1001"
-            assert data[0]['name'] == "Test Weakness 1"
-            assert data[1]['id'] == "W1002"
-            assert data[1]['name'] == "Test Weakness 2"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_weaknesses_with_name_and_id.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in weaknesses retrieval."""
-        with patch.object(GetAllWeaknessesWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllWeaknessesWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllWeaknessesWithNameAndIdTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_weaknesses_with_name_and_id.side_effect = Exception("Test error")
-            
-            params = GetAllWeaknessesWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetAllMitigationsWithNameAndIdTool:
-    """Test GetAllMitigationsWithNameAndIdTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetAllMitigationsWithNameAndIdTool()
+        result = await tool.invoke(_EMPTY_PARAMS[params_class])
         
-        assert tool.name == "get_all_mitigations_with_name_and_id"
-        assert "concise format" in tool.description.lower()
-        assert tool.Params == GetAllMitigationsWithNameAndIdParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_mitigations_retrieval(self, mock_solve_it_environment):
-        """Test successful mitigations retrieval."""
-        with patch.object(GetAllMitigationsWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllMitigationsWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllMitigationsWithNameAndIdTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllMitigationsWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 2
-            assert data[0]['id'] == "M1001"
-            assert data[0]['name'] == "Test Mitigation 1"
-            assert data[1]['id'] == "M1002"
-            assert data[1]['name'] == "Test Mitigation 2"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_mitigations_with_name_and_id.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in mitigations retrieval."""
-        with patch.object(GetAllMitigationsWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllMitigationsWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool = GetAllMitigationsWithNameAndIdTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_mitigations_with_name_and_id.side_effect = Exception("Test error")
-            
-            params = GetAllMitigationsWithNameAndIdParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetAllTechniquesWithFullDetailTool:
-    """Test GetAllTechniquesWithFullDetailTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetAllTechniquesWithFullDetailTool()
+        assert_error_response(result, "error")
+
+
+class TestBulkToolsRetrieval:
+    """Successful retrieval through each bulk tool."""
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params_class, method, ids, names", [
+        (GetAllTechniquesWithNameAndIdTool, GetAllTechniquesWithNameAndIdParams,
+         "get_all_techniques_with_name_and_id",
+         ["T1001", "T1002"], ["Test Technique 1", "Test Technique 2"]),
+        (GetAllWeaknessesWithNameAndIdTool, GetAllWeaknessesWithNameAndIdParams,
+         "get_all_weaknesses_with_name_and_id",
+         ["W1001", "W1002"], ["Test Weakness 1", "Test Weakness 2"]),
+        (GetAllMitigationsWithNameAndIdTool, GetAllMitigationsWithNameAndIdParams,
+         "get_all_mitigations_with_name_and_id",
+         ["M1001", "M1002"], ["Test Mitigation 1", "Test Mitigation 2"]),
+    ])
+    async def test_successful_concise_retrieval(self, tool_class, params_class, method,
+                                                ids, names, mock_solve_it_environment):
+        """Test successful retrieval of ids and names."""
+        tool = tool_class()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
         
-        assert tool.name == "get_all_techniques_with_full_detail"
-        assert "complete details" in tool.description.lower()
-        assert "warning" in tool.description.lower()
-        assert tool.Params == GetAllTechniquesWithFullDetailParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_techniques_retrieval(self, mock_solve_it_environment):
-        """Test successful techniques retrieval with full details."""
-        with patch.object(GetAllTechniquesWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllTechniquesWithFullDetailTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllTechniquesWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 1
-            assert data[0]['id'] == "T1001"
-            assert data[0]['name'] == "Test Technique"
-            assert 'description' in data[0]
-            assert 'weaknesses' in data[0]
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_techniques_with_full_detail.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in techniques retrieval."""
-        with patch.object(GetAllTechniquesWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllTechniquesWithFullDetailTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_techniques_with_full_detail.side_effect = Exception("Test error")
-            
-            params = GetAllTechniquesWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetAllWeaknessesWithFullDetailTool:
-    """Test GetAllWeaknessesWithFullDetailTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetAllWeaknessesWithFullDetailTool()
+        result = await tool.invoke(_EMPTY_PARAMS[params_class])
         
-        assert tool.name == "get_all_weaknesses_with_full_detail"
-        assert "complete details" in tool.description.lower()
-        assert "warning" in tool.description.lower()
-        assert tool.Params == GetAllWeaknessesWithFullDetailParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_weaknesses_retrieval(self, mock_solve_it_environment):
-        """Test successful weaknesses retrieval with full details."""
-        with patch.object(GetAllWeaknessesWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllWeaknessesWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllWeaknessesWithFullDetailTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllWeaknessesWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 1
-            assert data[0]['id'] == "W1001"
-            assert data[0]['name'] == "Test Weakness"
-            assert 'description' in data[0]
-            assert 'mitigations' in data[0]
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_weaknesses_with_full_detail.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in weaknesses retrieval."""
-        with patch.object(GetAllWeaknessesWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllWeaknessesWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllWeaknessesWithFullDetailTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_weaknesses_with_full_detail.side_effect = Exception("Test error")
-            
-            params = GetAllWeaknessesWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetAllMitigationsWithFullDetailTool:
-    """Test GetAllMitigationsWithFullDetailTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetAllMitigationsWithFullDetailTool()
+        # Validate JSON response
+        data = validate_json_response(result)
         
-        assert tool.name == "get_all_mitigations_with_full_detail"
-        assert "complete details" in tool.description.lower()
-        assert "warning" in tool.description.lower()
-        assert tool.Params == GetAllMitigationsWithFullDetailParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_mitigations_retrieval(self, mock_solve_it_environment):
-        """Test successful mitigations retrieval with full details."""
-        with patch.object(GetAllMitigationsWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllMitigationsWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllMitigationsWithFullDetailTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetAllMitigationsWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) == 1
-            assert data[0]['id'] == "M1001"
-            assert data[0]['name'] == "Test Mitigation"
-            assert 'description' in data[0]
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_all_mitigations_with_full_detail.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in mitigations retrieval."""
-        with patch.object(GetAllMitigationsWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllMitigationsWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool = GetAllMitigationsWithFullDetailTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_all_mitigations_with_full_detail.side_effect = Exception("Test error")
-            
-            params = GetAllMitigationsWithFullDetailParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+        assert isinstance(data, list)
+        assert [item['id'] for item in data] == ids
+        assert [item['name'] for item in data] == names
+        
+        # Verify knowledge base method was called correctly
+        getattr(tool.knowledge_base, method).assert_called_once()
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params_class, method, item_id, name, detail_keys", [
+        (GetAllTechniquesWithFullDetailTool, GetAllTechniquesWithFullDetailParams,
+         "get_all_techniques_with_full_detail",
+         "T1001", "Test Technique", ("description", "weaknesses")),
+        (GetAllWeaknessesWithFullDetailTool, GetAllWeaknessesWithFullDetailParams,
+         "get_all_weaknesses_with_full_detail",
+         "W1001", "Test Weakness", ("description", "mitigations")),
+        (GetAllMitigationsWithFullDetailTool, GetAllMitigationsWithFullDetailParams,
+         "get_all_mitigations_with_full_detail",
+         "M1001", "Test Mitigation", ("description",)),
+    ])
+    async def test_successful_full_detail_retrieval(self, tool_class, params_class, method,
+                                                    item_id, name, detail_keys,
+                                                    mock_solve_it_environment):
+        """Test successful retrieval with full details."""
+        tool = tool_class()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        
+        result = await tool.invoke(_EMPTY_PARAMS[params_class])
+        
+        # Validate JSON response
+        data = validate_json_response(result)
+        
+        assert isinstance(data, list)
+        assert len(data) == 1
+        assert (data[0]['id'], data[0]['name']) == (item_id, name)
+        for key in detail_keys:
+            assert key in data[0]
+        
+        # Verify knowledge base method was called correctly
+        getattr(tool.knowledge_base, method).assert_called_once()
 
 
 class TestBulkToolsPerformance:
     """Test performance characteristics of bulk tools."""
     
-    @pytest.mark.asyncio
-    async def test_concise_vs_full_detail_performance(self, mock_solve_it_environment):
-        """Test that concise format tools are faster than full detail tools."""
-        # This test verifies that the tools call the correct methods
-        # Performance testing would need real data and timing
-        
-        # Test concise format
-        with patch.object(GetAllTechniquesWithNameAndIdTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithNameAndIdTool, '_init_knowledge_base'):
-            
-            tool_concise = GetAllTechniquesWithNameAndIdTool()
-            tool_concise.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params_concise = GetAllTechniquesWithNameAndIdParams()
-            result_concise = await tool_concise.invoke(params_concise)
-            
-            # Validate concise response
-            data_concise = validate_json_response(result_concise)
-            assert len(data_concise) == 2
-            assert 'id' in data_concise[0]
-            assert 'name' in data_concise[0]
-            # Should not have full details
-            assert 'description' not in data_concise[0]
-        
-        # Test full detail format
-        with patch.object(GetAllTechniquesWithFullDetailTool, '_resolve_data_path'), \
-             patch.object(GetAllTechniquesWithFullDetailTool, '_init_knowledge_base'):
-            
-            tool_full = GetAllTechniquesWithFullDetailTool()
-            tool_full.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params_full = GetAllTechniquesWithFullDetailParams()
-            result_full = await tool_full.invoke(params_full)
-            
-            # Validate full response
-            data_full = validate_json_response(result_full)
-            assert len(data_full) == 1
-            assert 'id' in data_full[0]
-            assert 'name' in data_full[0]
-            # Should have full details
-            assert 'description' in data_full[0]
-    
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_bulk_tools_consistency(self, mock_solve_it_environment):
         """Test that bulk tools return consistent data structures."""
-        # Test all concise format tools
         concise_tools = [
             (GetAllTechniquesWithNameAndIdTool, GetAllTechniquesWithNameAndIdParams),
             (GetAllWeaknessesWithNameAndIdTool, GetAllWeaknessesWithNameAndIdParams),
             (GetAllMitigationsWithNameAndIdTool, GetAllMitigationsWithNameAndIdParams),
         ]
-        
-        for tool_class, params_class in concise_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                
-                tool = tool_class()
-                tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-                
-                params = params_class()
-                result = await tool.invoke(params)
-                
-                # Validate consistent structure
-                data = validate_json_response(result)
-                assert isinstance(data, list)
-                if len(data) > 0:
-                    assert 'id' in data[0]
-                    assert 'name' in data[0]
-                    assert len(data[0]) == 2  # Only id and name
-        
-        # Test all full detail tools
         full_tools = [
             (GetAllTechniquesWithFullDetailTool, GetAllTechniquesWithFullDetailParams),
             (GetAllWeaknessesWithFullDetailTool, GetAllWeaknessesWithFullDetailParams),
             (GetAllMitigationsWithFullDetailTool, GetAllMitigationsWithFullDetailParams),
         ]
         
-        for tool_class, params_class in full_tools:
-            with patch.object(tool_class, '_resolve_data_path'), \
-                 patch.object(tool_class, '_init_knowledge_base'):
-                
-                tool = tool_class()
-                tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-                
-                params = params_class()
-                result = await tool.invoke(params)
-                
-                # Validate consistent structure
-                data = validate_json_response(result)
-                assert isinstance(data, list)
-                if len(data) > 0:
-                    assert 'id' in data[0]
-                    assert 'name' in data[0]
-                    assert 'description' in data[0]
-                    assert len(data[0]) > 2  # More than just id and name
+        async def invoke(tool_class, params_class):
+            tool = tool_class()
+            tool.knowledge_base = mock_solve_it_environment.knowledge_base
+            return await tool.invoke(_EMPTY_PARAMS[params_class])
+        
+        # Invoke all six tools concurrently; results keep the input order
+        results = await asyncio.gather(
+            *(invoke(tool_class, params_class) for tool_class, params_class in concise_tools + full_tools)
+        )
+        
+        for index, result in enumerate(results):
+            # Validate consistent structure
+            data = validate_json_response(result)
+            assert isinstance(data, list)
+            if len(data) > 0:
+                if index < len(concise_tools):
+                    assert data[0].keys() == _CONCISE_KEYS  # Only id and name
+                else:
+                    # More than just id and name
+                    assert data[0].keys() > _CONCISE_KEYS
+                    assert _FULL_DETAIL_KEYS <= data[0].keys()
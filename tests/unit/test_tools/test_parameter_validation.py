@@ -1,5 +1,7 @@
 """Unit tests for parameter validation across all tools."""
 
+from functools import lru_cache
+
 import pytest
 from pydantic import ValidationError
 
@@ -29,40 +31,106 @@ from solveit_mcp_server.tools.solveit_tools import (
     GetAllWeaknessesWithFullDetailParams,
     GetAllMitigationsWithFullDetailParams,
 )
+from solveit_mcp_server.tools.solveit_base import ToolParams
+
+
+# Parameter classes for the tools that take no arguments
+NO_PARAM_CLASSES = (
+    GetDatabaseDescriptionParams,
+    ListObjectivesParams,
+    ListAvailableMappingsParams,
+    GetAllTechniquesWithNameAndIdParams,
+    GetAllWeaknessesWithNameAndIdParams,
+    GetAllMitigationsWithNameAndIdParams,
+    GetAllTechniquesWithFullDetailParams,
+    GetAllWeaknessesWithFullDetailParams,
+    GetAllMitigationsWithFullDetailParams,
+)
+
+# Every tool parameter class, in tool registration order
+ALL_PARAM_CLASSES = (
+    GetDatabaseDescriptionParams,
+    SearchParams,
+    GetTechniqueDetailsParams,
+    GetWeaknessDetailsParams,
+    GetMitigationDetailsParams,
+    GetWeaknessesForTechniqueParams,
+    GetMitigationsForWeaknessParams,
+    GetTechniquesForWeaknessParams,
+    GetWeaknessesForMitigationParams,
+    GetTechniquesForMitigationParams,
+    ListObjectivesParams,
+    GetTechniquesForObjectiveParams,
+    ListAvailableMappingsParams,
+    LoadObjectiveMappingParams,
+    GetAllTechniquesWithNameAndIdParams,
+    GetAllWeaknessesWithNameAndIdParams,
+    GetAllMitigationsWithNameAndIdParams,
+    GetAllTechniquesWithFullDetailParams,
+    GetAllWeaknessesWithFullDetailParams,
+    GetAllMitigationsWithFullDetailParams,
+)
+
+# (params class, ID field, valid value) for every tool that takes one ID
+ID_PARAMS_CASES = [
+    (GetTechniqueDetailsParams, "technique_id", "T1001"),
+    (GetWeaknessesForTechniqueParams, "technique_id", "T1002"),
+    (GetWeaknessDetailsParams, "weakness_id", "W1001"),
+    (GetMitigationsForWeaknessParams, "weakness_id", "W1002"),
+    (GetTechniquesForWeaknessParams, "weakness_id", "W1003"),
+    (GetMitigationDetailsParams, "mitigation_id", "M1001"),
+    (GetWeaknessesForMitigationParams, "mitigation_id", "M1002"),
+    (GetTechniquesForMitigationParams, "mitigation_id", "M1003"),
+]
+
+# (params class, field, valid value) for each single required string that
+# must also reject an empty string
+REQUIRED_STR_CASES = [
+    (SearchParams, "keywords", "test search"),
+    (GetTechniquesForObjectiveParams, "objective_name", "Test Objective"),
+    (LoadObjectiveMappingParams, "filename", "carrier.json"),
+]
+
+
+@lru_cache(maxsize=None)
+def _schema(params_class):
+    """JSON schema of a params class, generated once per class."""
+    return params_class.model_json_schema()
 
 
 class TestParameterValidation:
     """Test parameter validation for all tool parameter classes."""
     
-    def test_no_params_classes(self):
+    @pytest.mark.parametrize("param_class", NO_PARAM_CLASSES)
+    def test_no_params_classes(self, param_class):
         """Test parameter classes that require no parameters."""
-        # These should all be created without parameters
-        no_param_classes = [
-            GetDatabaseDescriptionParams,
-            ListObjectivesParams,
-            ListAvailableMappingsParams,
-            GetAllTechniquesWithNameAndIdParams,
-            GetAllWeaknessesWithNameAndIdParams,
-            GetAllMitigationsWithNameAndIdParams,
-            GetAllTechniquesWithFullDetailParams,
-            GetAllWeaknessesWithFullDetailParams,
-            GetAllMitigationsWithFullDetailParams,
-        ]
+        # Should create successfully without parameters
+        params = param_class()
+        assert params is not None
+        
+        # Should also work with empty dict
+        params = param_class(**{})
+        assert params is not None
+    
+    @pytest.mark.parametrize("params_class, field, value", REQUIRED_STR_CASES)
+    def test_required_string_params(self, params_class, field, value):
+        """Test parameter classes with one required, non-empty string."""
+        # Valid parameter
+        params = params_class(**{field: value})
+        assert getattr(params, field) == value
+        
+        # Invalid - missing parameter
+        with pytest.raises(ValidationError):
+            params_class()
         
-        for param_class in no_param_classes:
-            # Should create successfully without parameters
-            params = param_class()
-            assert params is not None
-            
-            # Should also work with empty dict
-            params = param_class(**{})
-            assert params is not None
+        # Invalid - empty string
+        with pytest.raises(ValidationError):
+            params_class(**{field: ""})
     
     def test_search_params_validation(self):
         """Test SearchParams validation."""
         # Valid parameters
         params = SearchParams(keywords="test search")
-        assert params.keywords == "test search"
         assert params.item_types is None
         
         # Valid with item_types
@@ -74,78 +142,27 @@ class TestParameterValidation:
         params = SearchParams(keywords="test", item_types=[])
         assert params.keywords == "test"
         assert params.item_types == []
-        
-        # Invalid - missing keywords
-        with pytest.raises(ValidationError):
-            SearchParams()
-        
-        # Invalid - empty keywords
-        with pytest.raises(ValidationError):
-            SearchParams(keywords="")
     
-    def test_id_based_params_validation(self):
+    @pytest.mark.parametrize("params_class, field, value", ID_PARAMS_CASES)
+    def test_id_based_params_validation(self, params_class, field, value):
         """Test parameter classes that require ID parameters."""
-        # Test technique ID parameters
-        params = GetTechniqueDetailsParams(technique_id="T1001")
-        assert params.technique_id == "T1001"
-        
-        params = GetWeaknessesForTechniqueParams(technique_id="T1002")
-        assert params.technique_id == "T1002"
-        
-        # Test weakness ID parameters
-        params = GetWeaknessDetailsParams(weakness_id="W1001")
-        assert params.weakness_id == "W1001"
-        
-        params = GetMitigationsForWeaknessParams(weakness_id="W1002")
-        assert params.weakness_id == "W1002"
-        
-        params = GetTechniquesForWeaknessParams(weakness_id="W1003")
-        assert params.weakness_id == "W1003"
-        
-        # Test mitigation ID parameters
-        params = GetMitigationDetailsParams(mitigation_id="M1001")
-        assert params.mitigation_id == "M1001"
-        
-        params = GetWeaknessesForMitigationParams(mitigation_id="M1002")
-        assert params.mitigation_id == "M1002"
-        
-        params = GetTechniquesForMitigationParams(mitigation_id="M1003")
-        assert params.mitigation_id == "M1003"
-        
-        # Test invalid cases - missing required parameters
-        with pytest.raises(ValidationError):
-            GetTechniqueDetailsParams()
-        
-        with pytest.raises(ValidationError):
-            GetWeaknessDetailsParams()
-        
+        params = params_class(**{field: value})
+        assert getattr(params, field) == value
+    
+    @pytest.mark.parametrize("params_class", [case[0] for case in ID_PARAMS_CASES])
+    def test_id_based_params_require_id(self, params_class):
+        """Test that ID-based parameter classes reject a missing ID."""
         with pytest.raises(ValidationError):
-            GetMitigationDetailsParams()
+            params_class()
     
     def test_objective_params_validation(self):
         """Test objective-related parameter validation."""
-        # Valid objective name
-        params = GetTechniquesForObjectiveParams(objective_name="Test Objective")
-        assert params.objective_name == "Test Objective"
-        
         # Valid with spaces and special characters
         params = GetTechniquesForObjectiveParams(objective_name="Test Objective - Part 1")
         assert params.objective_name == "Test Objective - Part 1"
-        
-        # Invalid - missing objective_name
-        with pytest.raises(ValidationError):
-            GetTechniquesForObjectiveParams()
-        
-        # Invalid - empty objective_name
-        with pytest.raises(ValidationError):
-            GetTechniquesForObjectiveParams(objective_name="")
     
     def test_mapping_params_validation(self):
         """Test mapping-related parameter validation."""
-        # Valid filename
-        params = LoadObjectiveMappingParams(filename="carrier.json")
-        assert params.filename == "carrier.json"
-        
         # Valid with different extensions
         params = LoadObjectiveMappingParams(filename="test.json")
         assert params.filename == "test.json"
@@ -153,14 +170,6 @@ class TestParameterValidation:
         # Valid with path-like filename
         params = LoadObjectiveMappingParams(filename="subdir/test.json")
         assert params.filename == "subdir/test.json"
-        
-        # Invalid - missing filename
-        with pytest.raises(ValidationError):
-            LoadObjectiveMappingParams()
-        
-        # Invalid - empty filename
-        with pytest.raises(ValidationError):
-            LoadObjectiveMappingParams(filename="")
     
     def test_parameter_type_validation(self):
         """Test that parameters validate types correctly."""
@@ -182,16 +191,14 @@ class TestParameterValidation:
     def test_parameter_field_descriptions(self):
         """Test that parameter classes have proper field descriptions."""
         # Check that required fields have descriptions
-        params = GetTechniqueDetailsParams(technique_id="T1001")
-        schema = params.model_json_schema()
+        schema = _schema(GetTechniqueDetailsParams)
         
         assert 'technique_id' in schema['properties']
         assert 'description' in schema['properties']['technique_id']
         assert 'T1002' in schema['properties']['technique_id']['description']
         
         # Check SearchParams has descriptions
-        params = SearchParams(keywords="test")
-        schema = params.model_json_schema()
+        schema = _schema(SearchParams)
         
         assert 'keywords' in schema['properties']
         assert 'description' in schema['properties']['keywords']
@@ -222,35 +229,10 @@ class TestParameterValidation:
         
         assert recreated.objective_name == original.objective_name
     
-    def test_parameter_inheritance(self):
+    @pytest.mark.parametrize("param_class", ALL_PARAM_CLASSES)
+    def test_parameter_inheritance(self, param_class):
         """Test that all parameter classes inherit from ToolParams."""
-        from solveit_mcp_server.tools.solveit_base import ToolParams
-        
-        all_param_classes = [
-            GetDatabaseDescriptionParams,
-            SearchParams,
-            GetTechniqueDetailsParams,
-            GetWeaknessDetailsParams,
-            GetMitigationDetailsParams,
-            GetWeaknessesForTechniqueParams,
-            GetMitigationsForWeaknessParams,
-            GetTechniquesForWeaknessParams,
-            GetWeaknessesForMitigationParams,
-            GetTechniquesForMitigationParams,
-            ListObjectivesParams,
-            GetTechniquesForObjectiveParams,
-            ListAvailableMappingsParams,
-            LoadObjectiveMappingParams,
-            GetAllTechniquesWithNameAndIdParams,
-            GetAllWeaknessesWithNameAndIdParams,
-            GetAllMitigationsWithNameAndIdParams,
-            GetAllTechniquesWithFullDetailParams,
-            GetAllWeaknessesWithFullDetailParams,
-            GetAllMitigationsWithFullDetailParams,
-        ]
-        
-        for param_class in all_param_classes:
-            assert issubclass(param_class, ToolParams), f"{param_class.__name__} should inherit from ToolParams"
+        assert issubclass(param_class, ToolParams), f"{param_class.__name__} should inherit from ToolParams"
     
     def test_parameter_defaults(self):
         """Test parameter default values."""
@@ -1,10 +1,11 @@
 """Unit tests for essential query tools."""
 
-import json
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from solveit_mcp_server.tools import solveit_tools
 from solveit_mcp_server.tools.solveit_tools import (
     GetDatabaseDescriptionTool,
     GetDatabaseDescriptionParams,
@@ -17,327 +18,277 @@ from solveit_mcp_server.tools.solveit_tools import (
     GetMitigationDetailsTool,
     GetMitigationDetailsParams,
 )
-from conftest import validate_json_response, assert_error_response
+from solveit_mcp_server.utils.knowledge_base_manager import (
+    invalidate_shared_knowledge_base_stats,
+)
+from conftest import validate_json_response, assert_error_response, failing_knowledge_base
+
+pytestmark = pytest.mark.usefixtures("stub_tool_init")
+
+# Params shared by the tests below; tools never modify their params
+_DESCRIPTION_PARAMS = GetDatabaseDescriptionParams()
+_SEARCH_PARAMS = SearchParams(keywords="test search")
+_FILTERED_SEARCH_PARAMS = SearchParams(keywords="test", item_types=["techniques", "weaknesses"])
+_ERROR_SEARCH_PARAMS = SearchParams(keywords="test")
 
 
 class TestGetDatabaseDescriptionTool:
     """Test GetDatabaseDescriptionTool functionality."""
     
-    def test_tool_metadata(self):
+    def test_tool_metadata(self, shared_tools):
         """Test tool metadata is correct."""
-        tool = GetDatabaseDescriptionTool()
+        tool = shared_tools[GetDatabaseDescriptionTool]
         
         assert tool.name == "get_database_description"
         assert "comprehensive description" in tool.description
         assert tool.Params == GetDatabaseDescriptionParams
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_successful_invocation(self, mock_solve_it_environment):
         """Test successful database description retrieval."""
-        with patch.object(GetDatabaseDescriptionTool, '_resolve_data_path'), \
-             patch.object(GetDatabaseDescriptionTool, '_init_knowledge_base'):
-            
-            tool = GetDatabaseDescriptionTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            tool.data_path = "/test/path"
-            
-            params = GetDatabaseDescriptionParams()
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert data['database_name'] == "SOLVE-IT Digital Forensics Knowledge Base"
-            assert 'description' in data
-            assert 'statistics' in data
-            assert 'mcp_server_role' in data
-            assert 'available_operations' in data
-            
-            # Check statistics
-            stats = data['statistics']
-            assert stats['techniques'] == 2
-            assert stats['weaknesses'] == 2
-            assert stats['mitigations'] == 2
-            assert stats['objectives'] == 2
-            assert stats['current_mapping'] == "solve-it.json"
-            assert stats['data_path'] == "/test/path"
+        tool = GetDatabaseDescriptionTool()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        tool.data_path = "/test/path"
+        
+        result = await tool.invoke(_DESCRIPTION_PARAMS)
+        
+        # Validate JSON response
+        data = validate_json_response(result)
+        
+        assert data['database_name'] == "SOLVE-IT Digital Forensics Knowledge Base"
+        assert {'description', 'statistics', 'mcp_server_role', 'available_operations'} <= data.keys()
+        
+        # Check statistics
+        assert data['statistics'].items() >= {
+            'techniques': 2,
+            'weaknesses': 2,
+            'mitigations': 2,
+            'objectives': 2,
+            'current_mapping': "solve-it.json",
+            'data_path': "/test/path",
+        }.items()
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_error_handling(self, mock_solve_it_environment):
         """Test error handling in database description retrieval."""
-        with patch.object(GetDatabaseDescriptionTool, '_resolve_data_path'), \
-             patch.object(GetDatabaseDescriptionTool, '_init_knowledge_base'):
-            
-            tool = GetDatabaseDescriptionTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.list_techniques.side_effect = Exception("Test error")
-            
-            params = GetDatabaseDescriptionParams()
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+        tool = GetDatabaseDescriptionTool()
+        tool.knowledge_base = MagicMock()
+        tool.knowledge_base.list_techniques.side_effect = Exception("Test error")
+        
+        result = await tool.invoke(_DESCRIPTION_PARAMS)
+        
+        assert_error_response(result, "error")
 
 
 class TestSearchTool:
     """Test SearchTool functionality."""
     
-    def test_tool_metadata(self):
+    def test_tool_metadata(self, shared_tools):
         """Test tool metadata is correct."""
-        tool = SearchTool()
+        tool = shared_tools[SearchTool]
         
         assert tool.name == "search"
         assert "searches the knowledge base" in tool.description.lower()
         assert tool.Params == SearchParams
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_successful_search_all_types(self, mock_solve_it_environment):
         """Test successful search across all item types."""
-        with patch.object(SearchTool, '_resolve_data_path'), \
-             patch.object(SearchTool, '_init_knowledge_base'):
-            
-            tool = SearchTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = SearchParams(keywords="test search")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert 'techniques' in data
-            assert 'weaknesses' in data
-            assert 'mitigations' in data
-            
-            # Verify knowledge base search was called correctly
-            tool.knowledge_base.search.assert_called_once_with(
-                keywords="test search",
-                item_types=None
-            )
+        tool = SearchTool()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        
+        result = await tool.invoke(_SEARCH_PARAMS)
+        
+        # Validate JSON response
+        data = validate_json_response(result)
+        
+        assert 'techniques' in data
+        assert 'weaknesses' in data
+        assert 'mitigations' in data
+        
+        # Verify knowledge base search was called correctly
+        tool.knowledge_base.search.assert_called_once_with(
+            keywords="test search",
+            item_types=None
+        )
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_specific_item_types(self, mock_solve_it_environment):
         """Test search with specific item types."""
-        with patch.object(SearchTool, '_resolve_data_path'), \
-             patch.object(SearchTool, '_init_knowledge_base'):
-            
-            tool = SearchTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = SearchParams(keywords="test", item_types=["techniques", "weaknesses"])
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            # Verify knowledge base search was called correctly
-            tool.knowledge_base.search.assert_called_once_with(
-                keywords="test",
-                item_types=["techniques", "weaknesses"]
-            )
+        tool = SearchTool()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        
+        result = await tool.invoke(_FILTERED_SEARCH_PARAMS)
+        
+        # Validate JSON response
+        data = validate_json_response(result)
+        
+        # Verify knowledge base search was called correctly
+        tool.knowledge_base.search.assert_called_once_with(
+            keywords="test",
+            item_types=["techniques", "weaknesses"]
+        )
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_error_handling(self, mock_solve_it_environment):
         """Test error handling in search."""
-        with patch.object(SearchTool, '_resolve_data_path'), \
-             patch.object(SearchTool, '_init_knowledge_base'):
-            
-            tool = SearchTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.search.side_effect = Exception("Search error")
-            
-            params = SearchParams(keywords="test")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+        tool = SearchTool()
+        tool.knowledge_base = failing_knowledge_base("search", Exception("Search error"))
+        
+        result = await tool.invoke(_ERROR_SEARCH_PARAMS)
+        
+        assert_error_response(result, "error")
 
 
-class TestGetTechniqueDetailsTool:
-    """Test GetTechniqueDetailsTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetTechniqueDetailsTool()
-        
-        assert tool.name == "get_technique_details"
-        assert "technique" in tool.description.lower()
-        assert tool.Params == GetTechniqueDetailsParams
+class TestSearchToolResultCache:
+    """Test the SearchTool LRU + TTL result cache."""
     
-    @pytest.mark.asyncio
-    async def test_successful_technique_retrieval(self, mock_solve_it_environment):
-        """Test successful technique details retrieval."""
-        with patch.object(GetTechniqueDetailsTool, '_resolve_data_path'), \
-             patch.object(GetTechniqueDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetTechniqueDetailsTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetTechniqueDetailsParams(technique_id="T1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert data['id'] == "T1001"
-            assert data['name'] == "Test Technique"
-            assert 'description' in data
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_technique.assert_called_once_with("T1001")
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Drive time.monotonic() as seen by solveit_tools."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(solveit_tools, "time", SimpleNamespace(monotonic=lambda: clock.now))
+        return clock
     
-    @pytest.mark.asyncio
-    async def test_technique_not_found(self, mock_solve_it_environment):
-        """Test handling of technique not found."""
-        with patch.object(GetTechniqueDetailsTool, '_resolve_data_path'), \
-             patch.object(GetTechniqueDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetTechniqueDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_technique.return_value = None
-            
-            params = GetTechniqueDetailsParams(technique_id="T9999")
-            result = await tool.invoke(params)
-            
-            assert "T9999 not found" in result
+    @pytest.fixture
+    def tool(self, mock_knowledge_base):
+        """A fresh SearchTool, so each test starts with an empty cache."""
+        tool = SearchTool()
+        tool.knowledge_base = mock_knowledge_base
+        return tool
     
-    @pytest.mark.asyncio
-    async def test_technique_error_handling(self, mock_solve_it_environment):
-        """Test error handling in technique retrieval."""
-        with patch.object(GetTechniqueDetailsTool, '_resolve_data_path'), \
-             patch.object(GetTechniqueDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetTechniqueDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_technique.side_effect = Exception("Technique error")
-            
-            params = GetTechniqueDetailsParams(technique_id="T1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetWeaknessDetailsTool:
-    """Test GetWeaknessDetailsTool functionality."""
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_repeated_search_is_served_from_cache(self, tool, clock):
+        """Test that an identical query does not reach the knowledge base twice."""
+        first = await tool.invoke(_SEARCH_PARAMS)
+        second = await tool.invoke(SearchParams(keywords="test search"))
+        
+        assert second == first
+        tool.knowledge_base.search.assert_called_once()
     
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetWeaknessDetailsTool()
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_entry_expires_after_ttl(self, tool, clock):
+        """Test that a cached result is recomputed once the TTL has passed."""
+        await tool.invoke(_SEARCH_PARAMS)
+        clock.now += SearchTool._RESULT_CACHE_TTL - 1
+        await tool.invoke(_SEARCH_PARAMS)
+        assert tool.knowledge_base.search.call_count == 1
         
-        assert tool.name == "get_weakness_details"
-        assert "weakness" in tool.description.lower()
-        assert tool.Params == GetWeaknessDetailsParams
+        clock.now += 1
+        await tool.invoke(_SEARCH_PARAMS)
+        assert tool.knowledge_base.search.call_count == 2
     
-    @pytest.mark.asyncio
-    async def test_successful_weakness_retrieval(self, mock_solve_it_environment):
-        """Test successful weakness details retrieval."""
-        with patch.object(GetWeaknessDetailsTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessDetailsTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetWeaknessDetailsParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert data['id'] == "W1001"
-            assert data['name'] == "Test Weakness"
-            assert 'description' in data
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_weakness.assert_called_once_with("W1001")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_least_recently_used_entry_is_evicted(self, tool, clock, monkeypatch):
+        """Test that the cache holds at most _RESULT_CACHE_SIZE entries."""
+        monkeypatch.setattr(SearchTool, "_RESULT_CACHE_SIZE", 2)
+        search = tool.knowledge_base.search
+        
+        await tool.invoke(SearchParams(keywords="a"))
+        await tool.invoke(SearchParams(keywords="b"))
+        await tool.invoke(SearchParams(keywords="a"))  # hit; "b" is now oldest
+        await tool.invoke(SearchParams(keywords="c"))  # evicts "b"
+        assert search.call_count == 3
+        
+        await tool.invoke(SearchParams(keywords="a"))
+        assert search.call_count == 3
+        await tool.invoke(SearchParams(keywords="b"))
+        assert search.call_count == 4
+        assert len(tool._result_cache) == 2
     
-    @pytest.mark.asyncio
-    async def test_weakness_not_found(self, mock_solve_it_environment):
-        """Test handling of weakness not found."""
-        with patch.object(GetWeaknessDetailsTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_weakness.return_value = None
-            
-            params = GetWeaknessDetailsParams(weakness_id="W9999")
-            result = await tool.invoke(params)
-            
-            assert "W9999 not found" in result
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_generation_bump_invalidates_cache(self, tool, clock):
+        """Test that loading a new mapping makes cached results stale."""
+        await tool.invoke(_SEARCH_PARAMS)
+        invalidate_shared_knowledge_base_stats()
+        await tool.invoke(_SEARCH_PARAMS)
+        
+        assert tool.knowledge_base.search.call_count == 2
     
-    @pytest.mark.asyncio
-    async def test_weakness_error_handling(self, mock_solve_it_environment):
-        """Test error handling in weakness retrieval."""
-        with patch.object(GetWeaknessDetailsTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_weakness.side_effect = Exception("Weakness error")
-            
-            params = GetWeaknessDetailsParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_result_is_not_cached(self, tool, clock):
+        """Test that a failed search is retried on the next call."""
+        search = tool.knowledge_base.search
+        search.side_effect = [Exception("Search error"), {"techniques": []}]
+        
+        assert_error_response(await tool.invoke(_SEARCH_PARAMS), "error")
+        data = validate_json_response(await tool.invoke(_SEARCH_PARAMS))
+        
+        assert data == {"techniques": []}
+        assert search.call_count == 2
 
 
-class TestGetMitigationDetailsTool:
-    """Test GetMitigationDetailsTool functionality."""
+class TestDetailTools:
+    """Checks shared by the technique, weakness and mitigation details tools."""
     
-    def test_tool_metadata(self):
+    @pytest.mark.parametrize("tool_class, name, description_term, params_class", [
+        (GetTechniqueDetailsTool, "get_technique_details", "technique", GetTechniqueDetailsParams),
+        (GetWeaknessDetailsTool, "get_weakness_details", "weakness", GetWeaknessDetailsParams),
+        (GetMitigationDetailsTool, "get_mitigation_details", "mitigation", GetMitigationDetailsParams),
+    ])
+    def test_tool_metadata(self, tool_class, name, description_term, params_class, shared_tools):
         """Test tool metadata is correct."""
-        tool = GetMitigationDetailsTool()
+        tool = shared_tools[tool_class]
         
-        assert tool.name == "get_mitigation_details"
-        assert "mitigation" in tool.description.lower()
-        assert tool.Params == GetMitigationDetailsParams
+        assert tool.name == name
+        assert description_term in tool.description.lower()
+        assert tool.Params == params_class
     
-    @pytest.mark.asyncio
-    async def test_successful_mitigation_retrieval(self, mock_solve_it_environment):
-        """Test successful mitigation details retrieval."""
-        with patch.object(GetMitigationDetailsTool, '_resolve_data_path'), \
-             patch.object(GetMitigationDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetMitigationDetailsTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetMitigationDetailsParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert data['id'] == "M1001"
-            assert data['name'] == "Test Mitigation"
-            assert 'description' in data
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_mitigation.assert_called_once_with("M1001")
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params, method, item_id, item_name", [
+        (GetTechniqueDetailsTool, GetTechniqueDetailsParams(technique_id="T1001"),
+         "get_technique", "T1001", "Test Technique"),
+        (GetWeaknessDetailsTool, GetWeaknessDetailsParams(weakness_id="W1001"),
+         "get_weakness", "W1001", "Test Weakness"),
+        (GetMitigationDetailsTool, GetMitigationDetailsParams(mitigation_id="M1001"),
+         "get_mitigation", "M1001", "Test Mitigation"),
+    ])
+    async def test_successful_retrieval(self, tool_class, params, method, item_id, item_name,
+                                        mock_solve_it_environment):
+        """Test successful details retrieval."""
+        tool = tool_class()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        
+        result = await tool.invoke(params)
+        
+        # Validate JSON response
+        data = validate_json_response(result)
+        
+        assert (data['id'], data['name']) == (item_id, item_name)
+        assert 'description' in data
+        
+        # Verify knowledge base method was called correctly
+        getattr(tool.knowledge_base, method).assert_called_once_with(item_id)
     
-    @pytest.mark.asyncio
-    async def test_mitigation_not_found(self, mock_solve_it_environment):
-        """Test handling of mitigation not found."""
-        with patch.object(GetMitigationDetailsTool, '_resolve_data_path'), \
-             patch.object(GetMitigationDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetMitigationDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_mitigation.return_value = None
-            
-            params = GetMitigationDetailsParams(mitigation_id="M9999")
-            result = await tool.invoke(params)
-            
-            assert "M9999 not found" in result
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params, method, expected", [
+        (GetTechniqueDetailsTool, GetTechniqueDetailsParams(technique_id="T9999"),
+         "get_technique", "T9999 not found"),
+        (GetWeaknessDetailsTool, GetWeaknessDetailsParams(weakness_id="W9999"),
+         "get_weakness", "W9999 not found"),
+        (GetMitigationDetailsTool, GetMitigationDetailsParams(mitigation_id="M9999"),
+         "get_mitigation", "M9999 not found"),
+    ])
+    async def test_not_found(self, tool_class, params, method, expected):
+        """Test handling of an unknown ID."""
+        tool = tool_class()
+        tool.knowledge_base = Mock(spec=[method], **{f"{method}.return_value": None})
+        
+        result = await tool.invoke(params)
+        
+        assert expected in result
     
-    @pytest.mark.asyncio
-    async def test_mitigation_error_handling(self, mock_solve_it_environment):
-        """Test error handling in mitigation retrieval."""
-        with patch.object(GetMitigationDetailsTool, '_resolve_data_path'), \
-             patch.object(GetMitigationDetailsTool, '_init_knowledge_base'):
-            
-            tool = GetMitigationDetailsTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_mitigation.side_effect = Exception("Mitigation error")
-            
-            params = GetMitigationDetailsParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params, method", [
+        (GetTechniqueDetailsTool, GetTechniqueDetailsParams(technique_id="T1001"), "get_technique"),
+        (GetWeaknessDetailsTool, GetWeaknessDetailsParams(weakness_id="W1001"), "get_weakness"),
+        (GetMitigationDetailsTool, GetMitigationDetailsParams(mitigation_id="M1001"), "get_mitigation"),
+    ])
+    async def test_error_handling(self, tool_class, params, method):
+        """Test that a knowledge base failure becomes an error response."""
+        tool = tool_class()
+        tool.knowledge_base = failing_knowledge_base(method)
+        
+        result = await tool.invoke(params)
+        
+        assert_error_response(result, "error")
@@ -1,8 +1,5 @@
 """Unit tests for relationship query tools."""
 
-import json
-from unittest.mock import patch, MagicMock
-
 import pytest
 
 from solveit_mcp_server.tools.solveit_tools import (
@@ -17,336 +14,130 @@ from solveit_mcp_server.tools.solveit_tools import (
     GetTechniquesForMitigationTool,
     GetTechniquesForMitigationParams,
 )
-from conftest import validate_json_response, assert_error_response
-
+from conftest import validate_json_response, assert_error_response, failing_knowledge_base
 
-class TestGetWeaknessesForTechniqueTool:
-    """Test GetWeaknessesForTechniqueTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetWeaknessesForTechniqueTool()
-        
-        assert tool.name == "get_weaknesses_for_technique"
-        assert "weaknesses associated with" in tool.description.lower()
-        assert tool.Params == GetWeaknessesForTechniqueParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_weaknesses_retrieval(self, mock_solve_it_environment):
-        """Test successful weaknesses for technique retrieval."""
-        with patch.object(GetWeaknessesForTechniqueTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForTechniqueTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessesForTechniqueTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetWeaknessesForTechniqueParams(technique_id="T1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) > 0
-            assert data[0]['id'] == "W1001"
-            assert data[0]['name'] == "Test Weakness"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_weaknesses_for_technique.assert_called_once_with("T1001")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in weaknesses retrieval."""
-        with patch.object(GetWeaknessesForTechniqueTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForTechniqueTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessesForTechniqueTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_weaknesses_for_technique.side_effect = Exception("Test error")
-            
-            params = GetWeaknessesForTechniqueParams(technique_id="T1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+pytestmark = pytest.mark.usefixtures("stub_tool_init")
 
 
-class TestGetMitigationsForWeaknessTool:
-    """Test GetMitigationsForWeaknessTool functionality."""
-    
-    def test_tool_metadata(self):
+class TestRelationshipTools:
+    """Checks shared by the five relationship query tools."""
+    
+    @pytest.mark.parametrize("tool_class, name, description_term, params_class", [
+        (GetWeaknessesForTechniqueTool, "get_weaknesses_for_technique",
+         "weaknesses associated with", GetWeaknessesForTechniqueParams),
+        (GetMitigationsForWeaknessTool, "get_mitigations_for_weakness",
+         "mitigations associated with", GetMitigationsForWeaknessParams),
+        (GetTechniquesForWeaknessTool, "get_techniques_for_weakness",
+         "techniques that reference", GetTechniquesForWeaknessParams),
+        (GetWeaknessesForMitigationTool, "get_weaknesses_for_mitigation",
+         "weaknesses that reference", GetWeaknessesForMitigationParams),
+        (GetTechniquesForMitigationTool, "get_techniques_for_mitigation",
+         "techniques that reference", GetTechniquesForMitigationParams),
+    ])
+    def test_tool_metadata(self, tool_class, name, description_term, params_class, shared_tools):
         """Test tool metadata is correct."""
-        tool = GetMitigationsForWeaknessTool()
+        tool = shared_tools[tool_class]
         
-        assert tool.name == "get_mitigations_for_weakness"
-        assert "mitigations associated with" in tool.description.lower()
-        assert tool.Params == GetMitigationsForWeaknessParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_mitigations_retrieval(self, mock_solve_it_environment):
-        """Test successful mitigations for weakness retrieval."""
-        with patch.object(GetMitigationsForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetMitigationsForWeaknessTool, '_init_knowledge_base'):
-            
-            tool = GetMitigationsForWeaknessTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetMitigationsForWeaknessParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) > 0
-            assert data[0]['id'] == "M1001"
-            assert data[0]['name'] == "Test Mitigation"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_mitigations_for_weakness.assert_called_once_with("W1001")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in mitigations retrieval."""
-        with patch.object(GetMitigationsForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetMitigationsForWeaknessTool, '_init_knowledge_base'):
-            
-            tool = GetMitigationsForWeaknessTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_mitigations_for_weakness.side_effect = Exception("Test error")
-            
-            params = GetMitigationsForWeaknessParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetTechniquesForWeaknessTool:
-    """Test GetTechniquesForWeaknessTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetTechniquesForWeaknessTool()
+        assert tool.name == name
+        assert description_term in tool.description.lower()
+        assert tool.Params == params_class
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params, method, query_id, item_id, item_name", [
+        (GetWeaknessesForTechniqueTool, GetWeaknessesForTechniqueParams(technique_id="T1001"),
+         "get_weaknesses_for_technique", "T1001", "W1001", "Test Weakness"),
+        (GetMitigationsForWeaknessTool, GetMitigationsForWeaknessParams(weakness_id="W1001"),
+         "get_mitigations_for_weakness", "W1001", "M1001", "Test Mitigation"),
+        (GetTechniquesForWeaknessTool, GetTechniquesForWeaknessParams(weakness_id="W1001"),
+         "get_techniques_for_weakness", "W1001", "T1001", "Test Technique"),
+        (GetWeaknessesForMitigationTool, GetWeaknessesForMitigationParams(mitigation_id="M1001"),
+         "get_weaknesses_for_mitigation", "M1001", "W1001", "Test Weakness"),
+        (GetTechniquesForMitigationTool, GetTechniquesForMitigationParams(mitigation_id="M1001"),
+         "get_techniques_for_mitigation", "M1001", "T1001", "Test Technique"),
+    ])
+    async def test_successful_retrieval(self, tool_class, params, method, query_id,
+                                        item_id, item_name, mock_solve_it_environment):
+        """Test successful retrieval of related items."""
+        tool = tool_class()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
         
-        assert tool.name == "get_techniques_for_weakness"
-        assert "techniques that reference" in tool.description.lower()
-        assert tool.Params == GetTechniquesForWeaknessParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_techniques_retrieval(self, mock_solve_it_environment):
-        """Test successful techniques for weakness retrieval."""
-        with patch.object(GetTechniquesForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForWeaknessTool, '_init_knowledge_base'):
-            
-            tool = GetTechniquesForWeaknessTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetTechniquesForWeaknessParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) > 0
-            assert data[0]['id'] == "T1001"
-            assert data[0]['name'] == "Test Technique"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_techniques_for_weakness.assert_called_once_with("W1001")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in techniques retrieval."""
-        with patch.object(GetTechniquesForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForWeaknessTool, '_init_knowledge_base'):
-            
-            tool = GetTechniquesForWeaknessTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_techniques_for_weakness.side_effect = Exception("Test error")
-            
-            params = GetTechniquesForWeaknessParams(weakness_id="W1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetWeaknessesForMitigationTool:
-    """Test GetWeaknessesForMitigationTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetWeaknessesForMitigationTool()
+        result = await tool.invoke(params)
         
-        assert tool.name == "get_weaknesses_for_mitigation"
-        assert "weaknesses that reference" in tool.description.lower()
-        assert tool.Params == GetWeaknessesForMitigationParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_weaknesses_retrieval(self, mock_solve_it_environment):
-        """Test successful weaknesses for mitigation retrieval."""
-        with patch.object(GetWeaknessesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForMitigationTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessesForMitigationTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetWeaknessesForMitigationParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) > 0
-            assert data[0]['id'] == "W1001"
-            assert data[0]['name'] == "Test Weakness"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_weaknesses_for_mitigation.assert_called_once_with("M1001")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in weaknesses retrieval."""
-        with patch.object(GetWeaknessesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForMitigationTool, '_init_knowledge_base'):
-            
-            tool = GetWeaknessesForMitigationTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_weaknesses_for_mitigation.side_effect = Exception("Test error")
-            
-            params = GetWeaknessesForMitigationParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
-
-
-class TestGetTechniquesForMitigationTool:
-    """Test GetTechniquesForMitigationTool functionality."""
-    
-    def test_tool_metadata(self):
-        """Test tool metadata is correct."""
-        tool = GetTechniquesForMitigationTool()
+        # Validate JSON response
+        data = validate_json_response(result)
         
-        assert tool.name == "get_techniques_for_mitigation"
-        assert "techniques that reference" in tool.description.lower()
-        assert tool.Params == GetTechniquesForMitigationParams
-    
-    @pytest.mark.asyncio
-    async def test_successful_techniques_retrieval(self, mock_solve_it_environment):
-        """Test successful techniques for mitigation retrieval."""
-        with patch.object(GetTechniquesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForMitigationTool, '_init_knowledge_base'):
-            
-            tool = GetTechniquesForMitigationTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetTechniquesForMitigationParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            # Validate JSON response
-            data = validate_json_response(result)
-            
-            assert isinstance(data, list)
-            assert len(data) > 0
-            assert data[0]['id'] == "T1001"
-            assert data[0]['name'] == "Test Technique"
-            
-            # Verify knowledge base method was called correctly
-            tool.knowledge_base.get_techniques_for_mitigation.assert_called_once_with("M1001")
-    
-    @pytest.mark.asyncio
-    async def test_error_handling(self, mock_solve_it_environment):
-        """Test error handling in techniques retrieval."""
-        with patch.object(GetTechniquesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForMitigationTool, '_init_knowledge_base'):
-            
-            tool = GetTechniquesForMitigationTool()
-            tool.knowledge_base = MagicMock()
-            tool.knowledge_base.get_techniques_for_mitigation.side_effect = Exception("Test error")
-            
-            params = GetTechniquesForMitigationParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            assert_error_response(result, "error")
+        assert isinstance(data, list)
+        assert len(data) > 0
+        assert (data[0]['id'], data[0]['name']) == (item_id, item_name)
+        
+        # Verify knowledge base method was called correctly
+        getattr(tool.knowledge_base, method).assert_called_once_with(query_id)
+    
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("tool_class, params, method", [
+        (GetWeaknessesForTechniqueTool, GetWeaknessesForTechniqueParams(technique_id="T1001"),
+         "get_weaknesses_for_technique"),
+        (GetMitigationsForWeaknessTool, GetMitigationsForWeaknessParams(weakness_id="W1001"),
+         "get_mitigations_for_weakness"),
+        (GetTechniquesForWeaknessTool, GetTechniquesForWeaknessParams(weakness_id="W1001"),
+         "get_techniques_for_weakness"),
+        (GetWeaknessesForMitigationTool, GetWeaknessesForMitigationParams(mitigation_id="M1001"),
+         "get_weaknesses_for_mitigation"),
+        (GetTechniquesForMitigationTool, GetTechniquesForMitigationParams(mitigation_id="M1001"),
+         "get_techniques_for_mitigation"),
+    ])
+    async def test_error_handling(self, tool_class, params, method):
+        """Test that a knowledge base failure becomes an error response."""
+        tool = tool_class()
+        tool.knowledge_base = failing_knowledge_base(method)
+        
+        result = await tool.invoke(params)
+        
+        assert_error_response(result, "error")
 
 
 class TestRelationshipToolsIntegration:
     """Test integration between relationship tools."""
     
-    @pytest.mark.asyncio
-    async def test_forward_relationship_chain(self, mock_solve_it_environment):
-        """Test forward relationship chain: technique -> weakness -> mitigation."""
-        # Test technique -> weakness
-        with patch.object(GetWeaknessesForTechniqueTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForTechniqueTool, '_init_knowledge_base'):
-            
-            tool1 = GetWeaknessesForTechniqueTool()
-            tool1.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params1 = GetWeaknessesForTechniqueParams(technique_id="T1001")
-            result1 = await tool1.invoke(params1)
-            
-            weaknesses = validate_json_response(result1)
-            assert len(weaknesses) > 0
-            weakness_id = weaknesses[0]['id']
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("first_tool, first_params, second_tool, second_params, expected_id", [
+        # Forward chain: technique -> weakness -> mitigation
+        (GetWeaknessesForTechniqueTool, GetWeaknessesForTechniqueParams(technique_id="T1001"),
+         GetMitigationsForWeaknessTool, GetMitigationsForWeaknessParams, "M1001"),
+        # Reverse chain: mitigation -> weakness -> technique
+        (GetWeaknessesForMitigationTool, GetWeaknessesForMitigationParams(mitigation_id="M1001"),
+         GetTechniquesForWeaknessTool, GetTechniquesForWeaknessParams, "T1001"),
+    ], ids=["forward", "reverse"])
+    async def test_relationship_chain(self, first_tool, first_params, second_tool, second_params,
+                                      expected_id, mock_solve_it_environment):
+        """Test following a relationship chain through an intermediate weakness."""
+        knowledge_base = mock_solve_it_environment.knowledge_base
         
-        # Test weakness -> mitigation
-        with patch.object(GetMitigationsForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetMitigationsForWeaknessTool, '_init_knowledge_base'):
-            
-            tool2 = GetMitigationsForWeaknessTool()
-            tool2.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params2 = GetMitigationsForWeaknessParams(weakness_id=weakness_id)
-            result2 = await tool2.invoke(params2)
-            
-            mitigations = validate_json_response(result2)
-            assert len(mitigations) > 0
-            assert mitigations[0]['id'] == "M1001"
-    
-    @pytest.mark.asyncio
-    async def test_reverse_relationship_chain(self, mock_solve_it_environment):
-        """Test reverse relationship chain: mitigation -> weakness -> technique."""
-        # Test mitigation -> weakness
-        with patch.object(GetWeaknessesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetWeaknessesForMitigationTool, '_init_knowledge_base'):
-            
-            tool1 = GetWeaknessesForMitigationTool()
-            tool1.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params1 = GetWeaknessesForMitigationParams(mitigation_id="M1001")
-            result1 = await tool1.invoke(params1)
-            
-            weaknesses = validate_json_response(result1)
-            assert len(weaknesses) > 0
-            weakness_id = weaknesses[0]['id']
+        # Look up the weaknesses linked to the starting item
+        tool1 = first_tool()
+        tool1.knowledge_base = knowledge_base
+        
+        weaknesses = validate_json_response(await tool1.invoke(first_params))
+        assert len(weaknesses) > 0
+        weakness_id = weaknesses[0]['id']
         
-        # Test weakness -> technique
-        with patch.object(GetTechniquesForWeaknessTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForWeaknessTool, '_init_knowledge_base'):
-            
-            tool2 = GetTechniquesForWeaknessTool()
-            tool2.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params2 = GetTechniquesForWeaknessParams(weakness_id=weakness_id)
-            result2 = await tool2.invoke(params2)
-            
-            techniques = validate_json_response(result2)
-            assert len(techniques) > 0
-            assert techniques[0]['id'] == "T1001"
+        # Follow the first weakness to the other side of the chain
+        tool2 = second_tool()
+        tool2.knowledge_base = knowledge_base
+        
+        items = validate_json_response(await tool2.invoke(second_params(weakness_id=weakness_id)))
+        assert len(items) > 0
+        assert items[0]['id'] == expected_id
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_direct_mitigation_to_technique_lookup(self, mock_solve_it_environment):
         """Test direct mitigation to technique lookup."""
-        with patch.object(GetTechniquesForMitigationTool, '_resolve_data_path'), \
-             patch.object(GetTechniquesForMitigationTool, '_init_knowledge_base'):
-            
-            tool = GetTechniquesForMitigationTool()
-            tool.knowledge_base = mock_solve_it_environment['knowledge_base']
-            
-            params = GetTechniquesForMitigationParams(mitigation_id="M1001")
-            result = await tool.invoke(params)
-            
-            techniques = validate_json_response(result)
-            assert len(techniques) > 0
-            assert techniques[0]['id'] == "T1001"
+        tool = GetTechniquesForMitigationTool()
+        tool.knowledge_base = mock_solve_it_environment.knowledge_base
+        
+        params = GetTechniquesForMitigationParams(mitigation_id="M1001")
+        result = await tool.invoke(params)
+        
+        techniques = validate_json_response(result)
+        assert len(techniques) > 0
+        assert techniques[0]['id'] == "T1001"
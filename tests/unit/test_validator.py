@@ -0,0 +1,111 @@
+"""Unit tests for the request argument walker."""
+
+import math
+
+import pytest
+
+from solveit_mcp_server.utils.validator import (
+    CONTAINER_OVERHEAD,
+    KEY_OVERHEAD,
+    SCALAR_OVERHEAD,
+    STR_OVERHEAD,
+    ValidationViolation,
+    format_path,
+    walk,
+)
+
+
+class _Str(str):
+    """A str subclass, which the walker must treat like str."""
+
+
+class TestFormatPath:
+    """Test rendering of violation paths."""
+
+    @pytest.mark.parametrize("stack, expected", [
+        ([], ""),
+        (["a"], "a"),
+        (["a", "b", 0, "c"], "a.b[0].c"),
+        ([0, 1], "[0][1]"),
+        ([2, "name"], "[2].name"),
+    ])
+    def test_format_path(self, stack, expected):
+        """Test that keys are dotted and list indices are bracketed."""
+        assert format_path(stack) == expected
+
+
+class TestWalk:
+    """Test validation and size estimation in walk()."""
+
+    def test_size_estimate(self):
+        """Test that the estimate adds up string, key, scalar and container overheads."""
+        size = walk({"key": ["ab", 1, None]}, max_str=100, max_in=math.inf)
+
+        assert size == (
+            2 * CONTAINER_OVERHEAD
+            + len("key") + KEY_OVERHEAD
+            + len("ab") + STR_OVERHEAD
+            + 2 * SCALAR_OVERHEAD
+        )
+
+    def test_deeply_nested_arguments(self):
+        """Test that nesting far beyond the recursion limit is walked iteratively."""
+        obj = "leaf"
+        for _ in range(5000):
+            obj = {"k": [obj]}
+
+        size = walk(obj, max_str=100, max_in=math.inf)
+
+        assert size == 5000 * (2 * CONTAINER_OVERHEAD + len("k") + KEY_OVERHEAD) + 6
+
+    def test_string_at_limit_is_accepted(self):
+        """Test that a string exactly max_str long passes."""
+        assert walk("x" * 10, max_str=10, max_in=math.inf) == 10 + STR_OVERHEAD
+
+    def test_string_over_limit_reports_path_and_length(self):
+        """Test that an over-long nested string names where it was found."""
+        obj = {"a": {"b": [0, {"c": "x" * 11}]}}
+
+        with pytest.raises(ValidationViolation) as exc_info:
+            walk(obj, max_str=10, max_in=math.inf)
+
+        violation = exc_info.value
+        assert violation.kind == "string_length"
+        assert violation.path == "a.b[1].c"
+        assert violation.size == 11
+
+    def test_str_subclass_is_checked_as_str(self):
+        """Test that string limits also apply to str subclasses."""
+        with pytest.raises(ValidationViolation) as exc_info:
+            walk([_Str("x" * 11)], max_str=10, max_in=math.inf)
+
+        assert exc_info.value.kind == "string_length"
+        assert exc_info.value.path == "[0]"
+
+    def test_dangerous_type_reports_path_and_type(self):
+        """Test that a non-JSON value is rejected with its type name."""
+        with pytest.raises(ValidationViolation) as exc_info:
+            walk({"items": [1, {"blob": b"raw"}]}, max_str=100, max_in=math.inf)
+
+        violation = exc_info.value
+        assert violation.kind == "dangerous_type"
+        assert violation.path == "items[1].blob"
+        assert violation.type_name == "bytes"
+
+    def test_non_string_keys_are_rendered_as_keys(self):
+        """Test that an int dict key is not mistaken for a list index."""
+        with pytest.raises(ValidationViolation) as exc_info:
+            walk({1: {"v": object()}}, max_str=100, max_in=math.inf)
+
+        assert exc_info.value.path == "1.v"
+
+    def test_input_size_limit_stops_the_walk(self):
+        """Test that the walk aborts once the running estimate passes max_in."""
+        obj = ["x" * 10] * 100
+
+        with pytest.raises(ValidationViolation) as exc_info:
+            walk(obj, max_str=100, max_in=50)
+
+        violation = exc_info.value
+        assert violation.kind == "input_size"
+        assert 50 < violation.size <= 50 + 10 + STR_OVERHEAD